@@ -0,0 +1,67 @@
+# benchmarks/bench_conflicts.py
+#
+# Conflict detection over 50k events (fetch_calendar_state style: time + duration):
+#   index build  - parse every event once and sort (ConflictIndex)
+#   all pairs    - sweep line over the index vs. comparing every pair (sampled)
+#   proposed     - conflicts for one proposed event: bisect over a prebuilt index vs.
+#                  conflicts_with, a linear scan that parses each event per query
+#                  (what detect_conflicts does; cheaper than building an index for one query)
+# Run from the repo root:  python -m benchmarks.bench_conflicts
+
+import datetime
+import random
+import time
+
+from hushh_mcp.agents.cal_adk.operons.conflict_engine import ConflictIndex, conflicts_with, overlaps, parse_event
+
+EVENTS = 50_000
+QUERIES = 2_000
+SCAN_QUERIES = 20
+START = datetime.datetime(2025, 1, 1)
+
+
+def _events(rng: random.Random) -> list:
+    return [
+        {
+            "event": f"event {i}",
+            "time": (START + datetime.timedelta(minutes=15 * rng.randrange(0, 365 * 24 * 4))).isoformat(),
+            "duration": rng.choice(["15m", "30m", "45m", "1h", "90m", "2h"]),
+        }
+        for i in range(EVENTS)
+    ]
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    rng = random.Random(5)
+    events = _events(rng)
+    proposals = [dict(rng.choice(events), duration="1h") for _ in range(QUERIES)]
+
+    index, build_s = _timed(lambda: ConflictIndex(events))
+    pairs, sweep_s = _timed(index.all_overlaps)
+    print(f"{EVENTS:,} events")
+    print(f"  index build           {build_s * 1000:10.1f} ms")
+    print(f"  all pairs (sweep)     {sweep_s * 1000:10.1f} ms   {len(pairs):,} overlapping pairs")
+
+    # Every pair would be ~1.25e9 comparisons; time a sample of rows and extrapolate
+    intervals = [parse_event(event) for event in events]
+    rows = 200
+    _, sample_s = _timed(lambda: [
+        sum(1 for other in intervals[i + 1:] if overlaps(intervals[i], other)) for i in range(rows)
+    ])
+    print(f"  all pairs (nested)    {sample_s / rows * EVENTS / 2 * 1000:10.0f} ms   (extrapolated)")
+
+    _, bisect_s = _timed(lambda: [index.conflicts_for_event(proposed) for proposed in proposals])
+    _, scan_s = _timed(lambda: [conflicts_with(events, proposed) for proposed in proposals[:SCAN_QUERIES]])
+    assert sorted(map(id, index.conflicts_for_event(proposals[0]))) == sorted(map(id, conflicts_with(events, proposals[0])))
+    print(f"  proposed (bisect)     {QUERIES / bisect_s:10,.0f} queries/s")
+    print(f"  proposed (scan)       {SCAN_QUERIES / scan_s:10,.1f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
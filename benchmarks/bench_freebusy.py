@@ -0,0 +1,98 @@
+# benchmarks/bench_freebusy.py
+#
+# Free-slot queries over large local calendars (a year of events each, 3 calendars
+# queried together, one working week per query):
+#   scan      - parse and filter every event per query, then merge (no index)
+#   timeline  - freebusy_engine: BusyTimelines built once, bisect + merge per query
+# Also reports the one-off cost of building the timelines.
+# Run from the repo root:  python -m benchmarks.bench_freebusy
+
+import datetime
+import random
+import time
+
+from hushh_mcp.operons.freebusy_engine import (
+    BusyTimeline,
+    event_interval,
+    free_intervals,
+    merge_intervals,
+    parse_working_hours,
+    working_windows
+)
+
+EVENT_COUNTS = [10_000, 50_000]
+CALENDARS = 3
+QUERIES = 200
+WORKING_HOURS = parse_working_hours("09:00-17:00")
+MIN_SLOT_S = 30 * 60
+YEAR_START = datetime.datetime(2025, 1, 6, tzinfo=datetime.timezone.utc)  # a Monday
+WEEK_S = 7 * 24 * 3600
+
+
+def _calendar(count: int, rng: random.Random) -> list:
+    events = []
+    for i in range(count):
+        start = YEAR_START + datetime.timedelta(minutes=rng.randrange(0, 365 * 24 * 4) * 15)
+        end = start + datetime.timedelta(minutes=rng.choice([15, 30, 45, 60, 90, 120]))
+        events.append({
+            "id": f"evt{i}",
+            "status": "confirmed",
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": end.isoformat()},
+        })
+    return events
+
+
+def _scan(calendars, start, end):
+    busy = []
+    for events in calendars:
+        for event in events:
+            interval = event_interval(event)
+            if interval is not None and interval[0] < end and interval[1] > start:
+                busy.append(interval)
+    merged = merge_intervals(busy)
+    free = []
+    for window_start, window_end in working_windows(start, end, WORKING_HOURS):
+        cursor = window_start
+        for busy_start, busy_end in merged:
+            if busy_end <= window_start or busy_start >= window_end:
+                continue
+            if busy_start - cursor >= MIN_SLOT_S:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if window_end - cursor >= MIN_SLOT_S:
+            free.append((cursor, window_end))
+    return free
+
+
+def _rate(fn, weeks) -> float:
+    start = time.perf_counter()
+    for week in weeks:
+        fn(week, week + WEEK_S)
+    return len(weeks) / (time.perf_counter() - start)
+
+
+def main():
+    rng = random.Random(7)
+    base = int(YEAR_START.timestamp())
+    print(f"{'events/cal':>10} {'build ms':>9} {'scan q/s':>9} {'timeline q/s':>13} {'speedup':>8}")
+    for count in EVENT_COUNTS:
+        calendars = [_calendar(count, rng) for _ in range(CALENDARS)]
+        weeks = [base + rng.randrange(0, 50) * WEEK_S for _ in range(QUERIES)]
+
+        started = time.perf_counter()
+        timelines = [BusyTimeline.from_events(events) for events in calendars]
+        build_ms = (time.perf_counter() - started) * 1000
+
+        # Same answers either way
+        assert _scan(calendars, weeks[0], weeks[0] + WEEK_S) == free_intervals(
+            timelines, weeks[0], weeks[0] + WEEK_S, WORKING_HOURS, MIN_SLOT_S
+        )
+
+        scan = _rate(lambda s, e: _scan(calendars, s, e), weeks[:max(5, QUERIES // 40)])
+        indexed = _rate(lambda s, e: free_intervals(timelines, s, e, WORKING_HOURS, MIN_SLOT_S), weeks)
+        print(f"{count:>10,} {build_ms:>9.1f} {scan:>9.1f} {indexed:>13,.0f} {indexed / scan:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_mcp_client.py
+#
+# Requests per second against a local stub MCP server for:
+#   bare    - requests.post per call (the pre-MCPClient adapter: new TCP connection each time)
+#   pooled  - MCPClient, one keep-alive session
+#   async   - AsyncMCPClient, CONCURRENCY requests in flight
+# Sync clients are measured sequentially and from CONCURRENCY threads.
+# Run from the repo root:  python -m benchmarks.bench_mcp_client
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from hushh_mcp.operons.mcp_client import AsyncMCPClient, MCPClient
+from tests.mcp_stub import StubMCPServer
+
+REQUESTS = 2000
+CONCURRENCY = 16
+USER_ID = "user_bench"
+TOKEN = "HCT:bench"
+
+
+def _bare_call(base_url: str):
+    resp = requests.post(f"{base_url}/list-events", json={"user_id": USER_ID, "consent_token": TOKEN})
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _rate_sequential(fn) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        fn()
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def _rate_threaded(fn) -> float:
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        list(pool.map(lambda _: fn(), range(CONCURRENCY)))
+        start = time.perf_counter()
+        list(pool.map(lambda _: fn(), range(REQUESTS)))
+        return REQUESTS / (time.perf_counter() - start)
+
+
+def _rate_async(base_url: str) -> float:
+    async def run():
+        async with AsyncMCPClient(base_url, pool_maxsize=CONCURRENCY) as client:
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+
+            async def one():
+                async with semaphore:
+                    await client.list_events(USER_ID, TOKEN)
+
+            await one()
+            start = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(REQUESTS)))
+            return REQUESTS / (time.perf_counter() - start)
+
+    return asyncio.run(run())
+
+
+def main():
+    with StubMCPServer() as server:
+        client = MCPClient(server.url, pool_maxsize=CONCURRENCY)
+        pooled = lambda: client.list_events(USER_ID, TOKEN)
+        bare = lambda: _bare_call(server.url)
+
+        print(f"{'client':>8} {'sequential req/s':>17} {f'{CONCURRENCY} threads req/s':>18}")
+        print(f"{'bare':>8} {_rate_sequential(bare):>17,.0f} {_rate_threaded(bare):>18,.0f}")
+        print(f"{'pooled':>8} {_rate_sequential(pooled):>17,.0f} {_rate_threaded(pooled):>18,.0f}")
+        print(f"{'async':>8} {'':>17} {_rate_async(server.url):>18,.0f}")
+        print(f"\nTCP connections accepted by the stub: {server.connections:,}")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_memory_codec.py
+#
+# Save + load round-trip time and stored (encrypted) size of calendar agent memory
+# for realistic list_events payloads, per serialization format:
+#   legacy   - str() / eval(), the pre-codec path
+#   <codec>[+<compression>] - vault.codec formats
+# Run from the repo root:  python -m benchmarks.bench_memory_codec
+
+import time
+
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.vault.codec import encode_value, decode_value
+from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data, encrypt_raw, decrypt_raw
+
+EVENT_COUNTS = [10, 250, 2500]
+FORMATS = [("json", "none"), ("orjson", "none"), ("msgpack", "none"), ("orjson", "zstd"), ("msgpack", "zstd"), ("orjson", "zlib")]
+TARGET_SECONDS = 0.3
+
+
+def _events(count: int) -> dict:
+    # Shaped like a Google Calendar events.list response
+    return {
+        "kind": "calendar#events",
+        "summary": "alice@hushh.ai",
+        "timeZone": "Asia/Kolkata",
+        "items": [
+            {
+                "kind": "calendar#event",
+                "id": f"7h3k2l{i:06d}q0v9",
+                "status": "confirmed",
+                "htmlLink": f"https://www.google.com/calendar/event?eid=N2gzazJs{i:06d}",
+                "created": "2025-07-01T09:12:44.000Z",
+                "updated": "2025-07-20T11:03:10.512Z",
+                "summary": ["Team sync", "1:1 with Priya", "Design review", "Focus block"][i % 4],
+                "description": "Weekly sync on roadmap, blockers and hiring.",
+                "location": "Conference Room B",
+                "creator": {"email": "alice@hushh.ai", "self": True},
+                "organizer": {"email": "alice@hushh.ai", "self": True},
+                "start": {"dateTime": f"2025-07-{1 + i % 28:02d}T10:00:00+05:30", "timeZone": "Asia/Kolkata"},
+                "end": {"dateTime": f"2025-07-{1 + i % 28:02d}T10:30:00+05:30", "timeZone": "Asia/Kolkata"},
+                "attendees": [
+                    {"email": f"member{j}@hushh.ai", "responseStatus": "accepted"} for j in range(i % 5)
+                ],
+                "reminders": {"useDefault": True},
+                "eventType": "default",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _rate(fn) -> float:
+    fn()  # warm-up
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < TARGET_SECONDS:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def _legacy(value):
+    payload = encrypt_data(str(value), VAULT_ENCRYPTION_KEY)
+    return payload, lambda: eval(decrypt_data(payload, VAULT_ENCRYPTION_KEY))
+
+
+def _codec(value, codec, compression):
+    tag, data = encode_value(value, codec=codec, compression=compression)
+    payload = encrypt_raw(data, VAULT_ENCRYPTION_KEY)
+    return payload, lambda: decode_value(decrypt_raw(payload, VAULT_ENCRYPTION_KEY), tag)
+
+
+def main():
+    for count in EVENT_COUNTS:
+        value = _events(count)
+        print(f"\n{count} events")
+        print(f"{'format':>14} {'round-trip ms':>14} {'stored bytes':>13}")
+
+        rate = _rate(lambda: _legacy(value)[1]())
+        payload, _ = _legacy(value)
+        print(f"{'legacy':>14} {1000 / rate:>14.3f} {len(payload.ciphertext):>13,}")
+
+        for codec, compression in FORMATS:
+            rate = _rate(lambda: _codec(value, codec, compression)[1]())
+            payload, _ = _codec(value, codec, compression)
+            name = codec if compression == "none" else f"{codec}+{compression}"
+            print(f"{name:>14} {1000 / rate:>14.3f} {len(payload.ciphertext):>13,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_schedule_scorer.py
+#
+# Suggestions per second from the local scheduler (schedule_scorer.rank_slots) for a
+# busy working week, by meeting length and preference set. Each suggestion starts from
+# the raw user_preferences dict, as suggest_optimal_schedule does.
+# Run from the repo root:  python -m benchmarks.bench_schedule_scorer
+
+import datetime
+import random
+import time
+
+from hushh_mcp.operons.freebusy_engine import BusyTimeline, free_intervals, parse_working_hours
+from hushh_mcp.operons.schedule_scorer import SchedulePreferences, rank_slots
+
+TARGET_SECONDS = 0.5
+WEEK_START = datetime.datetime(2025, 7, 28, tzinfo=datetime.timezone.utc)  # a Monday
+PREFERENCE_SETS = {
+    "duration only": {},
+    "preferred": {"preferred_hours": "10:00-12:00"},
+    "all constraints": {
+        "preferred_hours": ["10:00-12:00", "14:00-16:00"],
+        "focus_blocks": ["09:00-10:30"],
+        "do_not_disturb": "12:30-13:30",
+        "buffer_minutes": 15,
+    },
+}
+DURATIONS = ["30m", "1h", "2h"]
+
+
+def _busy_week(rng: random.Random) -> BusyTimeline:
+    intervals = []
+    for day in range(5):
+        for _ in range(8):
+            start = WEEK_START + datetime.timedelta(days=day, hours=9, minutes=15 * rng.randrange(0, 32))
+            intervals.append((int(start.timestamp()), int(start.timestamp()) + 60 * rng.choice([15, 30, 45, 60])))
+    return BusyTimeline(intervals)
+
+
+def main():
+    start = int(WEEK_START.timestamp())
+    end = start + 7 * 24 * 3600
+    timeline = _busy_week(random.Random(3))
+    free = free_intervals([timeline], start, end, parse_working_hours("09:00-17:00"), 15 * 60)
+    print(f"{len(free)} free slots in the week\n")
+    print(f"{'preferences':>16} {'duration':>9} {'suggestions/s':>14} {'ms each':>8}")
+    for name, extra in PREFERENCE_SETS.items():
+        for duration in DURATIONS:
+            preferences = {"duration": duration, **extra}
+            count, started = 0, time.perf_counter()
+            while time.perf_counter() - started < TARGET_SECONDS:
+                rank_slots(free, SchedulePreferences(preferences), start, end)
+                count += 1
+            rate = count / (time.perf_counter() - started)
+            print(f"{name:>16} {duration:>9} {rate:>14,.0f} {1000 / rate:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_token_batch.py
+#
+# Compares validate_tokens()/issue_tokens() against a loop of single calls.
+# Run from the repo root:  python -m benchmarks.bench_token_batch
+
+import time
+
+from hushh_mcp.consent.token import (
+    issue_token,
+    issue_tokens,
+    validate_token,
+    validate_tokens,
+    clear_token_cache
+)
+from hushh_mcp.constants import ConsentScope
+
+N_TOKENS = 5000
+ROUNDS = 5
+AGENT_ID = "agent_gateway"
+SCOPE = ConsentScope.AGENT_GCAL_READ
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        clear_token_cache()  # measure cold verification, not cache hits
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    grants = [(f"user_{i}", AGENT_ID, SCOPE) for i in range(N_TOKENS)]
+
+    issue_loop = _best_of(lambda: [issue_token(u, a, s) for u, a, s in grants])
+    issue_batch = _best_of(lambda: issue_tokens(grants))
+
+    token_strs = [t.token for t in issue_tokens(grants)]
+    validate_loop = _best_of(lambda: [validate_token(t, SCOPE) for t in token_strs])
+    validate_batch = _best_of(lambda: validate_tokens(token_strs, SCOPE))
+
+    print(f"{N_TOKENS} tokens, best of {ROUNDS} rounds")
+    for label, single, batch in (
+        ("issue", issue_loop, issue_batch),
+        ("validate", validate_loop, validate_batch),
+    ):
+        print(
+            f"  {label:<9} loop {N_TOKENS / single:>10,.0f}/s   "
+            f"batch {N_TOKENS / batch:>10,.0f}/s   ({single / batch:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_token_formats.py
+#
+# Token size, round-trip (issue + validate) and parse throughput for the
+# v1 text format ("HCT:") versus the compact v2 binary format ("HCT2:").
+# Run from the repo root:  python -m benchmarks.bench_token_formats
+
+import base64
+import time
+
+from hushh_mcp.consent import compact
+from hushh_mcp.consent.token import issue_token, validate_token, clear_token_cache
+from hushh_mcp.constants import ConsentScope
+
+N_TOKENS = 5000
+ROUNDS = 5
+AGENT_ID = "calendar_agent"
+SCOPE = ConsentScope.AGENT_GCAL_READ
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        clear_token_cache()  # every validation takes the full parse + HMAC path
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _parse_v1(token_str: str):
+    # The string handling validate_token does before the HMAC, for comparison with compact.decode/unpack
+    _, signed_part = token_str.split(":")
+    encoded = signed_part.split(".")[0]
+    user_id, agent_id, scope, issued_at, expires_at = base64.urlsafe_b64decode(encoded.encode()).decode().split("|")
+    return user_id, agent_id, ConsentScope(scope), int(issued_at), int(expires_at)
+
+
+def _parse_v2(token_str: str):
+    return compact.unpack_body(compact.decode(token_str)[0])
+
+
+def main():
+    users = [f"user_{i:06d}" for i in range(N_TOKENS)]
+    print(f"{N_TOKENS} tokens, best of {ROUNDS} rounds")
+
+    for version, parse in ((1, _parse_v1), (2, _parse_v2)):
+        tokens = [issue_token(u, AGENT_ID, SCOPE, version=version).token for u in users]
+        avg_len = sum(map(len, tokens)) / len(tokens)
+
+        roundtrip = _best_of(lambda: [validate_token(issue_token(u, AGENT_ID, SCOPE, version=version).token, SCOPE) for u in users])
+        validate = _best_of(lambda: [validate_token(t, SCOPE) for t in tokens])
+        parse_only = _best_of(lambda: [parse(t) for t in tokens])
+
+        print(
+            f"  v{version}: {avg_len:6.1f} chars   "
+            f"round-trip {N_TOKENS / roundtrip:>9,.0f}/s   "
+            f"validate {N_TOKENS / validate:>9,.0f}/s   "
+            f"parse {N_TOKENS / parse_only:>10,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
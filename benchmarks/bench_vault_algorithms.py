@@ -0,0 +1,55 @@
+# benchmarks/bench_vault_algorithms.py
+#
+# Encrypt + decrypt throughput (MB/s) of the two vault AEADs across payload sizes,
+# on the raw-bytes VaultCipher path and through the streaming format. Use it to pick
+# VAULT_DEFAULT_ALGORITHM for a host: AES-256-GCM wins with AES-NI, ChaCha20-Poly1305 without.
+# Run from the repo root:  python -m benchmarks.bench_vault_algorithms
+
+import io
+import time
+
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.vault.encrypt import AEAD_ALGORITHMS, VaultCipher
+from hushh_mcp.vault.stream import decrypt_stream, encrypt_stream
+
+SIZES = [64, 1024, 16 * 1024, 256 * 1024, 4 * 1024 * 1024]
+STREAM_SIZE = 32 * 1024 * 1024
+TARGET_SECONDS = 0.3
+
+
+def _rate(fn) -> float:
+    fn()  # warm-up
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < TARGET_SECONDS:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def _stream_roundtrip(data: bytes, algorithm: str) -> None:
+    sealed = io.BytesIO()
+    encrypt_stream(io.BytesIO(data), sealed, VAULT_ENCRYPTION_KEY, algorithm=algorithm)
+    sealed.seek(0)
+    decrypt_stream(sealed, io.BytesIO(), VAULT_ENCRYPTION_KEY)
+
+
+def main():
+    algorithms = list(AEAD_ALGORITHMS)
+    ciphers = {algorithm: VaultCipher(VAULT_ENCRYPTION_KEY, algorithm) for algorithm in algorithms}
+    print(f"{'size':>9} " + " ".join(f"{algorithm + ' MB/s':>24}" for algorithm in algorithms))
+
+    for size in SIZES:
+        data = memoryview(b"x" * size)
+        rates = []
+        for algorithm in algorithms:
+            cipher = ciphers[algorithm]
+            rates.append(_rate(lambda: cipher.decrypt_bytes(cipher.encrypt_bytes(data))) * size / 1e6)
+        print(f"{size:>9} " + " ".join(f"{rate:>24,.1f}" for rate in rates))
+
+    data = b"x" * STREAM_SIZE
+    rates = [_rate(lambda: _stream_roundtrip(data, algorithm)) * STREAM_SIZE / 1e6 for algorithm in algorithms]
+    print(f"{'stream':>9} " + " ".join(f"{rate:>24,.1f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
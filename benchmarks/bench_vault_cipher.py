@@ -0,0 +1,61 @@
+# benchmarks/bench_vault_cipher.py
+#
+# Encrypt + decrypt round-trips per second across payload sizes for:
+#   legacy  - per-call key parse, Cipher/GCM context and base64 payload (the pre-VaultCipher path)
+#   string  - encrypt_data/decrypt_data, now layered on a shared VaultCipher
+#   bytes   - VaultCipher.encrypt_bytes/decrypt_bytes on a single iv||ciphertext||tag buffer
+# Run from the repo root:  python -m benchmarks.bench_vault_cipher
+
+import base64
+import os
+import time
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.vault.encrypt import VaultCipher, encrypt_data, decrypt_data
+
+SIZES = [64, 1024, 16 * 1024, 256 * 1024, 4 * 1024 * 1024]
+TARGET_SECONDS = 0.3
+
+
+def _legacy_roundtrip(plaintext: str, key_hex: str) -> str:
+    key = bytes.fromhex(key_hex)
+    iv = os.urandom(12)
+    encryptor = Cipher(algorithms.AES(key), modes.GCM(iv), backend=default_backend()).encryptor()
+    ciphertext = encryptor.update(plaintext.encode("utf-8")) + encryptor.finalize()
+    fields = [base64.b64encode(part).decode("utf-8") for part in (ciphertext, iv, encryptor.tag)]
+
+    key = bytes.fromhex(key_hex)
+    ciphertext, iv, tag = (base64.b64decode(field) for field in fields)
+    decryptor = Cipher(algorithms.AES(key), modes.GCM(iv, tag), backend=default_backend()).decryptor()
+    return (decryptor.update(ciphertext) + decryptor.finalize()).decode("utf-8")
+
+
+def _rate(fn) -> float:
+    fn()  # warm-up
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < TARGET_SECONDS:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    cipher = VaultCipher(VAULT_ENCRYPTION_KEY)
+    print(f"{'size':>9} {'legacy/s':>11} {'string/s':>11} {'bytes/s':>11} {'bytes MB/s':>11}")
+
+    for size in SIZES:
+        text = "x" * size
+        data = memoryview(text.encode())
+
+        legacy = _rate(lambda: _legacy_roundtrip(text, VAULT_ENCRYPTION_KEY))
+        string = _rate(lambda: decrypt_data(encrypt_data(text, VAULT_ENCRYPTION_KEY), VAULT_ENCRYPTION_KEY))
+        raw = _rate(lambda: cipher.decrypt_bytes(cipher.encrypt_bytes(data)))
+
+        print(f"{size:>9} {legacy:>11,.0f} {string:>11,.0f} {raw:>11,.0f} {raw * size / 1e6:>11,.1f}")
+
+
+if __name__ == "__main__":
+    main()
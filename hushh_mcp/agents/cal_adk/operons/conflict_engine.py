@@ -0,0 +1,113 @@
+# hushh_mcp/agents/cal_adk/operons/conflict_engine.py
+#
+# Interval-overlap conflict detection for ConflictResolutionOperon.
+#
+# Events ({"time": ..., "duration": "1h"} as produced by fetch_calendar_state, or
+# Calendar API style {"start": ..., "end": ...}) are parsed once into integer epoch
+# intervals [start, end). Then:
+#   all_overlaps()      - every overlapping pair, by a sweep line over start-sorted
+#                         events with a min-heap of active end times: O(N log N + K)
+#   conflicts_for(s, e) - events overlapping a proposed time: a bisect over the start-
+#                         sorted index, looking back at most the longest indexed
+#                         duration; multi-day events are kept aside and checked directly
+# Building the index costs more than one linear pass, so a single proposed event is
+# checked with conflicts_with() and the index is for sweeps and repeated queries.
+# Kept free of google.adk imports so it can be used (and tested) on its own.
+
+import bisect
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from hushh_mcp.operons.freebusy_engine import event_interval, to_epoch
+from hushh_mcp.operons.schedule_scorer import parse_duration_minutes
+
+Interval = Tuple[int, int]
+
+# Events longer than this are not bisect-indexed (they would widen every lookback)
+LONG_EVENT_S = 24 * 3600
+
+def parse_event(event: Dict[str, Any], default_duration: str = "1h") -> Optional[Interval]:
+    """[start, end) of an event given as time + duration or as start + end; None if unparseable."""
+    if "time" in event:
+        start = to_epoch(event.get("time"))
+        if start is None:
+            return None
+        try:
+            minutes = parse_duration_minutes(event.get("duration") or default_duration)
+        except ValueError:
+            return None
+        return start, start + minutes * 60
+    return event_interval(event)
+
+def overlaps(a: Interval, b: Interval) -> bool:
+    """Half-open intervals overlap; back-to-back events do not conflict."""
+    return a[0] < b[1] and b[0] < a[1]
+
+def conflicts_with(events: Iterable[Dict[str, Any]], event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Events overlapping `event`, in calendar order: one O(N) pass, no index."""
+    window = parse_event(event)
+    if window is None:
+        raise ValueError(f"Cannot parse event time: {event!r}")
+    found = []
+    for other in events:
+        if other is event:
+            continue
+        interval = parse_event(other)
+        if interval is not None and overlaps(interval, window):
+            found.append(other)
+    return found
+
+# ========== Conflict Index ==========
+
+class ConflictIndex:
+    """Parsed, start-sorted events. Events that cannot be parsed are listed in `skipped`."""
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        parsed = []
+        self.skipped: List[Dict[str, Any]] = []
+        for event in events:
+            interval = parse_event(event)
+            if interval is None:
+                self.skipped.append(event)
+            else:
+                parsed.append((interval[0], interval[1], event))
+        parsed.sort(key=lambda item: (item[0], item[1]))
+
+        self._all = parsed
+        short = [item for item in parsed if item[1] - item[0] <= LONG_EVENT_S]
+        self._long = [item for item in parsed if item[1] - item[0] > LONG_EVENT_S]
+        self._starts = [start for start, _, _ in short]
+        self._short = short
+        self._max_duration = max((end - start for start, end, _ in short), default=0)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def conflicts_for(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Events overlapping [start, end), in start order."""
+        # Only events starting in (start - longest duration, end) can reach into the range
+        lo = bisect.bisect_right(self._starts, start - self._max_duration)
+        hi = bisect.bisect_left(self._starts, end)
+        found = [item for item in self._short[lo:hi] if item[1] > start]
+        found.extend(item for item in self._long if item[0] < end and item[1] > start)
+        if self._long:
+            found.sort(key=lambda item: (item[0], item[1]))
+        return [event for _, _, event in found]
+
+    def conflicts_for_event(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        interval = parse_event(event)
+        if interval is None:
+            raise ValueError(f"Cannot parse event time: {event!r}")
+        return [other for other in self.conflicts_for(*interval) if other is not event]
+
+    def all_overlaps(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Every pair of overlapping events, earlier-starting event first; O(N log N + pairs)."""
+        pairs = []
+        active: List[Tuple[int, int, Dict[str, Any]]] = []  # (end, position, event) min-heap
+        for position, (start, end, event) in enumerate(self._all):
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            # Everything still active ends after this start, so overlaps it
+            pairs.extend((other, event) for _, _, other in active)
+            heapq.heappush(active, (end, position, event))
+        return pairs
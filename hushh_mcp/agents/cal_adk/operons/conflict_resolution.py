@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from hushh_mcp.consent.token import validate_token
 from hushh_mcp.constants import ConsentScope
 from hushh_mcp.vault import store_consent
@@ -6,6 +6,7 @@ from google.adk.tools import Tool
 from chrono_agent.tools.fetch_calendar_state import fetch_calendar_state
 from chrono_agent.tools.resolve_conflict import resolve_conflict
 from chrono_agent.tools.notify_user import notify_user
+from hushh_mcp.agents.cal_adk.operons.conflict_engine import ConflictIndex, conflicts_with, overlaps, parse_event
 
 class ConflictResolutionOperon:
     """Operon for detecting and resolving calendar event conflicts."""
@@ -20,15 +21,15 @@ class ConflictResolutionOperon:
         ]
     
     def validate_consent(self, token: str, user_id: str) -> bool:
-        """Validate consent token for required scopes."""
-        for scope in self.required_scopes:
-            valid, reason, parsed = validate_token(token, expected_scope=scope)
-            if not valid:
-                store_consent(f"/vault/consent_failure_{scope}_{user_id}", {"reason": reason})
-                raise PermissionError(f"Invalid token for {scope}: {reason}")
-            if parsed.user_id != user_id:
-                store_consent(f"/vault/consent_user_mismatch_{scope}_{user_id}", {"reason": "Token user mismatch"})
-                raise PermissionError("Token user mismatch")
+        """Validate consent token for required scopes (one signature check, one scope-mask test)."""
+        scopes = ",".join(scope.value for scope in self.required_scopes)
+        valid, reason, parsed = validate_token(token, required_scopes=self.required_scopes)
+        if not valid:
+            store_consent(f"/vault/consent_failure_{scopes}_{user_id}", {"reason": reason})
+            raise PermissionError(f"Invalid token for {scopes}: {reason}")
+        if parsed.user_id != user_id:
+            store_consent(f"/vault/consent_user_mismatch_{scopes}_{user_id}", {"reason": "Token user mismatch"})
+            raise PermissionError("Token user mismatch")
         return True
     
     def process(self, user_id: str, token: str, request: Dict) -> Dict:
@@ -77,17 +78,27 @@ class ConflictResolutionOperon:
         }
     
     def detect_conflicts(self, event_details: Dict, events: List[Dict]) -> List[Dict]:
-        """Detect conflicts for the proposed event."""
-        proposed_time = event_details.get("time")
-        proposed_duration = event_details.get("duration")
-        conflicts = [
-            event for event in events
-            if self.is_time_overlap(proposed_time, proposed_duration, event.get("time"), event.get("duration"))
-        ]
-        return conflicts
-    
+        """Detect conflicts for the proposed event (one linear pass over the events)."""
+        proposed = {"time": event_details.get("time"), "duration": event_details.get("duration")}
+        if parse_event(proposed) is None:
+            return []
+        return conflicts_with(events, proposed)
+
+    def detect_conflicts_many(self, proposals: List[Dict], events: List[Dict]) -> List[List[Dict]]:
+        """detect_conflicts for each proposal, sharing one sorted index (O(N log N) once, then bisects)."""
+        index = ConflictIndex(events)
+        results = []
+        for event_details in proposals:
+            proposed = {"time": event_details.get("time"), "duration": event_details.get("duration")}
+            results.append(index.conflicts_for_event(proposed) if parse_event(proposed) is not None else [])
+        return results
+
+    def find_all_conflicts(self, events: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """Every pair of overlapping events in the calendar (sweep line, O(N log N))."""
+        return ConflictIndex(events).all_overlaps()
+
     def is_time_overlap(self, time1: str, duration1: str, time2: str, duration2: str) -> bool:
-        """Check if two events overlap (simplified logic)."""
-        # Placeholder: Implement actual time overlap logic based on datetime parsing
-        # For simplicity, assume string comparison or external datetime library
-        return False  # Replace with actual overlap check
\ No newline at end of file
+        """Check if two events (start time + duration such as "1h") overlap."""
+        first = parse_event({"time": time1, "duration": duration1})
+        second = parse_event({"time": time2, "duration": duration2})
+        return first is not None and second is not None and overlaps(first, second)
@@ -18,15 +18,15 @@ class PreferencesOperon:
         ]
     
     def validate_consent(self, token: str, user_id: str) -> bool:
-        """Validate consent token for required scopes."""
-        for scope in self.required_scopes:
-            valid, reason, parsed = validate_token(token, expected_scope=scope)
-            if not valid:
-                store_consent(f"/vault/consent_failure_{scope}_{user_id}", {"reason": reason})
-                raise PermissionError(f"Invalid token for {scope}: {reason}")
-            if parsed.user_id != user_id:
-                store_consent(f"/vault/consent_user_mismatch_{scope}_{user_id}", {"reason": "Token user mismatch"})
-                raise PermissionError("Token user mismatch")
+        """Validate consent token for required scopes (one signature check, one scope-mask test)."""
+        scopes = ",".join(scope.value for scope in self.required_scopes)
+        valid, reason, parsed = validate_token(token, required_scopes=self.required_scopes)
+        if not valid:
+            store_consent(f"/vault/consent_failure_{scopes}_{user_id}", {"reason": reason})
+            raise PermissionError(f"Invalid token for {scopes}: {reason}")
+        if parsed.user_id != user_id:
+            store_consent(f"/vault/consent_user_mismatch_{scopes}_{user_id}", {"reason": "Token user mismatch"})
+            raise PermissionError("Token user mismatch")
         return True
     
     def process(self, user_id: str, token: str, request: Dict) -> Dict:
@@ -11,6 +11,7 @@ from hushh_mcp.operons.gcal_sync import (
     list_calendars,
     list_colors,
 )
+from hushh_mcp.agents.calendar_agent.state.event_index import get_event_index
 from langgraph.graph import StateGraph, END
 
 # --- Agent State Definition ---
@@ -57,12 +58,15 @@ def node_reschedule_task(state: CalendarAgentState):
     return state
 
 def node_sync_gcal(state: CalendarAgentState):
-    events = sync_with_gcal(
+    delta = sync_with_gcal(
         state["user_id"], state["consent_token"],
         state.get("sync_time_range", ()),
         state.get("calendar_id"),
     )
-    state["gcal_events"] = events
+    # sync_with_gcal returns only what changed; the full list comes from the synced index
+    index = get_event_index(state["user_id"], state.get("calendar_id") or "primary")
+    state["gcal_events"] = list(index.events.values())
+    state["gcal_sync_delta"] = delta
     return state
 
 def node_add_event_to_gcal(state: CalendarAgentState):
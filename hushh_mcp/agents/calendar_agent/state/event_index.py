@@ -0,0 +1,239 @@
+# hushh_mcp/agents/calendar_agent/state/event_index.py
+
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY, CALENDAR_INDEX_PERSIST, CALENDAR_INDEX_MAX_CALENDARS
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.types import VaultKey, VaultRecord
+from hushh_mcp.vault.codec import encode_value, decode_value
+from hushh_mcp.vault.encrypt import encrypt_raw, decrypt_raw
+from hushh_mcp.vault.store import VaultStore, get_vault_store
+
+# Persisted layout, one encrypted VaultRecord each under (user_id, INDEX_SCOPE):
+#   "gcal_event:<calendar_id>:<event_id>"  the event as last returned by the server
+#   "gcal_sync:<calendar_id>"              {"sync_token", "watermark", "time_range", "synced_at"}
+# <calendar_id> is percent-encoded (":" and "%" included), so no calendar's prefix matches another's.
+INDEX_SCOPE = ConsentScope.VAULT_READ_CALENDAR
+INDEX_AGENT_ID = "calendar_agent"
+
+Delta = Dict[str, Any]
+
+def _calendar_key(calendar_id: str) -> str:
+    return urllib.parse.quote(calendar_id, safe="@")
+
+def _event_name(calendar_id: str, event_id: str) -> str:
+    return f"gcal_event:{_calendar_key(calendar_id)}:{event_id}"
+
+def _state_name(calendar_id: str) -> str:
+    return f"gcal_sync:{_calendar_key(calendar_id)}"
+
+# ========== Per-Calendar Index ==========
+
+class CalendarEventIndex:
+    """
+    Local copy of one calendar's events keyed by event id, plus what is needed to
+    ask the server for changes only: its sync token and an `updated` watermark.
+    `resume` is where a truncated sync stopped (kept in memory only). `version` changes
+    whenever `events` does; `synced_at` is when the last complete sync finished.
+    `lock` serializes syncs of this calendar.
+    """
+
+    def __init__(self, user_id: str, calendar_id: str, store: Optional[VaultStore] = None):
+        self.user_id = user_id
+        self.calendar_id = calendar_id
+        self.store = store
+        self.events: Dict[str, dict] = {}
+        self.sync_token: Optional[str] = None
+        self.watermark: Optional[str] = None
+        self.time_range: Optional[Tuple[str, str]] = None
+        self.resume: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self.synced_at: Optional[float] = None
+        self.lock = threading.Lock()
+        if store is not None:
+            self._load()
+
+    def can_sync_incrementally(self, time_range: Optional[Tuple[str, str]]) -> bool:
+        """Deltas only make sense against a previous sync of the same time range."""
+        return (self.sync_token is not None or self.watermark is not None) and self.time_range == time_range
+
+    def apply(
+        self,
+        items: Iterable[dict],
+        full: bool,
+        sync_token: Optional[str] = None,
+        time_range: Optional[Tuple[str, str]] = None,
+        complete: bool = True
+    ) -> Delta:
+        """
+        Merge a server response. On a full sync, events missing from `items` are removed;
+        on an incremental one, only cancelled events are. With complete=False (the listing
+        was cut short) nothing is removed for being missing and the sync position is left
+        where it was, so the next sync resumes from it. Returns the added and changed
+        events, the removed event ids, and whether the sync was full / truncated.
+        """
+        self.resume = None
+        return self._merge(items, full, time_range, lambda: (sync_token, complete), set())
+
+    def apply_stream(
+        self,
+        stream,
+        full: bool,
+        time_range: Optional[Tuple[str, str]] = None,
+        query: Optional[Dict[str, Any]] = None
+    ) -> Delta:
+        """
+        apply() for an mcp_client.EventStream. Events are merged as pages arrive; the
+        sync token and completeness are read from the stream once it is exhausted.
+        If the stream was truncated, `resume` records `query` (the listing arguments)
+        and the stream's resume token so the next sync can continue the same listing.
+        """
+        query = dict(query or {})
+        resume = self.resume
+        resuming = resume is not None and resume["query"] == query and resume["page_token"] == stream.page_token
+        seen = resume["seen"] if resuming else set()
+        self.resume = None
+        delta = self._merge(stream, full, time_range, lambda: (stream.next_sync_token, stream.complete), seen)
+        if stream.truncated:
+            self.resume = {
+                "query": query,
+                "page_token": stream.resume_token,
+                "full": full,
+                "time_range": time_range,
+                "seen": seen,
+            }
+        return delta
+
+    def _merge(self, items, full, time_range, position, seen) -> Delta:
+        added, changed, removed = [], [], []
+        watermark = self.watermark
+        for event in items:
+            event_id = event.get("id")
+            if not event_id:
+                continue
+            if event.get("status") == "cancelled":
+                if self.events.pop(event_id, None) is not None:
+                    removed.append(event_id)
+                continue
+
+            seen.add(event_id)
+            previous = self.events.get(event_id)
+            if previous is None:
+                added.append(event)
+            elif previous != event:
+                changed.append(event)
+            self.events[event_id] = event
+            updated = event.get("updated")
+            if updated and (watermark is None or updated > watermark):
+                watermark = updated
+
+        sync_token, complete = position()
+        if complete:
+            if full:
+                for event_id in [event_id for event_id in self.events if event_id not in seen]:
+                    del self.events[event_id]
+                    removed.append(event_id)
+            self.sync_token = sync_token
+            self.watermark = watermark
+            self.time_range = time_range
+            self.synced_at = time.time()
+        if added or changed or removed:
+            self.version += 1
+        if self.store is not None:
+            self._persist(added + changed, removed)
+        return {"added": added, "changed": changed, "removed": removed, "full_sync": full, "truncated": not complete}
+
+    def reset(self) -> None:
+        self.sync_token = None
+        self.watermark = None
+        self.resume = None
+        self.synced_at = None
+
+    # ----- persistence -----
+
+    def _load(self) -> None:
+        event_prefix = _event_name(self.calendar_id, "")
+        state_name = _state_name(self.calendar_id)
+        for name, record in self.store.query(user_id=self.user_id, scope=INDEX_SCOPE):
+            if name == state_name:
+                state = self._decode(record)
+                self.sync_token = state.get("sync_token")
+                self.watermark = state.get("watermark")
+                self.time_range = tuple(state["time_range"]) if state.get("time_range") else None
+                self.synced_at = state.get("synced_at")
+            elif name.startswith(event_prefix):
+                self.events[name[len(event_prefix):]] = self._decode(record)
+
+    def _persist(self, events: List[dict], removed: List[str]) -> None:
+        state = {
+            "sync_token": self.sync_token,
+            "watermark": self.watermark,
+            "time_range": self.time_range,
+            "synced_at": self.synced_at,
+        }
+        batch = [(_event_name(self.calendar_id, event["id"]), self._record(event)) for event in events]
+        batch.append((_state_name(self.calendar_id), self._record(state)))
+        self.store.put_many(batch)
+        if removed:
+            key = VaultKey(user_id=self.user_id, scope=INDEX_SCOPE)
+            self.store.delete_many(key, [_event_name(self.calendar_id, event_id) for event_id in removed])
+
+    def _record(self, value) -> VaultRecord:
+        codec, data = encode_value(value)
+        now = int(time.time() * 1000)
+        return VaultRecord(
+            key=VaultKey(user_id=self.user_id, scope=INDEX_SCOPE),
+            data=encrypt_raw(data, VAULT_ENCRYPTION_KEY),
+            agent_id=INDEX_AGENT_ID,
+            created_at=now,
+            updated_at=now,
+            metadata={"codec": codec}
+        )
+
+    @staticmethod
+    def _decode(record: VaultRecord):
+        return decode_value(decrypt_raw(record.data, VAULT_ENCRYPTION_KEY), (record.metadata or {}).get("codec"))
+
+# ========== Index Registry ==========
+
+class EventIndexRegistry:
+    """Process-wide CalendarEventIndex per (user, calendar), LRU-bounded; evicted ones reload from the store."""
+
+    def __init__(self, store: Optional[VaultStore] = None, max_calendars: int = CALENDAR_INDEX_MAX_CALENDARS):
+        self.store = store
+        self.max_calendars = max_calendars
+        self._indexes: "OrderedDict[Tuple[str, str], CalendarEventIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, calendar_id: str) -> CalendarEventIndex:
+        key = (user_id, calendar_id)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+            index = self._indexes[key] = CalendarEventIndex(user_id, calendar_id, self.store)
+            while len(self._indexes) > self.max_calendars:
+                self._indexes.popitem(last=False)
+            return index
+
+_registry: Optional[EventIndexRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_event_index(user_id: str, calendar_id: str) -> CalendarEventIndex:
+    """The shared index for one user's calendar; persisted to the vault store when CALENDAR_INDEX_PERSIST is on."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EventIndexRegistry(get_vault_store() if CALENDAR_INDEX_PERSIST else None)
+        registry = _registry
+    return registry.get(user_id, calendar_id)
+
+def set_event_index_registry(registry: Optional[EventIndexRegistry]) -> None:
+    global _registry
+    with _registry_lock:
+        _registry = registry
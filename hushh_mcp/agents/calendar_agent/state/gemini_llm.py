@@ -1,21 +1,56 @@
-import os
-import google.generativeai as genai
+import asyncio
+import threading
+from typing import List, Optional
+from hushh_mcp.agents.calendar_agent.state.llm_async import AsyncLLM
+from hushh_mcp.agents.calendar_agent.state.llm_cache import get_llm_cache
+from hushh_mcp.agents.calendar_agent.state.llm_providers import get_llm_provider
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-if not GEMINI_API_KEY:
-    raise ValueError("GEMINI_API_KEY not set in environment.")
-
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel("gemini-2.5-pro")
+def gemini_chat(prompt: str, system: str = None, template: str = None) -> str:
+    """
+    Sends a prompt to the configured LLM provider (Gemini by default, see llm_providers)
+    and returns the response.
+    Responses are cached (see llm_cache); `template` names the prompt template and picks the TTL.
+    """
+    cache = get_llm_cache()
+    if cache is None:
+        return _generate(prompt, system)
+    model_name = get_llm_provider().model_name
+    return cache.get_or_call(model_name, system, prompt, lambda: _generate(prompt, system), template)
 
-def gemini_chat(prompt: str, system: str = None) -> str:
+async def agemini_chat(prompt: str, system: str = None, template: str = None, batch: bool = False) -> str:
     """
-    Sends a prompt to Gemini and returns the response.
+    Async gemini_chat that does not block the caller's thread. Calls share one concurrency
+    limit and rate limit (see llm_async); with batch=True, short prompts arriving together
+    are answered in a single model call.
     """
-    messages = []
-    if system:
-        messages.append({"role": "system", "content": system})
-    messages.append({"role": "user", "content": prompt})
-    response = model.generate_content(messages)
-    return response.text.strip()
\ No newline at end of file
+    llm = get_async_llm()
+    cache = get_llm_cache()
+    if cache is None:
+        return await llm.chat(prompt, system, batch)
+    model_name = get_llm_provider().model_name
+    return await cache.aget_or_call(model_name, system, prompt, lambda: llm.chat(prompt, system, batch), template)
+
+def gemini_chat_many(prompts: List[str], system: str = None, template: str = None, batch: bool = True) -> List[str]:
+    """Responses to several prompts, asked concurrently (and batched) on the shared LLM event loop."""
+    async def ask_all():
+        return await asyncio.gather(*(agemini_chat(prompt, system, template, batch) for prompt in prompts))
+    return list(get_async_llm().run(ask_all()))
+
+def _generate(prompt: str, system: str = None) -> str:
+    return get_llm_provider().generate(prompt, system)
+
+_async_llm: Optional[AsyncLLM] = None
+_async_llm_lock = threading.Lock()
+
+def get_async_llm() -> AsyncLLM:
+    """The process-wide AsyncLLM behind agemini_chat, started on first use."""
+    global _async_llm
+    with _async_llm_lock:
+        if _async_llm is None:
+            _async_llm = AsyncLLM(_generate)
+        return _async_llm
+
+def set_async_llm(llm: Optional[AsyncLLM]) -> None:
+    global _async_llm
+    with _async_llm_lock:
+        _async_llm = llm
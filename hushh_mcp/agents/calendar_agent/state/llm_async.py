@@ -0,0 +1,246 @@
+# hushh_mcp/agents/calendar_agent/state/llm_async.py
+#
+# Async, rate-limited model invocation behind agemini_chat.
+#
+# AsyncLLM wraps a blocking generate(prompt, system) -> str callable (the Gemini SDK call,
+# or a fake in tests) and runs it on a worker pool from one event loop owned by an
+# LLMEventLoop thread:
+#   - at most max_concurrency calls are in flight (semaphore)
+#   - calls start no faster than rate_per_s, with bursts of up to `burst` (TokenBucket)
+#   - chat(..., batch=True) prompts that are short and have no system prompt wait up to
+#     batch_window_s for company and are sent as one BATCH_PROMPT call answered with a
+#     JSON array; identical prompts in a batch are asked once. If the reply cannot be
+#     split, each prompt is asked on its own.
+# Coroutines from any event loop, and sync callers via run(), are forwarded to the
+# owned loop, so every caller shares the same limits and batches.
+
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Union
+
+from hushh_mcp.config import (
+    LLM_MAX_CONCURRENCY,
+    LLM_RATE_PER_S,
+    LLM_RATE_BURST,
+    LLM_BATCH_WINDOW_MS,
+    LLM_BATCH_MAX_PROMPTS,
+    LLM_BATCH_MAX_CHARS
+)
+from hushh_mcp.agents.calendar_agent.state.llm_cache import normalize_prompt
+from hushh_mcp.agents.calendar_agent.state.prompts import BATCH_PROMPT
+
+Generate = Callable[[str, Optional[str]], str]
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+def split_batch_response(text: str, count: int) -> Optional[List[str]]:
+    """The answers from a BATCH_PROMPT reply, or None if it is not a JSON array of `count` items."""
+    try:
+        answers = json.loads(_FENCE.sub("", (text or "").strip()))
+    except ValueError:
+        return None
+    if not isinstance(answers, list) or len(answers) != count:
+        return None
+    return [answer if isinstance(answer, str) else json.dumps(answer) for answer in answers]
+
+# ========== Rate Limiting ==========
+
+class TokenBucket:
+    """`rate_per_s` tokens per second, holding at most `burst`; a rate of 0 means unlimited."""
+
+    def __init__(self, rate_per_s: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate_per_s = rate_per_s
+        self.capacity = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; seconds to wait before using it (0.0 if one was available)."""
+        if self.rate_per_s <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_s)
+            self._updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_s
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+# ========== Event Loop Thread ==========
+
+class LLMEventLoop:
+    """An event loop running forever on a daemon thread, for sync callers and cross-loop coroutines."""
+
+    def __init__(self, name: str = "llm-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def in_loop(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run `coro` on the loop thread and wait for its result."""
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError("LLMEventLoop.run() called from its own loop; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+# ========== Async Model ==========
+
+class _Pending:
+    __slots__ = ("prompt", "future")
+
+    def __init__(self, prompt: str, future: asyncio.Future):
+        self.prompt = prompt
+        self.future = future
+
+class AsyncLLM:
+    """Concurrency-bounded, rate-limited, micro-batching front for a blocking `generate`."""
+
+    def __init__(
+        self,
+        generate: Generate,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        rate_per_s: float = LLM_RATE_PER_S,
+        burst: int = LLM_RATE_BURST,
+        batch_window_s: float = LLM_BATCH_WINDOW_MS / 1000,
+        batch_max_prompts: int = LLM_BATCH_MAX_PROMPTS,
+        batch_max_chars: int = LLM_BATCH_MAX_CHARS,
+        runner: Optional[LLMEventLoop] = None
+    ):
+        self.generate = generate
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(rate_per_s, burst)
+        self.batch_window_s = batch_window_s
+        self.batch_max_prompts = max(1, batch_max_prompts)
+        self.batch_max_chars = batch_max_chars
+        self._owns_runner = runner is None
+        self.runner = runner or LLMEventLoop()
+        self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="llm-call")
+        # Created on the runner loop on first use
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+        self._stats = {"calls": 0, "batches": 0, "batched_prompts": 0, "batch_fallbacks": 0, "rate_limited": 0}
+
+    async def chat(self, prompt: str, system: Optional[str] = None, batch: bool = False) -> str:
+        """The model's response; awaitable from any event loop."""
+        coro = self._chat(prompt, system, batch)
+        if self.runner.in_loop():
+            return await coro
+        return await asyncio.wrap_future(self.runner.submit(coro))
+
+    def chat_sync(self, prompt: str, system: Optional[str] = None, batch: bool = False) -> str:
+        return self.runner.run(self._chat(prompt, system, batch))
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine (e.g. a gather of chat() calls) on the shared loop from sync code."""
+        return self.runner.run(coro, timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def close(self) -> None:
+        if self._owns_runner:
+            self.runner.close()
+        self._executor.shutdown(wait=False)
+
+    # ----- internals (run on the runner loop) -----
+
+    async def _chat(self, prompt: str, system: Optional[str], batch: bool) -> str:
+        if batch and not system and len(prompt) <= self.batch_max_chars and self.batch_max_prompts > 1:
+            future = asyncio.get_running_loop().create_future()
+            self._enqueue(_Pending(prompt, future))
+            return await future
+        return await self._invoke(prompt, system)
+
+    async def _invoke(self, prompt: str, system: Optional[str]) -> str:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            if await self.bucket.acquire():
+                self._stats["rate_limited"] += 1
+            self._stats["calls"] += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.generate, prompt, system)
+
+    def _enqueue(self, item: _Pending) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self.batch_max_prompts:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_window_s, self._flush)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._pending = self._pending, []
+        if items:
+            task = asyncio.get_running_loop().create_task(self._run_batch(items))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, items: List[_Pending]) -> None:
+        # Identical prompts are asked once
+        groups: Dict[str, List[_Pending]] = {}
+        for item in items:
+            groups.setdefault(normalize_prompt(item.prompt), []).append(item)
+        prompts = [group[0].prompt for group in groups.values()]
+
+        try:
+            answers = await self._ask_batch(prompts)
+        except Exception as e:
+            answers = [e] * len(prompts)
+
+        for group, answer in zip(groups.values(), answers):
+            for item in group:
+                if item.future.done():
+                    continue
+                if isinstance(answer, BaseException):
+                    item.future.set_exception(answer)
+                else:
+                    item.future.set_result(answer)
+
+    async def _ask_batch(self, prompts: List[str]) -> List[Union[str, BaseException]]:
+        """One answer (or the error asking for it) per prompt."""
+        if len(prompts) == 1:
+            return [await self._invoke(prompts[0], None)]
+
+        self._stats["batches"] += 1
+        self._stats["batched_prompts"] += len(prompts)
+        reply = await self._invoke(BATCH_PROMPT.format(count=len(prompts), requests=json.dumps(prompts)), None)
+        answers = split_batch_response(reply, len(prompts))
+        if answers is not None:
+            return answers
+
+        self._stats["batch_fallbacks"] += 1
+        return list(await asyncio.gather(*(self._invoke(prompt, None) for prompt in prompts), return_exceptions=True))
@@ -0,0 +1,302 @@
+# hushh_mcp/agents/calendar_agent/state/llm_cache.py
+#
+# Response cache for gemini_chat.
+#
+# Key: sha256 of (model, system prompt, normalized prompt). Normalizing collapses runs of
+# spaces/tabs, trailing whitespace and blank lines, so re-indented or re-wrapped copies of
+# the same prompt share an entry. Entries live in two tiers:
+#   memory - LRU, bounded by max_entries, per process
+#   disk   - optional SQLite file shared across processes and restarts (opt-in via
+#            LLM_CACHE_DB_PATH; responses are stored unencrypted, so only point it at a
+#            location as trusted as the process itself)
+# A memory miss that hits disk is promoted to memory. How long a response may be reused
+# depends on the prompt template it came from (DEFAULT_TTLS); a TTL of 0 disables caching
+# for that template.
+#
+# Modes:
+#   "readwrite" - normal caching
+#   "replay"    - answer only from the cache, ignoring TTLs; a miss raises RuntimeError
+#                 instead of calling the model (offline tests against a recorded cache)
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from hushh_mcp.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MODE,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_DB_PATH,
+    LLM_CACHE_TTL_S,
+    LLM_CACHE_TTL_PARSE_S,
+    LLM_CACHE_TTL_SUMMARY_S
+)
+
+# Prompt templates and how long (seconds) their responses may be reused; others use LLM_CACHE_TTL_S
+DEFAULT_TTLS: Dict[str, float] = {
+    "parse_time_range": LLM_CACHE_TTL_PARSE_S,
+    "summarize_calendar": LLM_CACHE_TTL_SUMMARY_S,
+    "suggest_schedule": LLM_CACHE_TTL_S,
+    "explain_schedule": LLM_CACHE_TTL_S,
+    "reschedule_task": LLM_CACHE_TTL_S,
+}
+
+MODES = ("readwrite", "replay")
+
+_SPACES = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\n{2,}")
+
+def normalize_prompt(prompt: str) -> str:
+    text = unicodedata.normalize("NFC", prompt or "").replace("\r\n", "\n")
+    text = "\n".join(_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+def prompt_key(model: str, system: Optional[str], prompt: str) -> str:
+    """Hex digest identifying (model, system prompt, normalized prompt)."""
+    digest = hashlib.sha256()
+    for part in (model, normalize_prompt(system or ""), normalize_prompt(prompt)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+# ========== Disk Tier ==========
+
+class SQLiteResponseStore:
+    """
+    Responses on disk, keyed by prompt_key. Expired rows are dropped when read, when the
+    store is opened (unless `purge_on_open` is off, e.g. to replay a recording), and by a
+    purge at most every `gc_interval_s` on writes.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS llm_responses (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            template TEXT,
+            response TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_llm_responses_expires_at
+            ON llm_responses (expires_at);
+    """
+
+    def __init__(self, path: str = LLM_CACHE_DB_PATH, gc_interval_s: float = 600.0, purge_on_open: bool = True):
+        self.path = path
+        self.gc_interval_s = gc_interval_s
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._last_gc = time.monotonic()
+        if purge_on_open:
+            self.purge_expired(time.time())
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        """(expires_at, response), or None."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT expires_at, response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+
+    def put(self, key: str, model: str, template: Optional[str], response: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, model, template, response, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, template, response, expires_at)
+            )
+            if time.monotonic() - self._last_gc >= self.gc_interval_s:
+                self._purge_locked(time.time())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+
+    def purge_expired(self, now: float) -> int:
+        with self._lock:
+            return self._purge_locked(now)
+
+    def _purge_locked(self, now: float) -> int:
+        self._last_gc = time.monotonic()
+        return self._conn.execute("DELETE FROM llm_responses WHERE expires_at < ?", (now,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+# ========== Response Cache ==========
+
+class LLMResponseCache:
+    """
+    Two-tier (memory LRU, optional SQLite) cache of model responses with per-template
+    TTLs and hit-rate metrics. Failed calls are not cached. Concurrent misses for the
+    same prompt may each call the model; the last response stored wins.
+    """
+
+    def __init__(
+        self,
+        store: Optional[SQLiteResponseStore] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl_s: float = LLM_CACHE_TTL_S,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        mode: str = "readwrite",
+        clock: Callable[[], float] = time.time
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode: '{mode}' (expected 'readwrite' or 'replay')")
+        self.store = store
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl_s = default_ttl_s
+        self.max_entries = max_entries
+        self.mode = mode
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, template: Optional[str]) -> float:
+        return self.ttls.get(template, self.default_ttl_s) if template else self.default_ttl_s
+
+    def get(self, model: str, system: Optional[str], prompt: str, template: Optional[str] = None) -> Optional[str]:
+        """Cached response, or None (counted as a miss)."""
+        key = prompt_key(model, system, prompt)
+        now = self.clock()
+        replay = self.mode == "replay"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (replay or entry[0] > now):
+                self._entries.move_to_end(key)
+                self._count_locked(template, "memory_hits")
+                return entry[1]
+
+        row = self.store.get(key) if self.store is not None else None
+        if row is not None and not replay and row[0] <= now:
+            self.store.delete(key)
+            row = None
+        with self._lock:
+            if row is None:
+                self._count_locked(template, "misses")
+                return None
+            self._store_locked(key, row[0], row[1])
+            self._count_locked(template, "disk_hits")
+            return row[1]
+
+    def put(self, model: str, system: Optional[str], prompt: str, response: str, template: Optional[str] = None) -> None:
+        ttl = self.ttl_for(template)
+        if ttl <= 0:
+            return
+        key = prompt_key(model, system, prompt)
+        expires_at = self.clock() + ttl
+        with self._lock:
+            self._store_locked(key, expires_at, response)
+        if self.store is not None:
+            self.store.put(key, model, template, response, expires_at)
+
+    def get_or_call(
+        self,
+        model: str,
+        system: Optional[str],
+        prompt: str,
+        call: Callable[[], str],
+        template: Optional[str] = None
+    ) -> str:
+        """The cached response for the prompt, calling the model only on a miss."""
+        if self.ttl_for(template) <= 0 and self.mode != "replay":
+            return call()
+        cached = self.get(model, system, prompt, template)
+        if cached is not None:
+            return cached
+        if self.mode == "replay":
+            raise RuntimeError(f"No recorded LLM response for template '{template}' (replay mode)")
+        response = call()
+        self.put(model, system, prompt, response, template)
+        return response
+
+    async def aget_or_call(
+        self,
+        model: str,
+        system: Optional[str],
+        prompt: str,
+        call: Callable[[], Awaitable[str]],
+        template: Optional[str] = None
+    ) -> str:
+        """get_or_call for a coroutine-returning `call`."""
+        if self.ttl_for(template) <= 0 and self.mode != "replay":
+            return await call()
+        cached = self.get(model, system, prompt, template)
+        if cached is not None:
+            return cached
+        if self.mode == "replay":
+            raise RuntimeError(f"No recorded LLM response for template '{template}' (replay mode)")
+        response = await call()
+        self.put(model, system, prompt, response, template)
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Totals plus per-template counts; hit_rate is hits / lookups (0.0 before any lookup)."""
+        with self._lock:
+            templates = {name: _with_rate(dict(counts)) for name, counts in self._stats.items()}
+            size = len(self._entries)
+        total = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        for counts in templates.values():
+            for name in total:
+                total[name] += counts[name]
+        return {"size": size, **_with_rate(total), "templates": templates}
+
+    def _count_locked(self, template: Optional[str], counter: str) -> None:
+        counts = self._stats.setdefault(template or "", {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+        counts[counter] += 1
+
+    def _store_locked(self, key: str, expires_at: float, response: str) -> None:
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+def _with_rate(counts: Dict[str, int]) -> Dict[str, object]:
+    hits = counts["memory_hits"] + counts["disk_hits"]
+    lookups = hits + counts["misses"]
+    return {**counts, "hit_rate": hits / lookups if lookups else 0.0}
+
+# ========== Shared Cache ==========
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """The process-wide cache used by gemini_chat; None when LLM_CACHE_ENABLED is off (unless one was set)."""
+    global _cache
+    if not LLM_CACHE_ENABLED:
+        return _cache
+    with _cache_lock:
+        if _cache is None:
+            store = (SQLiteResponseStore(LLM_CACHE_DB_PATH, purge_on_open=LLM_CACHE_MODE != "replay")
+                     if LLM_CACHE_DB_PATH else None)
+            _cache = LLMResponseCache(store, mode=LLM_CACHE_MODE)
+        return _cache
+
+def set_llm_cache(cache: Optional[LLMResponseCache]) -> None:
+    global _cache
+    with _cache_lock:
+        _cache = cache
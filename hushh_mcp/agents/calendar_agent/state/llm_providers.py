@@ -0,0 +1,122 @@
+# hushh_mcp/agents/calendar_agent/state/llm_providers.py
+#
+# Pluggable LLM providers behind gemini_chat / agemini_chat.
+#
+# A provider turns (prompt, system) into a response string. The one in use is picked by
+# LLM_PROVIDER and built on first use, so importing the operons neither imports an SDK
+# nor needs an API key:
+#   "gemini" - Google Gemini; google.generativeai is imported and configured on the first call
+#   "stub"   - local canned responses, for tests, demos and the CLI without network access
+# More can be added with register_provider().
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hushh_mcp.config import LLM_PROVIDER, LLM_MODEL, GEMINI_API_KEY
+
+class LLMProvider:
+    """Base class: `name` identifies the provider, `model_name` is part of response cache keys."""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def generate(self, prompt: str, system: Optional[str] = None) -> str:
+        raise NotImplementedError
+
+# ========== Gemini ==========
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+
+    def __init__(self, model_name: str = LLM_MODEL, api_key: Optional[str] = GEMINI_API_KEY):
+        super().__init__(model_name)
+        self.api_key = api_key
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _client(self):
+        with self._lock:
+            if self._model is None:
+                if not self.api_key:
+                    raise ValueError("GEMINI_API_KEY not set in environment.")
+                import google.generativeai as genai
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    def generate(self, prompt: str, system: Optional[str] = None) -> str:
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        response = self._client().generate_content(messages)
+        return response.text.strip()
+
+# ========== Stub ==========
+
+class StubProvider(LLMProvider):
+    """
+    Answers from `responses` (first entry whose key occurs in the prompt) or `default`,
+    or from `respond(prompt, system)` if given. Every call is recorded in `calls`.
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, str]] = None,
+        default: str = "{}",
+        respond: Optional[Callable[[str, Optional[str]], str]] = None,
+        model_name: str = "stub"
+    ):
+        super().__init__(model_name)
+        self.responses = dict(responses or {})
+        self.default = default
+        self.respond = respond
+        self.calls: List[Tuple[str, Optional[str]]] = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, system: Optional[str] = None) -> str:
+        with self._lock:
+            self.calls.append((prompt, system))
+        if self.respond is not None:
+            return self.respond(prompt, system)
+        for needle, response in self.responses.items():
+            if needle in prompt:
+                return response
+        return self.default
+
+# ========== Registry ==========
+
+_factories: Dict[str, Callable[[], LLMProvider]] = {
+    "gemini": GeminiProvider,
+    "stub": StubProvider,
+}
+_provider: Optional[LLMProvider] = None
+_provider_lock = threading.Lock()
+
+def register_provider(name: str, factory: Callable[[], LLMProvider]) -> None:
+    """Make a provider selectable with LLM_PROVIDER=<name> (or create_provider(name))."""
+    _factories[name.lower()] = factory
+
+def create_provider(name: str = LLM_PROVIDER) -> LLMProvider:
+    factory = _factories.get(name.lower())
+    if factory is None:
+        raise ValueError(f"Unknown LLM provider: '{name}' (expected one of {', '.join(sorted(_factories))})")
+    return factory()
+
+def get_llm_provider() -> LLMProvider:
+    """The process-wide provider, created from LLM_PROVIDER on first use."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = create_provider(LLM_PROVIDER)
+        return _provider
+
+def set_llm_provider(provider: Optional[LLMProvider]) -> None:
+    """Replace the process-wide provider (None: recreate from LLM_PROVIDER on next use)."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
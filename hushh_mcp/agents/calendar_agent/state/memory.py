@@ -1,43 +1,322 @@
 # hushh_mcp/agents/calendar_agent/state/memory.py
 
-from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
-from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from hushh_mcp.vault.codec import encode_value, decode_value
+from hushh_mcp.vault.encrypt import encrypt_raw, decrypt_raw
+from hushh_mcp.vault.store import VaultStore, get_vault_store
+from hushh_mcp.config import (
+    VAULT_ENCRYPTION_KEY,
+    CALENDAR_MEMORY_MAX_BYTES,
+    CALENDAR_MEMORY_TTL_MS,
+    CALENDAR_MEMORY_WRITE_BEHIND
+)
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.types import EncryptedPayload, VaultKey, VaultRecord
+
+# Persisted context lives in the vault store under (user_id, MEMORY_SCOPE, context key)
+MEMORY_SCOPE = ConsentScope.VAULT_WRITE_CALENDAR
+MEMORY_AGENT_ID = "calendar_agent"
+
+# Lock stripes serializing store writes per user
+_IO_STRIPES = 64
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+class _Entry:
+    __slots__ = ("payload", "codec", "value", "decoded_at", "size", "dirty")
+
+    def __init__(self, payload: EncryptedPayload, codec: Optional[str], value, size: int, dirty: bool):
+        self.payload = payload
+        self.codec = codec  # format tag from vault.codec; None for legacy str() values
+        self.value = value
+        self.decoded_at = _now_ms()
+        self.size = size
+        self.dirty = dirty
+
+class _UserContext:
+    __slots__ = ("entries", "size")
+
+    def __init__(self):
+        self.entries: Dict[str, _Entry] = {}
+        self.size = 0
+
+# ========== Memory Manager ==========
+
+class CalendarMemoryManager:
+    """
+    Process-wide home for every user's CalendarAgentMemory.
+
+    - One handle per user; all handles for a user share the same entries.
+    - Users are kept in LRU order and evicted once the total size
+      (ciphertext + decrypted value) exceeds `max_bytes`.
+    - Decrypted values stay in memory next to their ciphertext (and count towards
+      `max_bytes`) until the user is evicted; after `ttl_ms` they are no longer
+      trusted, so the next read decrypts again and replaces them.
+    - With a vault store attached, misses read through to it. With `write_behind`,
+      saves are only marked dirty and reach the store on flush() or eviction;
+      without it they are written through immediately. A user is only dropped from
+      memory once their dirty entries are in the store; if that write fails they stay
+      (over budget) and are retried on the next eviction or flush().
+    - Without a store the manager is a bounded in-memory cache only: evicted context
+      is gone. get_memory_manager() always attaches the vault store.
+    - Store I/O happens outside the manager lock; saves for the same user are
+      serialized on a per-user stripe lock so the store sees them in order. A
+      write-through save reaches the store before memory, so a failed write leaves both unchanged.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CALENDAR_MEMORY_MAX_BYTES,
+        ttl_ms: int = CALENDAR_MEMORY_TTL_MS,
+        store: Optional[VaultStore] = None,
+        write_behind: bool = CALENDAR_MEMORY_WRITE_BEHIND
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_ms = ttl_ms
+        self.store = store
+        self.write_behind = write_behind and store is not None
+        self._users: "OrderedDict[str, _UserContext]" = OrderedDict()
+        self._handles: Dict[str, "CalendarAgentMemory"] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._io_locks = [threading.Lock() for _ in range(_IO_STRIPES)]
+
+    def memory_for(self, user_id: str) -> "CalendarAgentMemory":
+        with self._lock:
+            handle = self._handles.get(user_id)
+            if handle is None:
+                handle = self._handles[user_id] = CalendarAgentMemory(user_id, manager=self)
+            return handle
+
+    # ----- context operations -----
+
+    def save(self, user_id: str, key: str, value) -> None:
+        codec, data = encode_value(value)
+        payload = encrypt_raw(data, VAULT_ENCRYPTION_KEY)
+        entry = _Entry(payload, codec, value, len(payload.ciphertext) + len(data), dirty=self.write_behind)
+
+        with self._io_lock(user_id):
+            if self.store is not None and not self.write_behind:
+                self.store.put(self._record(user_id, entry), name=key)
+            with self._lock:
+                self._put_locked(user_id, key, entry)
+        self._evict(keep=user_id)
+
+    def load(self, user_id: str, key: str):
+        now = _now_ms()
+        with self._lock:
+            context = self._touch_locked(user_id)
+            entry = context.entries.get(key) if context else None
+            if entry is not None and entry.value is not None and now - entry.decoded_at < self.ttl_ms:
+                return entry.value
+
+        if entry is None:
+            if self.store is None:
+                return None
+            record = self.store.get(VaultKey(user_id=user_id, scope=MEMORY_SCOPE), name=key)
+            if record is None:
+                return None
+            payload, codec, dirty = record.data, (record.metadata or {}).get("codec"), False
+        else:
+            payload, codec, dirty = entry.payload, entry.codec, entry.dirty
+
+        data = decrypt_raw(payload, VAULT_ENCRYPTION_KEY)
+        value = decode_value(data, codec)
+        with self._lock:
+            current = self._users.get(user_id)
+            # Only cache if no newer save landed while we were decrypting
+            cached = current is None or current.entries.get(key) is entry
+            if cached:
+                self._put_locked(user_id, key, _Entry(payload, codec, value, len(payload.ciphertext) + len(data), dirty))
+        if cached:
+            self._evict(keep=user_id)
+        return value
+
+    def clear(self, user_id: str, key: str) -> None:
+        with self._io_lock(user_id):
+            with self._lock:
+                context = self._users.get(user_id)
+                if context is not None:
+                    entry = context.entries.pop(key, None)
+                    if entry is not None:
+                        context.size -= entry.size
+                        self._total_bytes -= entry.size
+            if self.store is not None:
+                self.store.delete(VaultKey(user_id=user_id, scope=MEMORY_SCOPE), name=key)
+
+    # ----- write-behind -----
+
+    def flush(self, user_id: Optional[str] = None) -> int:
+        """Write dirty entries (for one user, or all) to the vault store in one batch."""
+        if self.store is None:
+            return 0
+        with self._lock:
+            users = [user_id] if user_id is not None else list(self._users)
+            dirty = self._collect_dirty_locked(users)
+        written = self.store.put_many((key, record) for _, key, record, _ in dirty)
+        with self._lock:
+            self._mark_clean_locked(dirty)
+        return written
+
+    # ----- stats -----
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        """Number of users currently held in memory."""
+        with self._lock:
+            return len(self._users)
+
+    # ----- internals (caller holds self._lock) -----
+
+    def _touch_locked(self, user_id: str) -> Optional[_UserContext]:
+        context = self._users.get(user_id)
+        if context is not None:
+            self._users.move_to_end(user_id)
+        return context
+
+    def _put_locked(self, user_id: str, key: str, entry: _Entry) -> None:
+        context = self._touch_locked(user_id)
+        if context is None:
+            context = self._users[user_id] = _UserContext()
+        previous = context.entries.get(key)
+        if previous is not None:
+            context.size -= previous.size
+            self._total_bytes -= previous.size
+        context.entries[key] = entry
+        context.size += entry.size
+        self._total_bytes += entry.size
+
+    def _drop_locked(self, user_id: str, context: _UserContext) -> None:
+        # Only if the user was not replaced or re-dirtied meanwhile
+        if self._users.get(user_id) is context and not any(entry.dirty for entry in context.entries.values()):
+            del self._users[user_id]
+            self._handles.pop(user_id, None)
+            self._total_bytes -= context.size
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used users until under budget, persisting their dirty entries first."""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            victims, excess = [], self._total_bytes - self.max_bytes
+            for user_id, context in self._users.items():
+                if excess <= 0:
+                    break
+                if user_id != keep:
+                    victims.append((user_id, context))
+                    excess -= context.size
+            dirty = self._collect_dirty_locked([user_id for user_id, _ in victims])
+            if not dirty:
+                for user_id, context in victims:
+                    self._drop_locked(user_id, context)
+                return
+
+        try:
+            self.store.put_many((key, record) for _, key, record, _ in dirty)
+        except Exception:
+            # Keep them in memory, still dirty; the next eviction or flush() retries
+            return
+        with self._lock:
+            self._mark_clean_locked(dirty)
+            for user_id, context in victims:
+                self._drop_locked(user_id, context)
+
+    def _collect_dirty_locked(self, users: List[str]) -> List[Tuple[str, str, VaultRecord, _Entry]]:
+        """(user_id, key, record, entry) for each dirty entry; flags are cleared by _mark_clean_locked."""
+        batch = []
+        for user_id in users:
+            context = self._users.get(user_id)
+            if context is None:
+                continue
+            for key, entry in context.entries.items():
+                if entry.dirty:
+                    batch.append((user_id, key, self._record(user_id, entry), entry))
+        return batch
+
+    def _mark_clean_locked(self, written: List[Tuple[str, str, VaultRecord, _Entry]]) -> None:
+        # A newer save replaces the entry object, so only what was written is marked clean
+        for _, _, _, entry in written:
+            entry.dirty = False
+
+    def _io_lock(self, user_id: str) -> threading.Lock:
+        return self._io_locks[hash(user_id) % _IO_STRIPES]
+
+    @staticmethod
+    def _record(user_id: str, entry: _Entry) -> VaultRecord:
+        now = _now_ms()
+        return VaultRecord(
+            key=VaultKey(user_id=user_id, scope=MEMORY_SCOPE),
+            data=entry.payload,
+            agent_id=MEMORY_AGENT_ID,
+            created_at=now,
+            updated_at=now,
+            metadata={"codec": entry.codec} if entry.codec else None
+        )
+
+# ========== Per-User Memory ==========
 
 class CalendarAgentMemory:
     """
     Bacteria-style: Each method is a single responsibility.
     Context memory is always encrypted at rest.
+    Storage lives in the process-wide CalendarMemoryManager, so every
+    instance for the same user sees the same context.
     """
 
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, manager: Optional[CalendarMemoryManager] = None):
         self.user_id = user_id
-        self._store = {}  # In-memory for demo; replace with persistent store in prod
+        self._manager = manager if manager is not None else get_memory_manager()
 
     def save_context(self, key: str, value: dict):
         """
         Encrypt and store context for a given key.
         """
-        plaintext = str(value)
-        encrypted = encrypt_data(plaintext, VAULT_ENCRYPTION_KEY)
-        self._store[key] = encrypted
+        self._manager.save(self.user_id, key, value)
 
     def load_context(self, key: str):
         """
         Decrypt and retrieve context for a given key.
         """
-        encrypted = self._store.get(key)
-        if not encrypted:
-            return None
-        plaintext = decrypt_data(encrypted, VAULT_ENCRYPTION_KEY)
-        # For demo, assume value was a dict string
-        try:
-            return eval(plaintext)
-        except Exception:
-            return plaintext
+        return self._manager.load(self.user_id, key)
 
     def clear_context(self, key: str):
         """
         Remove context for a given key.
         """
-        if key in self._store:
-            del self._store[key]
\ No newline at end of file
+        self._manager.clear(self.user_id, key)
+
+    def flush(self) -> int:
+        """
+        Persist this user's pending (write-behind) context to the vault store.
+        """
+        return self._manager.flush(self.user_id)
+
+# ========== Default Manager ==========
+
+_manager: Optional[CalendarMemoryManager] = None
+_manager_lock = threading.Lock()
+
+def get_memory_manager() -> CalendarMemoryManager:
+    """Process-wide manager backed by the default vault store (write-through, or write-behind if enabled)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = CalendarMemoryManager(store=get_vault_store())
+        return _manager
+
+def set_memory_manager(manager: Optional[CalendarMemoryManager]) -> None:
+    global _manager
+    with _manager_lock:
+        _manager = manager
+
+def get_calendar_memory(user_id: str) -> CalendarAgentMemory:
+    """The shared CalendarAgentMemory for `user_id`."""
+    return get_memory_manager().memory_for(user_id)
@@ -12,6 +12,16 @@ User Preferences: {preferences}
 Respond with a JSON object: {{"suggested_time": "...", "reason": "..."}}
 """
 
+# Prompt for explaining a locally chosen schedule suggestion
+EXPLAIN_SCHEDULE_PROMPT = """
+You are ChronoAgent. A meeting was scheduled for the user. Explain the choice in one or two friendly sentences.
+
+Task: {task_description}
+Chosen Time: {suggested_time} - {end_time}
+Scoring Notes: {notes}
+User Preferences: {preferences}
+"""
+
 # Prompt for rescheduling a task
 RESCHEDULE_TASK_PROMPT = """
 You are ChronoAgent. The user wants to reschedule the following event:
@@ -33,4 +43,13 @@ Events: {events}
 Highlight any deadlines, busy days, or free periods.
 """
 
+# Prompt for answering several short, independent requests in one call (micro-batching)
+BATCH_PROMPT = """
+You are ChronoAgent. Answer each of the following {count} independent requests on its own.
+
+Requests (JSON array): {requests}
+
+Respond with only a JSON array of {count} strings, where the i-th string is your complete answer to the i-th request.
+"""
+
 # Add more prompts as needed for other operons or conversational flows.
\ No newline at end of file
@@ -14,10 +14,21 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY or len(SECRET_KEY) < 32:
     raise ValueError("❌ SECRET_KEY must be set in .env and at least 32 characters long")
 
+# Key ID embedded in new tokens/TrustLinks, and retired keys still accepted when verifying.
+# Rotate by moving the old key into SECRET_KEYS_RETIRED ("id:key,id:key") and bumping SECRET_KEY_ID.
+SECRET_KEY_ID = int(os.getenv("SECRET_KEY_ID", 0))
+SECRET_KEYS_RETIRED = os.getenv("SECRET_KEYS_RETIRED", "")
+
 VAULT_ENCRYPTION_KEY = os.getenv("VAULT_ENCRYPTION_KEY")
 if not VAULT_ENCRYPTION_KEY or len(VAULT_ENCRYPTION_KEY) != 64:
     raise ValueError("❌ VAULT_ENCRYPTION_KEY must be a 64-character hex string (256-bit AES key)")
 
+# Cipher for new vault writes: "aes-256-gcm", or "chacha20-poly1305" on hosts without AES-NI.
+# Reads always follow the algorithm recorded on each payload.
+VAULT_DEFAULT_ALGORITHM = os.getenv("VAULT_DEFAULT_ALGORITHM", "aes-256-gcm").lower()
+if VAULT_DEFAULT_ALGORITHM not in ("aes-256-gcm", "chacha20-poly1305"):
+    raise ValueError("❌ VAULT_DEFAULT_ALGORITHM must be 'aes-256-gcm' or 'chacha20-poly1305'")
+
 # ==================== Expiration Settings ====================
 
 # Default expiry durations (in milliseconds)
@@ -25,6 +36,137 @@ if not VAULT_ENCRYPTION_KEY or len(VAULT_ENCRYPTION_KEY) != 64:
 DEFAULT_CONSENT_TOKEN_EXPIRY_MS = int(os.getenv("DEFAULT_CONSENT_TOKEN_EXPIRY_MS", 1000 * 60 * 60 * 24 * 7))  # 30 days
 DEFAULT_TRUST_LINK_EXPIRY_MS = int(os.getenv("DEFAULT_TRUST_LINK_EXPIRY_MS", 1000 * 60 * 60 * 24 * 30))      
 
+# ==================== Consent Token Format ====================
+
+# Format produced by issue_token(): 1 = "HCT:" text tokens, 2 = compact "HCT2:" binary tokens.
+# Validation always accepts both.
+CONSENT_TOKEN_VERSION = int(os.getenv("CONSENT_TOKEN_VERSION", 1))
+
+# ==================== Consent Token Cache ====================
+
+# Upper bound on cached successful validations, and how long (ms) one may be reused
+CONSENT_TOKEN_CACHE_SIZE = int(os.getenv("CONSENT_TOKEN_CACHE_SIZE", 4096))
+CONSENT_TOKEN_CACHE_TTL_MS = int(os.getenv("CONSENT_TOKEN_CACHE_TTL_MS", 1000 * 60 * 5))
+
+# ==================== Revocation Registry ====================
+
+# "memory" (process-local) or "sqlite" (durable, shared by every worker using the same file)
+REVOCATION_BACKEND = os.getenv("REVOCATION_BACKEND", "memory").lower()
+REVOCATION_DB_PATH = os.getenv("REVOCATION_DB_PATH", "hushh_revocations.db")
+
+# ==================== Vault Serialization ====================
+
+# Codec for values written to the vault ("orjson", "msgpack" or "json") and compression
+# ("zstd", "zlib" or "none") applied to encoded values of at least VAULT_COMPRESSION_MIN_BYTES
+VAULT_CODEC = os.getenv("VAULT_CODEC", "orjson").lower()
+VAULT_COMPRESSION = os.getenv("VAULT_COMPRESSION", "zstd").lower()
+VAULT_COMPRESSION_MIN_BYTES = int(os.getenv("VAULT_COMPRESSION_MIN_BYTES", 1024))
+
+# ==================== Vault Store ====================
+
+# SQLite file holding encrypted VaultRecords, and how often (seconds) a background
+# thread hard-deletes expired and soft-deleted rows (0 disables it)
+VAULT_DB_PATH = os.getenv("VAULT_DB_PATH", "hushh_vault.db")
+VAULT_COMPACTION_INTERVAL_S = float(os.getenv("VAULT_COMPACTION_INTERVAL_S", 300))
+
+# ==================== Calendar Agent Memory ====================
+
+# Byte budget across all users' cached context, how long (ms) a decrypted value is reused,
+# and whether saves are batched to the vault store on flush/eviction instead of written through
+CALENDAR_MEMORY_MAX_BYTES = int(os.getenv("CALENDAR_MEMORY_MAX_BYTES", 64 * 1024 * 1024))
+CALENDAR_MEMORY_TTL_MS = int(os.getenv("CALENDAR_MEMORY_TTL_MS", 1000 * 60 * 5))
+CALENDAR_MEMORY_WRITE_BEHIND = os.getenv("CALENDAR_MEMORY_WRITE_BEHIND", "false").lower() == "true"
+
+# Local Google Calendar event index used for incremental sync: keep it in the vault store
+# across restarts, and how many (user, calendar) indexes to hold in memory
+CALENDAR_INDEX_PERSIST = os.getenv("CALENDAR_INDEX_PERSIST", "false").lower() == "true"
+CALENDAR_INDEX_MAX_CALENDARS = int(os.getenv("CALENDAR_INDEX_MAX_CALENDARS", 1024))
+
+# Free-slot search: working hours ("HH:MM-HH:MM", in CALENDAR_TIMEZONE), shortest slot worth
+# offering, and how old (seconds) a synced local event index may be to answer without the server
+CALENDAR_WORKING_HOURS = os.getenv("CALENDAR_WORKING_HOURS", "09:00-17:00")
+CALENDAR_TIMEZONE = os.getenv("CALENDAR_TIMEZONE", "UTC")
+CALENDAR_MIN_SLOT_MINUTES = int(os.getenv("CALENDAR_MIN_SLOT_MINUTES", 30))
+CALENDAR_FREEBUSY_MAX_AGE_S = float(os.getenv("CALENDAR_FREEBUSY_MAX_AGE_S", 300))
+
+# Schedule suggestions: candidate start-time granularity and default buffer around meetings
+# (minutes), and when to involve the LLM: "never", "fallback" (only if no local slot fits)
+# or "explain" (also to phrase the reason for the local pick)
+CALENDAR_SCHEDULE_STEP_MINUTES = int(os.getenv("CALENDAR_SCHEDULE_STEP_MINUTES", 15))
+CALENDAR_SCHEDULE_BUFFER_MINUTES = int(os.getenv("CALENDAR_SCHEDULE_BUFFER_MINUTES", 10))
+CALENDAR_SCHEDULER_LLM = os.getenv("CALENDAR_SCHEDULER_LLM", "fallback").lower()
+
+# ==================== MCP Server ====================
+
+# Calendar MCP server, HTTP timeouts (seconds) and connection pool sizing
+MCP_BASE_URL = os.getenv("MCP_BASE_URL", "http://localhost:3000")
+MCP_CONNECT_TIMEOUT_S = float(os.getenv("MCP_CONNECT_TIMEOUT_S", 3.05))
+MCP_READ_TIMEOUT_S = float(os.getenv("MCP_READ_TIMEOUT_S", 30))
+MCP_POOL_CONNECTIONS = int(os.getenv("MCP_POOL_CONNECTIONS", 10))
+MCP_POOL_MAXSIZE = int(os.getenv("MCP_POOL_MAXSIZE", 32))
+
+# Events requested per page by iter_events / iter_search_events
+MCP_PAGE_SIZE = int(os.getenv("MCP_PAGE_SIZE", 250))
+
+# batch_events: ops per batch-events request, and parallel single calls when the server has no batch tool
+MCP_BATCH_MAX_OPS = int(os.getenv("MCP_BATCH_MAX_OPS", 50))
+MCP_BATCH_CONCURRENCY = int(os.getenv("MCP_BATCH_CONCURRENCY", 8))
+
+# Transport policy: attempts per idempotent read (1 disables retries) with jittered
+# exponential backoff between them (seconds); a per-tool circuit breaker that opens after
+# MCP_BREAKER_FAILURE_THRESHOLD consecutive failures and probes again after MCP_BREAKER_RESET_S;
+# and hedged reads: tools ("a,b") that get a second request if the first has not
+# answered within MCP_HEDGE_DELAY_S
+MCP_TRANSPORT_POLICY_ENABLED = os.getenv("MCP_TRANSPORT_POLICY_ENABLED", "true").lower() == "true"
+MCP_RETRY_MAX_ATTEMPTS = int(os.getenv("MCP_RETRY_MAX_ATTEMPTS", 3))
+MCP_RETRY_BASE_DELAY_S = float(os.getenv("MCP_RETRY_BASE_DELAY_S", 0.1))
+MCP_RETRY_MAX_DELAY_S = float(os.getenv("MCP_RETRY_MAX_DELAY_S", 2))
+MCP_BREAKER_FAILURE_THRESHOLD = int(os.getenv("MCP_BREAKER_FAILURE_THRESHOLD", 5))
+MCP_BREAKER_RESET_S = float(os.getenv("MCP_BREAKER_RESET_S", 30))
+MCP_HEDGE_TOOLS = os.getenv("MCP_HEDGE_TOOLS", "get-freebusy")
+MCP_HEDGE_DELAY_S = float(os.getenv("MCP_HEDGE_DELAY_S", 0.25))
+
+# Response cache for read-only MCP tools: size and per-endpoint TTLs in seconds
+MCP_CACHE_ENABLED = os.getenv("MCP_CACHE_ENABLED", "true").lower() == "true"
+MCP_CACHE_MAX_ENTRIES = int(os.getenv("MCP_CACHE_MAX_ENTRIES", 2048))
+MCP_CACHE_TTL_EVENTS_S = float(os.getenv("MCP_CACHE_TTL_EVENTS_S", 30))
+MCP_CACHE_TTL_CALENDARS_S = float(os.getenv("MCP_CACHE_TTL_CALENDARS_S", 600))
+MCP_CACHE_TTL_COLORS_S = float(os.getenv("MCP_CACHE_TTL_COLORS_S", 3600))
+
+# ==================== LLM Provider ====================
+
+# Provider behind gemini_chat: "gemini", or "stub" for canned local responses (no network,
+# no API key); the model to ask, and the Gemini API key (only needed once Gemini is called)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini").lower()
+LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.5-pro")
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+# ==================== LLM Response Cache ====================
+
+# gemini_chat response cache: "readwrite", or "replay" to answer only from recorded responses
+# (offline); in-memory entries, SQLite file for an opt-in shared disk tier (default "": memory
+# only; responses built from calendar data are stored there unencrypted), and TTLs in seconds -
+# default, parse_time_range and calendar summaries
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "readwrite").lower()
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 1024))
+LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH", "")
+LLM_CACHE_TTL_S = float(os.getenv("LLM_CACHE_TTL_S", 300))
+LLM_CACHE_TTL_PARSE_S = float(os.getenv("LLM_CACHE_TTL_PARSE_S", 86400))
+LLM_CACHE_TTL_SUMMARY_S = float(os.getenv("LLM_CACHE_TTL_SUMMARY_S", 600))
+
+# ==================== LLM Concurrency ====================
+
+# agemini_chat: model calls in flight at once, rate limit (calls per second, with bursts of up
+# to LLM_RATE_BURST), and micro-batching of short prompts - how long (ms) to wait for company,
+# most prompts per batched call, and the longest prompt (characters) worth batching
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 4))
+LLM_RATE_PER_S = float(os.getenv("LLM_RATE_PER_S", 2))
+LLM_RATE_BURST = int(os.getenv("LLM_RATE_BURST", 4))
+LLM_BATCH_WINDOW_MS = float(os.getenv("LLM_BATCH_WINDOW_MS", 20))
+LLM_BATCH_MAX_PROMPTS = int(os.getenv("LLM_BATCH_MAX_PROMPTS", 8))
+LLM_BATCH_MAX_CHARS = int(os.getenv("LLM_BATCH_MAX_CHARS", 600))
+
 # ==================== Environment Info ====================
 
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -35,9 +177,71 @@ HUSHH_HACKATHON = os.getenv("HUSHH_HACKATHON", "disabled").lower() == "enabled"
 
 __all__ = [
     "SECRET_KEY",
+    "SECRET_KEY_ID",
+    "SECRET_KEYS_RETIRED",
     "VAULT_ENCRYPTION_KEY",
+    "VAULT_DEFAULT_ALGORITHM",
     "DEFAULT_CONSENT_TOKEN_EXPIRY_MS",
     "DEFAULT_TRUST_LINK_EXPIRY_MS",
+    "CONSENT_TOKEN_VERSION",
+    "CONSENT_TOKEN_CACHE_SIZE",
+    "CONSENT_TOKEN_CACHE_TTL_MS",
+    "REVOCATION_BACKEND",
+    "REVOCATION_DB_PATH",
+    "VAULT_CODEC",
+    "VAULT_COMPRESSION",
+    "VAULT_COMPRESSION_MIN_BYTES",
+    "VAULT_DB_PATH",
+    "VAULT_COMPACTION_INTERVAL_S",
+    "CALENDAR_MEMORY_MAX_BYTES",
+    "CALENDAR_MEMORY_TTL_MS",
+    "CALENDAR_MEMORY_WRITE_BEHIND",
+    "CALENDAR_INDEX_PERSIST",
+    "CALENDAR_INDEX_MAX_CALENDARS",
+    "CALENDAR_WORKING_HOURS",
+    "CALENDAR_TIMEZONE",
+    "CALENDAR_MIN_SLOT_MINUTES",
+    "CALENDAR_FREEBUSY_MAX_AGE_S",
+    "CALENDAR_SCHEDULE_STEP_MINUTES",
+    "CALENDAR_SCHEDULE_BUFFER_MINUTES",
+    "CALENDAR_SCHEDULER_LLM",
+    "MCP_BASE_URL",
+    "MCP_CONNECT_TIMEOUT_S",
+    "MCP_READ_TIMEOUT_S",
+    "MCP_POOL_CONNECTIONS",
+    "MCP_POOL_MAXSIZE",
+    "MCP_PAGE_SIZE",
+    "MCP_BATCH_MAX_OPS",
+    "MCP_BATCH_CONCURRENCY",
+    "MCP_TRANSPORT_POLICY_ENABLED",
+    "MCP_RETRY_MAX_ATTEMPTS",
+    "MCP_RETRY_BASE_DELAY_S",
+    "MCP_RETRY_MAX_DELAY_S",
+    "MCP_BREAKER_FAILURE_THRESHOLD",
+    "MCP_BREAKER_RESET_S",
+    "MCP_HEDGE_TOOLS",
+    "MCP_HEDGE_DELAY_S",
+    "MCP_CACHE_ENABLED",
+    "MCP_CACHE_MAX_ENTRIES",
+    "MCP_CACHE_TTL_EVENTS_S",
+    "MCP_CACHE_TTL_CALENDARS_S",
+    "MCP_CACHE_TTL_COLORS_S",
+    "LLM_PROVIDER",
+    "LLM_MODEL",
+    "GEMINI_API_KEY",
+    "LLM_CACHE_ENABLED",
+    "LLM_CACHE_MODE",
+    "LLM_CACHE_MAX_ENTRIES",
+    "LLM_CACHE_DB_PATH",
+    "LLM_CACHE_TTL_S",
+    "LLM_CACHE_TTL_PARSE_S",
+    "LLM_CACHE_TTL_SUMMARY_S",
+    "LLM_MAX_CONCURRENCY",
+    "LLM_RATE_PER_S",
+    "LLM_RATE_BURST",
+    "LLM_BATCH_WINDOW_MS",
+    "LLM_BATCH_MAX_PROMPTS",
+    "LLM_BATCH_MAX_CHARS",
     "ENVIRONMENT",
     "AGENT_ID",
     "HUSHH_HACKATHON"
@@ -0,0 +1,157 @@
+# hushh_mcp/consent/compact.py
+#
+# Binary layout for HCT v2 consent tokens.
+#
+#   HCT2:<base64url(body || mac), unpadded>
+#
+#   body = version    u8   4 = single scope, 5 = scope set
+#          key_id     u8   signing key in the keyring
+#          scope      u8   v4: index into ConsentScope
+#                     u32  v5: bitmask, bit i = i-th ConsentScope
+#          agent_code u16  index into KNOWN_AGENT_IDS, or INLINE_AGENT
+#          issued_at  u64  epoch ms
+#          expires_at u64  epoch ms
+#          user_len   u8   + user_id (utf-8)
+#          [agent_len u8   + agent_id (utf-8), only when agent_code == INLINE_AGENT]
+#   mac  = first MAC_LENGTH bytes of HMAC-SHA256(body)
+#
+# All integers are big-endian. Signing lives in consent/token.py; this module only packs and parses.
+#
+# key_id names the signing key in the keyring. Legacy tokens (parsed by validate_token) and
+# trust links created before key IDs have none and are verified with LEGACY_KEY_ID (0).
+# Versions 2 and 3 were never released and are rejected like any other unknown version.
+
+import base64
+import struct
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from hushh_mcp.constants import CONSENT_TOKEN_V2_PREFIX, ConsentScope, KNOWN_AGENT_IDS
+
+VERSION_SINGLE_SCOPE = 4
+VERSION_MULTI_SCOPE = 5
+MAC_LENGTH = 16
+INLINE_AGENT = 0xFFFF
+
+# version -> (header, carries a scope bitmask)
+_LAYOUTS = {
+    VERSION_SINGLE_SCOPE: (struct.Struct(">BBBHQQB"), False),
+    VERSION_MULTI_SCOPE: (struct.Struct(">BBIHQQB"), True),
+}
+_MIN_HEADER = min(header.size for header, _ in _LAYOUTS.values())
+_AGENT_CODES = {agent_id: code for code, agent_id in enumerate(KNOWN_AGENT_IDS)}
+_TOKEN_HEAD = f"{CONSENT_TOKEN_V2_PREFIX}:"
+
+Fields = Tuple[str, str, int, int, int, int]  # user_id, agent_id, scope mask, issued_at, expires_at, key_id
+
+# ========== Scope Bitmasks ==========
+
+_SCOPES = list(ConsentScope)
+if len(_SCOPES) > 32:
+    raise RuntimeError("ConsentScope has outgrown the 32-bit scope mask")
+
+# ConsentScope is a str enum, so this also resolves plain scope strings
+SCOPE_BITS = {scope: 1 << index for index, scope in enumerate(_SCOPES)}
+
+def scope_mask(scopes: Iterable[ConsentScope]) -> int:
+    mask = 0
+    for scope in scopes:
+        mask |= SCOPE_BITS[scope]
+    return mask
+
+@lru_cache(maxsize=256)
+def _scopes_for(mask: int) -> Tuple[ConsentScope, ...]:
+    return tuple(scope for index, scope in enumerate(_SCOPES) if mask >> index & 1)
+
+def scopes_from_mask(mask: int) -> List[ConsentScope]:
+    return list(_scopes_for(mask))
+
+# ========== Packing ==========
+
+def pack_body(
+    user_id: str,
+    agent_id: str,
+    mask: int,
+    issued_at: int,
+    expires_at: int,
+    key_id: int
+) -> bytes:
+    if not mask:
+        raise ValueError("a token must carry at least one scope")
+
+    user_bytes = user_id.encode()
+    if len(user_bytes) > 255:
+        raise ValueError("user_id is too long for a v2 token (max 255 bytes)")
+
+    agent_code = _AGENT_CODES.get(agent_id, INLINE_AGENT)
+    if mask & (mask - 1):
+        version, scope = VERSION_MULTI_SCOPE, mask
+    else:
+        version, scope = VERSION_SINGLE_SCOPE, mask.bit_length() - 1
+    header = _LAYOUTS[version][0]
+    body = header.pack(version, key_id, scope, agent_code, issued_at, expires_at, len(user_bytes))
+    body += user_bytes
+
+    if agent_code == INLINE_AGENT:
+        agent_bytes = agent_id.encode()
+        if len(agent_bytes) > 255:
+            raise ValueError("agent_id is too long for a v2 token (max 255 bytes)")
+        body += bytes((len(agent_bytes),)) + agent_bytes
+    return body
+
+def unpack_body(body: bytes) -> Fields:
+    layout = _LAYOUTS.get(body[0])
+    if layout is None:
+        raise ValueError(f"unsupported token version {body[0]}")
+
+    header, multi_scope = layout
+    _, key_id, scope, agent_code, issued_at, expires_at, user_len = header.unpack_from(body)
+
+    if multi_scope:
+        mask = scope
+        if mask >> len(_SCOPES):
+            raise ValueError("unknown scope bits set")
+    else:
+        if scope >= len(_SCOPES):
+            raise ValueError(f"unknown scope id {scope}")
+        mask = 1 << scope
+
+    offset = header.size
+    user_id = body[offset:offset + user_len].decode()
+    offset += user_len
+
+    if agent_code == INLINE_AGENT:
+        agent_len = body[offset]
+        agent_id = body[offset + 1:offset + 1 + agent_len].decode()
+        offset += 1 + agent_len
+    else:
+        agent_id = KNOWN_AGENT_IDS[agent_code]
+
+    if offset != len(body):
+        raise ValueError("unexpected trailing bytes")
+    return user_id, agent_id, mask, issued_at, expires_at, key_id
+
+def key_id_of(body: bytes) -> int:
+    """Key ID a body claims to be signed with, read before the MAC is checked."""
+    if body[0] not in _LAYOUTS:
+        raise ValueError(f"unsupported token version {body[0]}")
+    return body[1]
+
+# ========== Encoding ==========
+
+def is_compact(token_str: str) -> bool:
+    return token_str.startswith(_TOKEN_HEAD)
+
+def encode(body: bytes, mac: bytes) -> str:
+    return _TOKEN_HEAD + base64.urlsafe_b64encode(body + mac).rstrip(b"=").decode()
+
+def decode(token_str: str) -> Tuple[bytes, bytes]:
+    """Split a v2 token string into (body, mac). Raises ValueError if it is not one."""
+    if not token_str.startswith(_TOKEN_HEAD):
+        raise ValueError("not a v2 token")
+
+    encoded = token_str[len(_TOKEN_HEAD):]
+    raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    if len(raw) < _MIN_HEADER + MAC_LENGTH:
+        raise ValueError("token too short")
+    return raw[:-MAC_LENGTH], raw[-MAC_LENGTH:]
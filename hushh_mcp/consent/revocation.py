@@ -0,0 +1,245 @@
+# hushh_mcp/consent/revocation.py
+
+import hashlib
+import heapq
+import math
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from hushh_mcp.config import REVOCATION_BACKEND, REVOCATION_DB_PATH
+
+# Persistent backends store revoked tokens by SHA-256 digest, never as the bearer string itself.
+
+def token_digest(token_str: str) -> bytes:
+    return hashlib.sha256(token_str.encode()).digest()
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+# ========== Bloom Filter ==========
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over token digests.
+    A negative answer is definitive; a positive one must be confirmed by the store.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, digest: bytes):
+        # Kirsch–Mitzenmacher double hashing over two 64-bit halves of the digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, digest: bytes) -> None:
+        for pos in self._positions(digest):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self._bits
+        for pos in self._positions(digest):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+# ========== Store Interface ==========
+
+class RevocationStore:
+    """
+    Backend for revoke_token / is_token_revoked.
+    Entries carry the token's expires_at and are dropped once it has passed.
+    """
+
+    def add(self, token_str: str, expires_at: int) -> None:
+        raise NotImplementedError
+
+    def contains(self, token_str: str) -> bool:
+        raise NotImplementedError
+
+    def purge_expired(self, now: Optional[int] = None) -> int:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+# ========== In-Memory Backend ==========
+
+class InMemoryRevocationStore(RevocationStore):
+    """Process-local store. Expired entries are pruned lazily via a min-heap on expires_at."""
+
+    def __init__(self):
+        self._entries: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, token_str: str, expires_at: int) -> None:
+        with self._lock:
+            self._purge_locked(_now_ms())
+            self._entries[token_str] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, token_str))
+
+    def contains(self, token_str: str) -> bool:
+        if not self._entries:
+            return False
+        with self._lock:
+            self._purge_locked(_now_ms())
+            return token_str in self._entries
+
+    def purge_expired(self, now: Optional[int] = None) -> int:
+        with self._lock:
+            return self._purge_locked(now if now is not None else _now_ms())
+
+    def _purge_locked(self, now: int) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, token_str = heapq.heappop(heap)
+            if self._entries.get(token_str) == expires_at:
+                del self._entries[token_str]
+                removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+# ========== SQLite Backend ==========
+
+class SQLiteRevocationStore(RevocationStore):
+    """
+    Durable store shared by every process that opens the same database file.
+
+    Lookups consult an in-process Bloom filter first. Rows written by other
+    processes are folded into the filter at most every `refresh_interval_s`
+    seconds, which bounds how stale a "not revoked" answer can be; set it to
+    0 to re-sync on every negative lookup.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS revoked_tokens (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            token_hash BLOB NOT NULL UNIQUE,
+            expires_at INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires_at
+            ON revoked_tokens (expires_at);
+    """
+
+    def __init__(
+        self,
+        path: str = REVOCATION_DB_PATH,
+        refresh_interval_s: float = 1.0,
+        gc_interval_s: float = 60.0,
+        bloom_capacity: int = 100_000,
+        bloom_error_rate: float = 0.001
+    ):
+        self.path = path
+        self.refresh_interval_s = refresh_interval_s
+        self.gc_interval_s = gc_interval_s
+        self._bloom_capacity = bloom_capacity
+        self._bloom_error_rate = bloom_error_rate
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+        with self._lock:
+            self._rebuild_bloom_locked()
+            self._purge_locked(_now_ms())
+
+    def add(self, token_str: str, expires_at: int) -> None:
+        digest = token_digest(token_str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO revoked_tokens (token_hash, expires_at) VALUES (?, ?)",
+                (digest, expires_at)
+            )
+            self._bloom.add(digest)
+            self._maybe_gc_locked()
+
+    def contains(self, token_str: str) -> bool:
+        digest = token_digest(token_str)
+        with self._lock:
+            if digest not in self._bloom:
+                if time.monotonic() - self._last_sync < self.refresh_interval_s:
+                    return False
+                self._sync_bloom_locked()
+                if digest not in self._bloom:
+                    return False
+
+            row = self._conn.execute(
+                "SELECT expires_at FROM revoked_tokens WHERE token_hash = ?",
+                (digest,)
+            ).fetchone()
+            self._maybe_gc_locked()
+            return row is not None and row[0] >= _now_ms()
+
+    def purge_expired(self, now: Optional[int] = None) -> int:
+        with self._lock:
+            return self._purge_locked(now if now is not None else _now_ms())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM revoked_tokens").fetchone()[0]
+
+    # ----- internals (caller holds self._lock) -----
+
+    def _sync_bloom_locked(self) -> None:
+        rows = self._conn.execute(
+            "SELECT id, token_hash FROM revoked_tokens WHERE id > ? ORDER BY id",
+            (self._last_row_id,)
+        ).fetchall()
+        for row_id, digest in rows:
+            self._bloom.add(digest)
+            self._last_row_id = row_id
+        self._last_sync = time.monotonic()
+
+    def _rebuild_bloom_locked(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM revoked_tokens").fetchone()[0]
+        self._bloom = BloomFilter(max(self._bloom_capacity, count * 2), self._bloom_error_rate)
+        self._last_row_id = 0
+        self._sync_bloom_locked()
+
+    def _maybe_gc_locked(self) -> None:
+        if time.monotonic() - self._last_gc >= self.gc_interval_s:
+            self._purge_locked(_now_ms())
+
+    def _purge_locked(self, now: int) -> int:
+        self._last_gc = time.monotonic()
+        removed = self._conn.execute(
+            "DELETE FROM revoked_tokens WHERE expires_at < ?", (now,)
+        ).rowcount
+        # Bloom filters cannot forget; rebuild once enough of it is stale or it is overfull
+        if removed and (removed * 4 >= self._bloom.count or self._bloom.count > self._bloom.capacity):
+            self._rebuild_bloom_locked()
+        return removed
+
+# ========== Factory ==========
+
+def create_revocation_store(
+    backend: str = REVOCATION_BACKEND,
+    path: str = REVOCATION_DB_PATH
+) -> RevocationStore:
+    if backend == "memory":
+        return InMemoryRevocationStore()
+    if backend == "sqlite":
+        return SQLiteRevocationStore(path)
+    raise ValueError(f"Unknown revocation backend: '{backend}' (expected 'memory' or 'sqlite')")
@@ -1,101 +1,353 @@
 # hushh_mcp/consent/token.py
 
 import hmac
-import hashlib
 import base64
 import time
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-from hushh_mcp.config import SECRET_KEY, DEFAULT_CONSENT_TOKEN_EXPIRY_MS
+from hushh_mcp.config import (
+    DEFAULT_CONSENT_TOKEN_EXPIRY_MS,
+    CONSENT_TOKEN_VERSION,
+    CONSENT_TOKEN_CACHE_SIZE,
+    CONSENT_TOKEN_CACHE_TTL_MS
+)
 from hushh_mcp.constants import CONSENT_TOKEN_PREFIX
 from hushh_mcp.types import HushhConsentToken, ConsentScope, UserID, AgentID
+from hushh_mcp.consent.revocation import RevocationStore, create_revocation_store
+from hushh_mcp.consent import compact
+from hushh_mcp.keyring import Keyring, LEGACY_KEY_ID, get_keyring
 
-# ========== Internal Revocation Registry ==========
-_revoked_tokens = set()
+# ========== Revocation Registry ==========
+# Backend is chosen by REVOCATION_BACKEND; swap it at runtime with set_revocation_store()
+_revocation_store: RevocationStore = create_revocation_store()
+
+# ========== Verified Token Cache ==========
+# Successful validations keyed by token string:
+#   token -> (parsed token, reuse deadline in ms, scope mask, keyring that verified it).
+# The deadline never exceeds the token's own expires_at, so expiry is still enforced,
+# and entries verified under a keyring that has since been swapped out are ignored.
+
+_verified_cache: "OrderedDict[str, Tuple[HushhConsentToken, int, int, Keyring]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
 
 # ========== Token Generator ==========
 
+ScopeGrant = Union[ConsentScope, Iterable[ConsentScope]]
+
 def issue_token(
     user_id: UserID,
     agent_id: AgentID,
-    scope: ConsentScope,
-    expires_in_ms: int = DEFAULT_CONSENT_TOKEN_EXPIRY_MS
+    scope: ScopeGrant,
+    expires_in_ms: int = DEFAULT_CONSENT_TOKEN_EXPIRY_MS,
+    version: int = CONSENT_TOKEN_VERSION
 ) -> HushhConsentToken:
+    """
+    Issue a signed consent token. `scope` may be a single ConsentScope or a
+    collection of them; tokens carrying several scopes always use the compact format.
+    """
+    issued_at = int(time.time() * 1000)
+    return _build_token(user_id, agent_id, scope, issued_at, issued_at + expires_in_ms, version)
+
+def issue_tokens(
+    grants: Iterable[Tuple[UserID, AgentID, ScopeGrant]],
+    expires_in_ms: int = DEFAULT_CONSENT_TOKEN_EXPIRY_MS,
+    version: int = CONSENT_TOKEN_VERSION
+) -> List[HushhConsentToken]:
+    """
+    Issue one token per (user_id, agent_id, scope) grant.
+    The whole batch shares a single issued_at timestamp.
+    """
     issued_at = int(time.time() * 1000)
     expires_at = issued_at + expires_in_ms
-    raw = f"{user_id}|{agent_id}|{scope.value}|{issued_at}|{expires_at}"
-    signature = _sign(raw)
+    return [
+        _build_token(user_id, agent_id, scope, issued_at, expires_at, version)
+        for user_id, agent_id, scope in grants
+    ]
 
-    token_string = f"{CONSENT_TOKEN_PREFIX}:{base64.urlsafe_b64encode(raw.encode()).decode()}.{signature}"
+def _build_token(
+    user_id: UserID,
+    agent_id: AgentID,
+    scope: ScopeGrant,
+    issued_at: int,
+    expires_at: int,
+    version: int = 1
+) -> HushhConsentToken:
+    scopes = [ConsentScope(scope)] if isinstance(scope, str) else [ConsentScope(s) for s in scope]
+    mask = compact.scope_mask(scopes)
+    if mask & (mask - 1):
+        version = 2
 
+    key_id = get_keyring().active_key_id
+    if version == 2:
+        body = compact.pack_body(user_id, agent_id, mask, issued_at, expires_at, key_id)
+        mac = _mac(body, key_id)
+        token_string = compact.encode(body, mac)
+        signature = mac.hex()
+    elif version == 1:
+        raw = f"{user_id}|{agent_id}|{scopes[0].value}|{issued_at}|{expires_at}"
+        signature = _sign(raw, key_id)
+        encoded = base64.urlsafe_b64encode(raw.encode()).decode()
+        token_string = f"{CONSENT_TOKEN_PREFIX}:{encoded}.{key_id}.{signature}"
+    else:
+        raise ValueError(f"Unsupported consent token version: {version}")
+
+    granted = compact.scopes_from_mask(mask)
     return HushhConsentToken(
         token=token_string,
         user_id=user_id,
         agent_id=agent_id,
-        scope=scope,
+        scope=granted[0],
+        scopes=granted,
         issued_at=issued_at,
         expires_at=expires_at,
-        signature=signature
+        signature=signature,
+        key_id=key_id
     )
 
 # ========== Token Verifier ==========
 
+ValidationResult = Tuple[bool, Optional[str], Optional[HushhConsentToken]]
+
 def validate_token(
     token_str: str,
-    expected_scope: Optional[ConsentScope] = None
-) -> Tuple[bool, Optional[str], Optional[HushhConsentToken]]:
-    if token_str in _revoked_tokens:
+    expected_scope: Optional[ConsentScope] = None,
+    required_scopes: Optional[Iterable[ConsentScope]] = None
+) -> ValidationResult:
+    """
+    Verify a token and check that it grants `expected_scope` and every scope in
+    `required_scopes`. The signature is checked once and all scopes with one mask test.
+    """
+    if _revocation_store.contains(token_str):
         return False, "Token has been revoked", None
 
+    required = _required_mask(expected_scope, required_scopes)
+    now = int(time.time() * 1000)
+    cached = _cache_get(token_str, now)
+    if cached is not None:
+        return _check_scopes(cached, required)
+
+    return _verify(token_str, required, now)[0]
+
+def validate_tokens(
+    token_strs: List[str],
+    expected_scope: Optional[ConsentScope] = None,
+    required_scopes: Optional[Iterable[ConsentScope]] = None
+) -> List[ValidationResult]:
+    """
+    Validate many tokens in one pass. Results are (valid, reason, token)
+    tuples in input order, identical to what validate_token would return.
+    Duplicate token strings are only verified once per batch.
+    """
+    required = _required_mask(expected_scope, required_scopes)
+    now = int(time.time() * 1000)
+    pending = [t for t in dict.fromkeys(token_strs) if not _revocation_store.contains(t)]
+    cached = _cache_get_many(pending, now)
+
+    seen: Dict[str, ValidationResult] = {}
+    verified: List[Tuple[str, HushhConsentToken, int]] = []
+    for token_str in pending:
+        hit = cached.get(token_str)
+        if hit is not None:
+            seen[token_str] = _check_scopes(hit, required)
+            continue
+
+        result, mask = _verify(token_str, required, now, cache=False)
+        if result[0]:
+            verified.append((token_str, result[2], mask))
+        seen[token_str] = result
+    _cache_put_many(verified, now, get_keyring())
+
+    revoked = (False, "Token has been revoked", None)
+    return [seen.get(token_str, revoked) for token_str in token_strs]
+
+def _required_mask(
+    expected_scope: Optional[ConsentScope],
+    required_scopes: Optional[Iterable[ConsentScope]]
+) -> int:
+    required = compact.scope_mask(required_scopes) if required_scopes else 0
+    if expected_scope:
+        required |= compact.SCOPE_BITS[expected_scope]
+    return required
+
+def _check_scopes(cached: Tuple[HushhConsentToken, int], required: int) -> ValidationResult:
+    token, mask = cached
+    if mask & required != required:
+        return False, "Scope mismatch", None
+    return True, None, token
+
+def _verify(
+    token_str: str,
+    required: int,
+    now: int,
+    cache: bool = True
+) -> Tuple[ValidationResult, int]:
+    """Full verification. Returns the result and, on success, the token's scope mask."""
+    keyring = get_keyring()
     try:
-        prefix, signed_part = token_str.split(":")
-        encoded, signature = signed_part.split(".")
+        if compact.is_compact(token_str):
+            body, mac = compact.decode(token_str)
 
-        if prefix != CONSENT_TOKEN_PREFIX:
-            return False, "Invalid token prefix", None
+            key_id = compact.key_id_of(body)
+            if not keyring.has_key(key_id):
+                return (False, "Unknown signing key", None), 0
 
-        decoded = base64.urlsafe_b64decode(encoded.encode()).decode()
-        user_id, agent_id, scope_str, issued_at_str, expires_at_str = decoded.split("|")
+            if not hmac.compare_digest(mac, _mac(body, key_id, keyring)):
+                return (False, "Invalid signature", None), 0
 
-        raw = f"{user_id}|{agent_id}|{scope_str}|{issued_at_str}|{expires_at_str}"
-        expected_sig = _sign(raw)
+            user_id, agent_id, mask, issued_at, expires_at, _ = compact.unpack_body(body)
+            signature = mac.hex()
+        else:
+            prefix, signed_part = token_str.split(":")
+            parts = signed_part.split(".")
+            if len(parts) == 2:
+                # Issued before key IDs were embedded
+                (encoded, signature), key_id = parts, LEGACY_KEY_ID
+            else:
+                encoded, key_id_str, signature = parts
+                key_id = int(key_id_str)
 
-        if not hmac.compare_digest(signature, expected_sig):
-            return False, "Invalid signature", None
+            if prefix != CONSENT_TOKEN_PREFIX:
+                return (False, "Invalid token prefix", None), 0
 
-        if expected_scope and scope_str != expected_scope.value:
-            return False, "Scope mismatch", None
+            if not keyring.has_key(key_id):
+                return (False, "Unknown signing key", None), 0
 
-        if int(time.time() * 1000) > int(expires_at_str):
-            return False, "Token expired", None
+            decoded = base64.urlsafe_b64decode(encoded.encode()).decode()
+            user_id, agent_id, scope_str, issued_at_str, expires_at_str = decoded.split("|")
 
+            if not hmac.compare_digest(signature, _sign(decoded, key_id, keyring)):
+                return (False, "Invalid signature", None), 0
+
+            mask = compact.SCOPE_BITS[scope_str]
+            issued_at, expires_at = int(issued_at_str), int(expires_at_str)
+
+        if mask & required != required:
+            return (False, "Scope mismatch", None), 0
+
+        if now > expires_at:
+            return (False, "Token expired", None), 0
+
+        scopes = compact.scopes_from_mask(mask)
         token = HushhConsentToken(
             token=token_str,
             user_id=user_id,
             agent_id=agent_id,
-            scope=scope_str,  # can optionally convert to ConsentScope(scope_str)
-            issued_at=int(issued_at_str),
-            expires_at=int(expires_at_str),
-            signature=signature
+            scope=scopes[0],
+            scopes=scopes,
+            issued_at=issued_at,
+            expires_at=expires_at,
+            signature=signature,
+            key_id=key_id
         )
-        return True, None, token
+        if cache:
+            _cache_put_many([(token_str, token, mask)], now, keyring)
+        return (True, None, token), mask
 
     except Exception as e:
-        return False, f"Malformed token: {str(e)}", None
+        return (False, f"Malformed token: {str(e)}", None), 0
 
 # ========== Token Revoker ==========
 
 def revoke_token(token_str: str) -> None:
-    _revoked_tokens.add(token_str)
+    _revocation_store.add(token_str, _peek_expires_at(token_str))
+    with _cache_lock:
+        _verified_cache.pop(token_str, None)
 
 def is_token_revoked(token_str: str) -> bool:
-    return token_str in _revoked_tokens
+    return _revocation_store.contains(token_str)
+
+def set_revocation_store(store: RevocationStore) -> None:
+    global _revocation_store
+    _revocation_store = store
+    clear_token_cache()
+
+def peek_expires_at(token_str: str) -> int:
+    """expires_at (ms) read from a token without verifying it; for bounding cache lifetimes only."""
+    return _peek_expires_at(token_str)
+
+def _peek_expires_at(token_str: str) -> int:
+    # Unverified read of expires_at, used only to schedule garbage collection.
+    # Any token that could ever pass validation carries its real (signed) expiry.
+    try:
+        if compact.is_compact(token_str):
+            return compact.unpack_body(compact.decode(token_str)[0])[4]
+        encoded = token_str.split(":", 1)[1].split(".", 1)[0]
+        return int(base64.urlsafe_b64decode(encoded.encode()).decode().rsplit("|", 1)[1])
+    except Exception:
+        return int(time.time() * 1000) + DEFAULT_CONSENT_TOKEN_EXPIRY_MS
+
+# ========== Cache Helpers ==========
+
+def get_token_cache_stats() -> Dict[str, int]:
+    with _cache_lock:
+        return {
+            "hits": _cache_hits,
+            "misses": _cache_misses,
+            "size": len(_verified_cache),
+            "max_size": CONSENT_TOKEN_CACHE_SIZE
+        }
+
+def clear_token_cache() -> None:
+    global _cache_hits, _cache_misses
+    with _cache_lock:
+        _verified_cache.clear()
+        _cache_hits = 0
+        _cache_misses = 0
+
+def _cache_get(token_str: str, now: int) -> Optional[Tuple[HushhConsentToken, int]]:
+    return _cache_get_many([token_str], now).get(token_str)
+
+def _cache_get_many(token_strs: List[str], now: int) -> Dict[str, Tuple[HushhConsentToken, int]]:
+    global _cache_hits, _cache_misses
+    found: Dict[str, Tuple[HushhConsentToken, int]] = {}
+    keyring = get_keyring()
+    with _cache_lock:
+        for token_str in token_strs:
+            entry = _verified_cache.get(token_str)
+            if entry is None:
+                _cache_misses += 1
+                continue
+
+            token, deadline, mask, verified_by = entry
+            if now > deadline or verified_by is not keyring:
+                # Past its reuse window, expired, or verified under a rotated-out keyring
+                del _verified_cache[token_str]
+                _cache_misses += 1
+                continue
+
+            _verified_cache.move_to_end(token_str)
+            _cache_hits += 1
+            found[token_str] = (token, mask)
+    return found
+
+def _cache_put_many(
+    entries: List[Tuple[str, HushhConsentToken, int]],
+    now: int,
+    keyring: Keyring
+) -> None:
+    if CONSENT_TOKEN_CACHE_SIZE <= 0 or not entries:
+        return
+
+    reuse_until = now + CONSENT_TOKEN_CACHE_TTL_MS
+    with _cache_lock:
+        for token_str, token, mask in entries:
+            # A revocation may have raced with this validation
+            if _revocation_store.contains(token_str):
+                continue
+            _verified_cache[token_str] = (token, min(token.expires_at, reuse_until), mask, keyring)
+            _verified_cache.move_to_end(token_str)
+        while len(_verified_cache) > CONSENT_TOKEN_CACHE_SIZE:
+            _verified_cache.popitem(last=False)
 
 # ========== Internal Signer ==========
 
-def _sign(input_string: str) -> str:
-    return hmac.new(
-        SECRET_KEY.encode(),
-        input_string.encode(),
-        hashlib.sha256
-    ).hexdigest()
\ No newline at end of file
+def _sign(input_string: str, key_id: Optional[int] = None, keyring: Optional[Keyring] = None) -> str:
+    return (keyring or get_keyring()).hexmac(input_string.encode(), key_id)
+
+def _mac(body: bytes, key_id: Optional[int] = None, keyring: Optional[Keyring] = None) -> bytes:
+    # Raw, truncated MAC for compact tokens
+    return (keyring or get_keyring()).mac(body, key_id)[:compact.MAC_LENGTH]
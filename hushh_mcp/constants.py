@@ -4,6 +4,9 @@ from enum import Enum
 
 # ==================== Consent Scopes ====================
 
+# NOTE: compact (v2) tokens encode a scope by its position in this enum.
+# Only ever append new scopes; never reorder or remove existing ones.
+
 class ConsentScope(str, Enum):
     # Vault data access
     VAULT_READ_EMAIL = "vault.read.email"
@@ -25,6 +28,10 @@ class ConsentScope(str, Enum):
     CUSTOM_TEMPORARY = "custom.temporary"
     CUSTOM_SESSION_WRITE = "custom.session.write"
 
+    # Calendar vault access (ChronoAgent)
+    VAULT_READ_CALENDAR = "vault.read.calendar"
+    VAULT_WRITE_CALENDAR = "vault.write.calendar"
+
     @classmethod
     def list(cls):
         return [scope.value for scope in cls]
@@ -32,10 +39,22 @@ class ConsentScope(str, Enum):
 # ==================== Token & Link Prefixes ====================
 
 CONSENT_TOKEN_PREFIX = "HCT"  # Hushh Consent Token
+CONSENT_TOKEN_V2_PREFIX = "HCT2"  # Hushh Consent Token, compact binary format
 TRUST_LINK_PREFIX = "HTL"     # Hushh Trust Link
 AGENT_ID_PREFIX = "agent_"
 USER_ID_PREFIX = "user_"
 
+# ==================== Interned Agent IDs ====================
+
+# Agents listed here are encoded as a 2-byte code in compact (v2) tokens;
+# any other agent ID is carried inline. Append only — codes are positional.
+KNOWN_AGENT_IDS = [
+    "agent_identity",
+    "agent_shopper",
+    "calendar_agent",
+    "chrono_agent",
+]
+
 # ==================== Defaults (used if .env fails to load) ====================
 
 # These are fallbacks — real defaults should come from config.py which loads from .env
@@ -47,9 +66,11 @@ DEFAULT_TRUST_LINK_EXPIRY_MS = 1000 * 60 * 60 * 24 * 30        # 30 days
 __all__ = [
     "ConsentScope",
     "CONSENT_TOKEN_PREFIX",
+    "CONSENT_TOKEN_V2_PREFIX",
     "TRUST_LINK_PREFIX",
     "AGENT_ID_PREFIX",
     "USER_ID_PREFIX",
+    "KNOWN_AGENT_IDS",
     "DEFAULT_CONSENT_TOKEN_EXPIRY_MS",
     "DEFAULT_TRUST_LINK_EXPIRY_MS"
 ]
\ No newline at end of file
@@ -0,0 +1,67 @@
+# hushh_mcp/keyring.py
+
+import hmac
+import hashlib
+from typing import Dict, Mapping, Optional
+
+from hushh_mcp.config import SECRET_KEY, SECRET_KEY_ID, SECRET_KEYS_RETIRED
+
+# Tokens and TrustLinks issued before key IDs existed were signed with this key ID.
+LEGACY_KEY_ID = 0
+
+# ========== Keyring ==========
+
+class Keyring:
+    """
+    HMAC-SHA256 signing keys indexed by a small integer key ID (0-255).
+
+    New signatures always use the active key; verification picks the key named
+    by the token or link in O(1). Each key is set up once as an HMAC prototype
+    and cloned with .copy() per signature.
+    """
+
+    def __init__(self, keys: Mapping[int, str], active_key_id: int):
+        if active_key_id not in keys:
+            raise ValueError(f"Active key ID {active_key_id} is not in the keyring")
+
+        self.active_key_id = active_key_id
+        self._prototypes: Dict[int, "hmac.HMAC"] = {}
+        for key_id, secret in keys.items():
+            if not 0 <= key_id <= 255:
+                raise ValueError(f"Key ID {key_id} must fit in one byte (0-255)")
+            self._prototypes[key_id] = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+    def has_key(self, key_id: int) -> bool:
+        return key_id in self._prototypes
+
+    def mac(self, data: bytes, key_id: Optional[int] = None) -> bytes:
+        mac = self._prototypes[self.active_key_id if key_id is None else key_id].copy()
+        mac.update(data)
+        return mac.digest()
+
+    def hexmac(self, data: bytes, key_id: Optional[int] = None) -> str:
+        mac = self._prototypes[self.active_key_id if key_id is None else key_id].copy()
+        mac.update(data)
+        return mac.hexdigest()
+
+# ========== Default Keyring ==========
+
+def load_keyring() -> Keyring:
+    """Build the keyring from SECRET_KEY / SECRET_KEY_ID plus SECRET_KEYS_RETIRED ("id:key,id:key")."""
+    keys = {SECRET_KEY_ID: SECRET_KEY}
+    for entry in filter(None, (part.strip() for part in SECRET_KEYS_RETIRED.split(","))):
+        key_id, _, secret = entry.partition(":")
+        if len(secret) < 32:
+            raise ValueError(f"❌ Retired key {key_id} in SECRET_KEYS_RETIRED must be at least 32 characters long")
+        keys.setdefault(int(key_id), secret)
+    return Keyring(keys, SECRET_KEY_ID)
+
+_keyring = load_keyring()
+
+def get_keyring() -> Keyring:
+    return _keyring
+
+def set_keyring(keyring: Keyring) -> None:
+    """Swap the process-wide keyring (e.g. after a rotation). Cached verifications are dropped."""
+    global _keyring
+    _keyring = keyring
@@ -1,32 +1,77 @@
 # hushh_mcp/operons/detect_slots.py
 
+import datetime
+from zoneinfo import ZoneInfo
+
+from hushh_mcp.config import CALENDAR_WORKING_HOURS, CALENDAR_MIN_SLOT_MINUTES, CALENDAR_TIMEZONE
 from hushh_mcp.consent.token import validate_token
 from hushh_mcp.constants import ConsentScope
-from hushh_mcp.operons.mcp_adapter import get_freebusy
-from hushh_mcp.agents.calendar_agent.state.memory import CalendarAgentMemory
+from hushh_mcp.operons import mcp_adapter
+from hushh_mcp.operons.freebusy_engine import (
+    DEFAULT_WINDOW_DAYS,
+    find_free_slots,
+    freebusy_response,
+    get_freebusy_engine,
+    timelines_from_freebusy,
+    to_epoch,
+    to_iso
+)
+from hushh_mcp.agents.calendar_agent.state.memory import get_calendar_memory
 from hushh_mcp.agents.calendar_agent.state.gemini_llm import gemini_chat
 from hushh_mcp.agents.calendar_agent.state.prompts import SUMMARIZE_CALENDAR_PROMPT
 
-def detect_available_slots(user_id, consent_token, calendar_ids=None, time_min=None, time_max=None, explain=False):
+def detect_available_slots(
+    user_id,
+    consent_token,
+    calendar_ids=None,
+    time_min=None,
+    time_max=None,
+    explain=False,
+    working_hours=CALENDAR_WORKING_HOURS,
+    min_duration_minutes=CALENDAR_MIN_SLOT_MINUTES,
+    timezone=CALENDAR_TIMEZONE
+):
     """
-    Calls the MCP server's get-freebusy tool to find free/busy slots.
+    Finds free slots of at least `min_duration_minutes` within working hours where
+    every calendar is free. Answered from the local event index when each calendar has
+    a recent sync covering the window (see sync_with_gcal); otherwise from the MCP
+    server's get-freebusy tool. The window defaults to the next DEFAULT_WINDOW_DAYS days.
     """
     valid, reason, parsed = validate_token(consent_token, expected_scope=ConsentScope.AGENT_GCAL_READ)
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
-    free_busy = get_freebusy(
-        user_id=user_id,
-        calendar_ids=calendar_ids or [],
-        time_min=time_min,
-        time_max=time_max
+    tz = ZoneInfo(timezone)
+    if time_min is None:
+        time_min = to_iso(int(datetime.datetime.now(datetime.timezone.utc).timestamp()))
+    if time_max is None:
+        time_max = to_iso(to_epoch(time_min, tz) + DEFAULT_WINDOW_DAYS * 24 * 3600)
+    start, end = to_epoch(time_min, tz), to_epoch(time_max, tz)
+    if start is None or end is None:
+        raise ValueError(f"Invalid time range: {time_min!r} - {time_max!r}")
+
+    timelines = get_freebusy_engine().local_timelines(user_id, calendar_ids or ["primary"], start, end)
+    if timelines is not None:
+        free_busy, source = freebusy_response(timelines, start, end), "local"
+    else:
+        free_busy = mcp_adapter.get_freebusy(
+            user_id=user_id,
+            consent_token=consent_token,
+            calendar_ids=calendar_ids or [],
+            time_min=time_min,
+            time_max=time_max
+        )
+        timelines, source = timelines_from_freebusy(free_busy), "mcp"
+
+    slots = find_free_slots(
+        list(timelines.values()), time_min, time_max, working_hours, min_duration_minutes, timezone
     )
-    memory = CalendarAgentMemory(user_id)
+    memory = get_calendar_memory(user_id)
     memory.save_context("last_free_busy", free_busy)
 
-    result = {"free_busy": free_busy}
+    result = {"free_busy": free_busy, "free_slots": slots, "source": source}
     if explain:
         prompt = SUMMARIZE_CALENDAR_PROMPT.format(events=free_busy)
-        explanation = gemini_chat(prompt)
+        explanation = gemini_chat(prompt, template="summarize_calendar")
         result["explanation"] = explanation
-    return result
\ No newline at end of file
+    return result
@@ -0,0 +1,317 @@
+# hushh_mcp/operons/freebusy_engine.py
+#
+# In-process free/busy computation over locally synced events.
+#
+# Times are parsed once into integer epoch seconds. Each calendar's busy time becomes a
+# BusyTimeline: its event intervals sorted and swept into disjoint, merged intervals held
+# in two parallel arrays, so "busy between a and b" is a bisect plus a slice. Several
+# calendars are combined per query by merging just the slices that fall in the window.
+# Free slots are the gaps of that union inside working-hour windows.
+
+import bisect
+import datetime
+import heapq
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from hushh_mcp.config import (
+    CALENDAR_WORKING_HOURS,
+    CALENDAR_TIMEZONE,
+    CALENDAR_MIN_SLOT_MINUTES,
+    CALENDAR_FREEBUSY_MAX_AGE_S
+)
+from hushh_mcp.agents.calendar_agent.state.event_index import CalendarEventIndex, get_event_index
+
+Interval = Tuple[int, int]  # [start, end) in epoch seconds
+
+# Monday .. Friday, as datetime.weekday()
+WORKING_DAYS = (0, 1, 2, 3, 4)
+
+# Window searched when detect_available_slots is given no time_min / time_max
+DEFAULT_WINDOW_DAYS = 7
+
+# ========== Time Parsing ==========
+
+def to_epoch(value, tz: datetime.tzinfo = datetime.timezone.utc) -> Optional[int]:
+    """
+    Epoch seconds of an RFC 3339 string, a "YYYY-MM-DD" date (midnight in `tz`), a
+    datetime / date, or a number (already epoch seconds). Naive times are read in `tz`.
+    Returns None for anything unparseable.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value) if "T" in value else datetime.date.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime.datetime):
+        if not isinstance(value, datetime.date):
+            return None
+        value = datetime.datetime.combine(value, datetime.time())
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return int(value.timestamp())
+
+def to_iso(epoch: int, tz: datetime.tzinfo = datetime.timezone.utc) -> str:
+    """RFC 3339 string for `epoch` in `tz`; UTC is written with a trailing Z like the Calendar API does."""
+    text = datetime.datetime.fromtimestamp(epoch, tz).isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+def event_interval(event: Dict[str, Any], tz: datetime.tzinfo = datetime.timezone.utc) -> Optional[Interval]:
+    """
+    Busy interval of a Calendar API event, or None if it does not block time:
+    cancelled, marked free ("transparent"), declined by the user, or without valid times.
+    start/end may be {"dateTime": ...}, {"date": ...} (all-day, end exclusive) or plain strings.
+    """
+    if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+        return None
+    for attendee in event.get("attendees") or ():
+        if attendee.get("self") and attendee.get("responseStatus") == "declined":
+            return None
+    start, end = _when(event.get("start"), tz), _when(event.get("end"), tz)
+    if start is None or end is None or end <= start:
+        return None
+    return start, end
+
+def _when(value, tz) -> Optional[int]:
+    if isinstance(value, dict):
+        value = value.get("dateTime") or value.get("date")
+    return to_epoch(value, tz)
+
+def parse_working_hours(value) -> Tuple[int, int]:
+    """"HH:MM-HH:MM" or (start, end) as "HH:MM" strings / hours -> (start, end) in minutes after midnight."""
+    if isinstance(value, str):
+        value = value.split("-")
+    if len(value) != 2:
+        raise ValueError(f"Working hours must be a start and an end, got {value!r}")
+    start, end = (_minutes(part) for part in value)
+    if not 0 <= start < end <= 24 * 60:
+        raise ValueError(f"Invalid working hours {value!r}")
+    return start, end
+
+def _minutes(value) -> int:
+    if isinstance(value, (int, float)):
+        return int(value * 60)
+    hours, _, minutes = value.strip().partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+# ========== Busy Timeline ==========
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort and sweep into disjoint intervals; touching intervals are joined."""
+    merged: List[List[int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+class BusyTimeline:
+    """Disjoint busy intervals in start order, searchable by bisect."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        merged = merge_intervals(intervals)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]], tz: datetime.tzinfo = datetime.timezone.utc) -> "BusyTimeline":
+        intervals = (event_interval(event, tz) for event in events)
+        return cls(interval for interval in intervals if interval is not None)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def busy_between(self, start: int, end: int) -> List[Interval]:
+        """Busy intervals overlapping [start, end), clipped to it."""
+        # First interval that ends after `start`; ends are sorted because intervals are disjoint
+        first = bisect.bisect_right(self.ends, start)
+        last = bisect.bisect_left(self.starts, end, lo=first)
+        return [
+            (max(self.starts[i], start), min(self.ends[i], end))
+            for i in range(first, last)
+        ]
+
+    def is_free(self, start: int, end: int) -> bool:
+        first = bisect.bisect_right(self.ends, start)
+        return first == len(self.starts) or self.starts[first] >= end
+
+def union_busy(timelines: Sequence[BusyTimeline], start: int, end: int) -> List[Interval]:
+    """Merged busy time of several calendars within [start, end)."""
+    if len(timelines) == 1:
+        return timelines[0].busy_between(start, end)
+    slices = heapq.merge(*(timeline.busy_between(start, end) for timeline in timelines))
+    merged: List[List[int]] = []
+    for busy_start, busy_end in slices:
+        if merged and busy_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], busy_end)
+        else:
+            merged.append([busy_start, busy_end])
+    return [(busy_start, busy_end) for busy_start, busy_end in merged]
+
+def working_windows(
+    start: int,
+    end: int,
+    working_hours: Optional[Tuple[int, int]],
+    tz: datetime.tzinfo = datetime.timezone.utc,
+    working_days: Sequence[int] = WORKING_DAYS
+) -> List[Interval]:
+    """The parts of [start, end) inside working hours on working days (in `tz`); the whole range if working_hours is None."""
+    if working_hours is None:
+        return [(start, end)] if start < end else []
+    day = datetime.datetime.fromtimestamp(start, tz).date()
+    last_day = datetime.datetime.fromtimestamp(end, tz).date()
+    open_minutes, close_minutes = working_hours
+    windows = []
+    while day <= last_day:
+        if day.weekday() in working_days:
+            midnight = datetime.datetime.combine(day, datetime.time(), tzinfo=tz)
+            window_start = int((midnight + datetime.timedelta(minutes=open_minutes)).timestamp())
+            window_end = int((midnight + datetime.timedelta(minutes=close_minutes)).timestamp())
+            window_start, window_end = max(window_start, start), min(window_end, end)
+            if window_start < window_end:
+                windows.append((window_start, window_end))
+        day += datetime.timedelta(days=1)
+    return windows
+
+def free_intervals(
+    timelines: Sequence[BusyTimeline],
+    start: int,
+    end: int,
+    working_hours: Optional[Tuple[int, int]] = None,
+    min_duration_s: int = 0,
+    tz: datetime.tzinfo = datetime.timezone.utc,
+    working_days: Sequence[int] = WORKING_DAYS
+) -> List[Interval]:
+    """Gaps of at least `min_duration_s` where every calendar in `timelines` is free."""
+    free = []
+    for window_start, window_end in working_windows(start, end, working_hours, tz, working_days):
+        cursor = window_start
+        for busy_start, busy_end in union_busy(timelines, window_start, window_end):
+            if busy_start - cursor >= max(min_duration_s, 1):
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if window_end - cursor >= max(min_duration_s, 1):
+            free.append((cursor, window_end))
+    return free
+
+def find_free_slots(
+    timelines: Sequence[BusyTimeline],
+    time_min,
+    time_max,
+    working_hours=CALENDAR_WORKING_HOURS,
+    min_duration_minutes: int = CALENDAR_MIN_SLOT_MINUTES,
+    timezone: str = CALENDAR_TIMEZONE,
+    working_days: Sequence[int] = WORKING_DAYS
+) -> List[Dict[str, Any]]:
+    """
+    free_intervals() with string-friendly arguments and results: slots are
+    {"start", "end", "duration_minutes"} with times in `timezone`.
+    working_hours=None searches the whole range.
+    """
+    tz = ZoneInfo(timezone)
+    start, end = to_epoch(time_min, tz), to_epoch(time_max, tz)
+    if start is None or end is None:
+        raise ValueError(f"Invalid time range: {time_min!r} - {time_max!r}")
+    hours = parse_working_hours(working_hours) if working_hours is not None else None
+    return [
+        {"start": to_iso(slot_start, tz), "end": to_iso(slot_end, tz), "duration_minutes": (slot_end - slot_start) // 60}
+        for slot_start, slot_end in free_intervals(
+            timelines, start, end, hours, min_duration_minutes * 60, tz, working_days
+        )
+    ]
+
+def timelines_from_freebusy(response) -> Dict[str, BusyTimeline]:
+    """BusyTimelines from a get-freebusy response: {"calendars": {id: {"busy": [...]}}} or a bare {"busy": [...]}."""
+    response = response or {}
+    calendars = response.get("calendars")
+    if calendars is None:
+        calendars = {"primary": {"busy": response.get("busy", [])}}
+    timelines = {}
+    for calendar_id, entry in calendars.items():
+        intervals = ((to_epoch(busy.get("start")), to_epoch(busy.get("end"))) for busy in (entry or {}).get("busy", []))
+        timelines[calendar_id] = BusyTimeline((s, e) for s, e in intervals if s is not None and e is not None)
+    return timelines
+
+def freebusy_response(timelines: Dict[str, BusyTimeline], start: int, end: int) -> Dict[str, Any]:
+    """The get-freebusy response shape, built from local timelines."""
+    return {
+        "timeMin": to_iso(start),
+        "timeMax": to_iso(end),
+        "calendars": {
+            calendar_id: {"busy": [{"start": to_iso(s), "end": to_iso(e)} for s, e in timeline.busy_between(start, end)]}
+            for calendar_id, timeline in timelines.items()
+        },
+    }
+
+# ========== Engine ==========
+
+class FreeBusyEngine:
+    """
+    BusyTimelines for synced CalendarEventIndexes, rebuilt only when an index's
+    events change. An index can answer a query if its last complete sync covers the
+    query window and is at most `max_age_s` old. All-day events are placed in `timezone`.
+    """
+
+    def __init__(self, max_age_s: float = CALENDAR_FREEBUSY_MAX_AGE_S, timezone: str = CALENDAR_TIMEZONE):
+        self.max_age_s = max_age_s
+        self.tz = ZoneInfo(timezone)
+        self._timelines: "weakref.WeakKeyDictionary[CalendarEventIndex, Tuple[int, BusyTimeline]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def timeline(self, index: CalendarEventIndex) -> BusyTimeline:
+        with self._lock:
+            cached = self._timelines.get(index)
+        if cached is not None and cached[0] == index.version:
+            return cached[1]
+        with index.lock:
+            version = index.version
+            timeline = BusyTimeline.from_events(index.events.values(), self.tz)
+        with self._lock:
+            self._timelines[index] = (version, timeline)
+        return timeline
+
+    def covers(self, index: CalendarEventIndex, start: int, end: int) -> bool:
+        if index.synced_at is None or time.time() - index.synced_at > self.max_age_s:
+            return False
+        if index.time_range is None:
+            return True
+        synced_start, synced_end = (to_epoch(bound) for bound in index.time_range)
+        return (synced_start is None or synced_start <= start) and (synced_end is None or end <= synced_end)
+
+    def local_timelines(
+        self, user_id: str, calendar_ids: Sequence[str], start: int, end: int
+    ) -> Optional[Dict[str, BusyTimeline]]:
+        """Timelines for every calendar, or None if any of them is not synced for [start, end)."""
+        timelines = {}
+        for calendar_id in calendar_ids:
+            index = get_event_index(user_id, calendar_id)
+            if not self.covers(index, start, end):
+                return None
+            timelines[calendar_id] = self.timeline(index)
+        return timelines
+
+_engine: Optional[FreeBusyEngine] = None
+_engine_lock = threading.Lock()
+
+def get_freebusy_engine() -> FreeBusyEngine:
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FreeBusyEngine()
+        return _engine
+
+def set_freebusy_engine(engine: Optional[FreeBusyEngine]) -> None:
+    global _engine
+    with _engine_lock:
+        _engine = engine
@@ -1,34 +1,81 @@
+import requests
+
 from hushh_mcp.consent.token import validate_token
 from hushh_mcp.constants import ConsentScope
-from .mcp_adapter import (
-    list_events,
-    create_event,
-    get_freebusy,
-    list_calendars,
-    list_colors,
-)
-from hushh_mcp.agents.calendar_agent.state.memory import CalendarAgentMemory
-
-def sync_with_gcal(user_id, consent_token, time_range=None, calendar_id=None):
+from hushh_mcp.operons import mcp_adapter
+from hushh_mcp.agents.calendar_agent.state.memory import get_calendar_memory
+from hushh_mcp.agents.calendar_agent.state.event_index import get_event_index
+
+def sync_with_gcal(user_id, consent_token, time_range=None, calendar_id=None, full=False, max_events=None):
     """
-    Fetch events from Google Calendar via MCP.
+    Sync Google Calendar events via MCP into the local per-user event index.
+    After the first (full) sync only changes are fetched, using the server's sync
+    token or an updated-since watermark. Events are streamed page by page into the
+    index; with `max_events` the sync stops early and the next call picks up the rest.
+    Returns what changed, not the full event list; use
+    get_event_index(user_id, calendar_id).events for that (the calendar agent puts
+    it in state["gcal_events"] and this delta in state["gcal_sync_delta"]).
     Requires gcal.read scope.
     """
     valid, reason, parsed = validate_token(consent_token, expected_scope=ConsentScope.AGENT_GCAL_READ)
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
+    time_range = tuple(time_range) if time_range else None
     time_min, time_max = (time_range if time_range else (None, None))
-    events = list_events(
-        user_id=user_id,
-        consent_token=consent_token,
-        calendar_id=calendar_id,
-        time_min=time_min,
-        time_max=time_max,
+    index = get_event_index(user_id, calendar_id or "primary")
+
+    with index.lock:
+        delta = None
+        resume = index.resume
+        if not full and resume is not None and resume["time_range"] == time_range:
+            # Continue the listing a previous, truncated sync stopped in
+            delta = _sync_pass(index, user_id, consent_token, resume["query"], resume["full"],
+                               time_range, max_events, page_token=resume["page_token"])
+        elif not full and index.can_sync_incrementally(time_range):
+            if index.sync_token:
+                # Sync tokens carry the original query; time bounds must not be repeated
+                query = {"calendar_id": calendar_id, "sync_token": index.sync_token}
+            else:
+                query = {"calendar_id": calendar_id, "time_min": time_min, "time_max": time_max,
+                         "updated_min": index.watermark, "show_deleted": True}
+            delta = _sync_pass(index, user_id, consent_token, query, False, time_range, max_events)
+
+        if delta is None:
+            query = {"calendar_id": calendar_id, "time_min": time_min, "time_max": time_max}
+            delta = index.apply_stream(
+                mcp_adapter.iter_events(user_id=user_id, consent_token=consent_token, max_events=max_events, **query),
+                full=True, time_range=time_range, query=query
+            )
+
+    memory = get_calendar_memory(user_id)
+    memory.save_context("last_sync", {
+        "calendar_id": calendar_id or "primary",
+        "full_sync": delta["full_sync"],
+        "truncated": delta["truncated"],
+        "added": len(delta["added"]),
+        "changed": len(delta["changed"]),
+        "removed": len(delta["removed"]),
+        "total": len(index.events),
+    })
+    return delta
+
+def _sync_pass(index, user_id, consent_token, query, full, time_range, max_events, page_token=None):
+    """
+    One streamed listing into `index`. Returns None when the server answers 410
+    (sync or page token expired); the index is reset so the caller does a full sync.
+    """
+    stream = mcp_adapter.iter_events(
+        user_id=user_id, consent_token=consent_token, page_token=page_token, max_events=max_events, **query
     )
-    memory = CalendarAgentMemory(user_id)
-    memory.save_context("last_synced_events", events)
-    return {"events": events}
+    try:
+        # A 410 arrives with the first page, before anything is merged
+        return index.apply_stream(stream, full=full, time_range=time_range, query=query)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 410:
+            raise
+        index.reset()
+        return None
 
 def add_event_to_gcal(user_id, consent_token, event_data, calendar_id=None):
     """
@@ -39,13 +86,13 @@ def add_event_to_gcal(user_id, consent_token, event_data, calendar_id=None):
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
-    result = create_event(
+    result = mcp_adapter.create_event(
         user_id=user_id,
         consent_token=consent_token,
         event_data=event_data,
         calendar_id=calendar_id,
     )
-    memory = CalendarAgentMemory(user_id)
+    memory = get_calendar_memory(user_id)
     memory.save_context("last_created_event", result)
     return {"status": "created", "event": result}
 
@@ -59,14 +106,14 @@ def get_freebusy(user_id, consent_token, time_range, calendar_ids=None):
         raise PermissionError(f"Consent validation failed: {reason}")
 
     time_min, time_max = time_range
-    result = get_freebusy(
+    result = mcp_adapter.get_freebusy(
         user_id=user_id,
         consent_token=consent_token,
         time_min=time_min,
         time_max=time_max,
         calendar_ids=calendar_ids,
     )
-    memory = CalendarAgentMemory(user_id)
+    memory = get_calendar_memory(user_id)
     memory.save_context("last_freebusy_result", result)
     return {"freebusy": result}
 
@@ -79,8 +126,8 @@ def list_calendars(user_id, consent_token):
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
-    result = list_calendars(user_id, consent_token)
-    memory = CalendarAgentMemory(user_id)
+    result = mcp_adapter.list_calendars(user_id, consent_token)
+    memory = get_calendar_memory(user_id)
     memory.save_context("last_listed_calendars", result)
     return {"calendars": result}
 
@@ -93,7 +140,23 @@ def list_colors(user_id, consent_token):
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
-    result = list_colors(user_id, consent_token)
-    memory = CalendarAgentMemory(user_id)
+    result = mcp_adapter.list_colors(user_id, consent_token)
+    memory = get_calendar_memory(user_id)
     memory.save_context("last_listed_colors", result)
-    return {"colors": result}
\ No newline at end of file
+    return {"colors": result}
+
+def batch_events(user_id, consent_token, ops, calendar_id=None):
+    """
+    Create, update and delete many events in one go via MCP.
+    Requires gcal.write scope; consent is checked once for the whole batch.
+    Each op is {"op": "create" | "update" | "delete", ...}; see mcp_client.normalize_ops.
+    """
+    valid, reason, parsed = validate_token(consent_token, expected_scope=ConsentScope.AGENT_GCAL_WRITE)
+    if not valid or parsed.user_id != user_id:
+        raise PermissionError(f"Consent validation failed: {reason}")
+
+    results = mcp_adapter.batch_events(user_id, consent_token, ops, calendar_id)
+    failed = sum(1 for result in results if not result.get("ok"))
+    memory = get_calendar_memory(user_id)
+    memory.save_context("last_batch_results", results)
+    return {"status": "completed" if not failed else "partial", "failed": failed, "results": results}
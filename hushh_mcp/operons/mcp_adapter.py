@@ -1,84 +1,51 @@
-import requests
+# hushh_mcp/operons/mcp_adapter.py
+#
+# Function-style access to the calendar MCP server. Every call goes through the
+# process-wide MCPClient (pooled keep-alive session, timeouts, read cache, and the
+# retry / circuit-breaker / hedging policy from mcp_policy.py); use MCPClient or
+# AsyncMCPClient from mcp_client.py directly for a dedicated or async client.
 
-MCP_BASE_URL = "http://localhost:3000"
+from hushh_mcp.operons.mcp_client import get_mcp_client
 
 def list_calendars(user_id, consent_token):
-    payload = {"user_id": user_id, "consent_token": consent_token}
-    resp = requests.post(f"{MCP_BASE_URL}/list-calendars", json=payload)
-    resp.raise_for_status()
-    return resp.json()
-
-def list_events(user_id, consent_token, calendar_id=None, time_min=None, time_max=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-    }
-    if calendar_id: payload["calendar_id"] = calendar_id
-    if time_min: payload["time_min"] = time_min
-    if time_max: payload["time_max"] = time_max
-    resp = requests.post(f"{MCP_BASE_URL}/list-events", json=payload)
-    resp.raise_for_status()
-    return resp.json()
-
-def search_events(user_id, consent_token, query, calendar_id=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-        "query": query,
-    }
-    if calendar_id: payload["calendar_id"] = calendar_id
-    resp = requests.post(f"{MCP_BASE_URL}/search-events", json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    return get_mcp_client().list_calendars(user_id, consent_token)
+
+def list_events(user_id, consent_token, calendar_id=None, time_min=None, time_max=None,
+                sync_token=None, updated_min=None, show_deleted=None, page_token=None, max_results=None):
+    return get_mcp_client().list_events(
+        user_id, consent_token, calendar_id, time_min, time_max,
+        sync_token, updated_min, show_deleted, page_token, max_results
+    )
+
+def search_events(user_id, consent_token, query, calendar_id=None, page_token=None, max_results=None):
+    return get_mcp_client().search_events(user_id, consent_token, query, calendar_id, page_token, max_results)
+
+def iter_events(user_id, consent_token, calendar_id=None, time_min=None, time_max=None,
+                sync_token=None, updated_min=None, show_deleted=None, page_token=None, max_events=None):
+    return get_mcp_client().iter_events(
+        user_id, consent_token, calendar_id, time_min, time_max,
+        sync_token, updated_min, show_deleted, page_token, max_events=max_events
+    )
+
+def iter_search_events(user_id, consent_token, query, calendar_id=None, page_token=None, max_events=None):
+    return get_mcp_client().iter_search_events(
+        user_id, consent_token, query, calendar_id, page_token, max_events=max_events
+    )
 
 def create_event(user_id, consent_token, event_data, calendar_id=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-        "event_data": event_data,
-    }
-    if calendar_id: payload["calendar_id"] = calendar_id
-    resp = requests.post(f"{MCP_BASE_URL}/create-event", json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    return get_mcp_client().create_event(user_id, consent_token, event_data, calendar_id)
 
 def update_event(user_id, consent_token, event_id, update_data, calendar_id=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-        "event_id": event_id,
-        "update_data": update_data,
-    }
-    if calendar_id: payload["calendar_id"] = calendar_id
-    resp = requests.post(f"{MCP_BASE_URL}/update-event", json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    return get_mcp_client().update_event(user_id, consent_token, event_id, update_data, calendar_id)
 
 def delete_event(user_id, consent_token, event_id, calendar_id=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-        "event_id": event_id,
-    }
-    if calendar_id: payload["calendar_id"] = calendar_id
-    resp = requests.post(f"{MCP_BASE_URL}/delete-event", json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    return get_mcp_client().delete_event(user_id, consent_token, event_id, calendar_id)
 
 def get_freebusy(user_id, consent_token, time_min, time_max, calendar_ids=None):
-    payload = {
-        "user_id": user_id,
-        "consent_token": consent_token,
-        "time_min": time_min,
-        "time_max": time_max,
-    }
-    if calendar_ids: payload["calendar_ids"] = calendar_ids
-    resp = requests.post(f"{MCP_BASE_URL}/get-freebusy", json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    return get_mcp_client().get_freebusy(user_id, consent_token, time_min, time_max, calendar_ids)
 
 def list_colors(user_id, consent_token):
-    payload = {"user_id": user_id, "consent_token": consent_token}
-    resp = requests.post(f"{MCP_BASE_URL}/list-colors", json=payload)
-    resp.raise_for_status()
-    return resp.json()
\ No newline at end of file
+    return get_mcp_client().list_colors(user_id, consent_token)
+
+def batch_events(user_id, consent_token, ops, calendar_id=None):
+    return get_mcp_client().batch_events(user_id, consent_token, ops, calendar_id)
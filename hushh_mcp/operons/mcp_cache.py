@@ -0,0 +1,172 @@
+# hushh_mcp/operons/mcp_cache.py
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from hushh_mcp.config import (
+    MCP_CACHE_MAX_ENTRIES,
+    MCP_CACHE_TTL_EVENTS_S,
+    MCP_CACHE_TTL_CALENDARS_S,
+    MCP_CACHE_TTL_COLORS_S
+)
+from hushh_mcp.consent.token import is_token_revoked, peek_expires_at
+
+# Read-only tools and how long (seconds) a response may be reused
+DEFAULT_TTLS: Dict[str, float] = {
+    "list-events": MCP_CACHE_TTL_EVENTS_S,
+    "search-events": MCP_CACHE_TTL_EVENTS_S,
+    "get-freebusy": MCP_CACHE_TTL_EVENTS_S,
+    "list-calendars": MCP_CACHE_TTL_CALENDARS_S,
+    "list-colors": MCP_CACHE_TTL_COLORS_S,
+}
+
+# Tools that change a user's calendar; any call drops that user's cached reads
+WRITE_TOOLS = frozenset({"create-event", "update-event", "delete-event", "batch-events"})
+
+CacheKey = Tuple[str, str, str, str]  # user_id, consent token digest, tool, normalized arguments
+
+def cache_key(tool: str, payload: Dict[str, Any]) -> CacheKey:
+    """
+    (user_id, sha256 of the consent token, tool, canonical JSON of the remaining arguments).
+    A response is only reused for the token the server accepted it with; revoked and
+    expired tokens are checked again on every hit (see MCPResponseCache.call).
+    """
+    args = {
+        name: sorted(value) if name == "calendar_ids" else value
+        for name, value in payload.items()
+        if name not in ("user_id", "consent_token") and value is not None
+    }
+    token = hashlib.sha256((payload.get("consent_token") or "").encode("utf-8")).hexdigest()
+    return (payload.get("user_id", ""), token, tool,
+            json.dumps(args, sort_keys=True, separators=(",", ":"), default=str))
+
+def _deadline(consent_token: str, ttl: float) -> float:
+    """Monotonic expiry for an entry: the TTL, cut short by the token's own expiry."""
+    token_left_s = (peek_expires_at(consent_token) - time.time() * 1000) / 1000
+    return time.monotonic() + max(0.0, min(ttl, token_left_s))
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+# ========== Response Cache ==========
+
+class MCPResponseCache:
+    """
+    TTL + LRU cache for read-only MCP tool responses, with single-flight loading:
+    concurrent identical calls share one request to the server. Write tools for a
+    user invalidate every cached read for that user, including reads still in flight.
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = MCP_CACHE_MAX_ENTRIES):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._by_user: Dict[str, Set[CacheKey]] = {}
+        self._generations: Dict[str, int] = {}
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def is_cacheable(self, tool: str) -> bool:
+        return self.ttls.get(tool, 0) > 0
+
+    def call(self, tool: str, payload: Dict[str, Any], load: Callable[[], Any]):
+        """Return the response for (tool, payload), calling `load` only on a miss."""
+        if tool in WRITE_TOOLS:
+            try:
+                return load()
+            finally:
+                # Even a failed write may have reached the calendar
+                self.invalidate_user(payload.get("user_id", ""))
+        if not self.is_cacheable(tool):
+            return load()
+
+        key = cache_key(tool, payload)
+        user_id = key[0]
+        token = payload.get("consent_token") or ""
+        if is_token_revoked(token):
+            # Let the server reject it; never answer a revoked token from the cache
+            return load()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                generation = self._generations.get(user_id, 0)
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = load()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                # A write for this user landed mid-flight; the response may predate it
+                if flight.error is None and self._generations.get(user_id, 0) == generation:
+                    self._store_locked(key, flight.result, _deadline(token, self.ttls[tool]))
+            flight.done.set()
+        return flight.result
+
+    def invalidate_user(self, user_id: str) -> int:
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            keys = self._by_user.pop(user_id, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+    def _store_locked(self, key: CacheKey, result: Any, deadline: float) -> None:
+        self._entries[key] = (deadline, result)
+        self._entries.move_to_end(key)
+        self._by_user.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            user_keys = self._by_user.get(evicted[0])
+            if user_keys is not None:
+                user_keys.discard(evicted)
+                if not user_keys:
+                    del self._by_user[evicted[0]]
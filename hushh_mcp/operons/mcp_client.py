@@ -0,0 +1,482 @@
+# hushh_mcp/operons/mcp_client.py
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from hushh_mcp.config import (
+    MCP_BASE_URL,
+    MCP_CONNECT_TIMEOUT_S,
+    MCP_READ_TIMEOUT_S,
+    MCP_POOL_CONNECTIONS,
+    MCP_POOL_MAXSIZE,
+    MCP_CACHE_ENABLED,
+    MCP_TRANSPORT_POLICY_ENABLED,
+    MCP_BATCH_CONCURRENCY,
+    MCP_BATCH_MAX_OPS,
+    MCP_PAGE_SIZE
+)
+from hushh_mcp.operons.mcp_cache import MCPResponseCache
+from hushh_mcp.operons.mcp_policy import TransportPolicy, error_status
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Status codes meaning "this server has no batch-events tool"
+_BATCH_UNSUPPORTED = (404, 405, 501)
+
+# ========== Batch Operations ==========
+#
+# An op is {"op": "create" | "update" | "delete", ...} with the arguments of the matching
+# single-event tool: event_data (create), event_id + update_data (update), event_id (delete),
+# and optionally calendar_id. Results come back in op order as
+# {"ok": True, "result": ...} or {"ok": False, "error": "..."}.
+
+_OP_FIELDS = {
+    "create": ("event_data",),
+    "update": ("event_id", "update_data"),
+    "delete": ("event_id",),
+}
+
+def normalize_ops(ops: List[Dict[str, Any]], calendar_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Check every op up front and apply the batch-wide calendar_id default."""
+    normalized = []
+    for index, op in enumerate(ops):
+        fields = _OP_FIELDS.get(op.get("op"))
+        if fields is None:
+            raise ValueError(f"Batch op {index}: unknown op {op.get('op')!r} (expected create, update or delete)")
+        missing = [field for field in fields if op.get(field) is None]
+        if missing:
+            raise ValueError(f"Batch op {index}: missing {', '.join(missing)}")
+        entry = {"op": op["op"], **{field: op[field] for field in fields}}
+        if op.get("calendar_id") or calendar_id:
+            entry["calendar_id"] = op.get("calendar_id") or calendar_id
+        normalized.append(entry)
+    return normalized
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+def _failure(error: BaseException) -> Dict[str, Any]:
+    return {"ok": False, "error": f"{type(error).__name__}: {error}"}
+
+# ========== Paginated Listings ==========
+
+def split_page(response) -> Tuple[List[dict], Optional[str], Optional[str]]:
+    """(items, nextPageToken, nextSyncToken) of one list/search page; older servers return a bare list."""
+    if isinstance(response, list):
+        return response, None, None
+    response = response or {}
+    return response.get("items", []), response.get("nextPageToken"), response.get("nextSyncToken")
+
+class EventStream:
+    """
+    Events of a paginated listing, fetched one page at a time as iteration proceeds.
+    Stops after `max_events` (setting `truncated`) or as soon as the caller stops
+    iterating; no further pages are requested. `resume_token` is then the page token
+    to start from (with `page_token`) to continue; it re-reads the page that was cut.
+    Once every page has been read, `complete` is True and `next_sync_token` holds
+    the last page's sync token.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[str]], Any],
+        max_events: Optional[int] = None,
+        page_token: Optional[str] = None
+    ):
+        self._fetch_page = fetch_page
+        self.max_events = max_events
+        self.page_token = page_token
+        self.pages = 0
+        self.count = 0
+        self.truncated = False
+        self.complete = False
+        self.resume_token: Optional[str] = page_token
+        self.next_sync_token: Optional[str] = None
+
+    def __iter__(self) -> Iterator[dict]:
+        page_token = self.page_token
+        while True:
+            self.resume_token = page_token
+            if self._exhausted():
+                return
+            items, page_token, sync_token = split_page(self._fetch_page(page_token))
+            self.pages += 1
+            for item in items:
+                if self._exhausted():
+                    return
+                self.count += 1
+                yield item
+            if not page_token:
+                self.complete = True
+                self.next_sync_token = sync_token
+                return
+
+    def _exhausted(self) -> bool:
+        if self.max_events is not None and self.count >= self.max_events:
+            self.truncated = True
+        return self.truncated
+
+class AsyncEventStream(EventStream):
+    """EventStream for AsyncMCPClient; iterate with `async for`."""
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        page_token = self.page_token
+        while True:
+            self.resume_token = page_token
+            if self._exhausted():
+                return
+            items, page_token, sync_token = split_page(await self._fetch_page(page_token))
+            self.pages += 1
+            for item in items:
+                if self._exhausted():
+                    return
+                self.count += 1
+                yield item
+            if not page_token:
+                self.complete = True
+                self.next_sync_token = sync_token
+                return
+
+# ========== Tool Surface ==========
+
+class _MCPTools:
+    """
+    Calendar tools exposed by the MCP server. Each method builds the JSON body and
+    hands it to _call(); MCPClient returns the decoded response, AsyncMCPClient an
+    awaitable of it, so both share one method surface.
+    """
+
+    def _call(self, tool: str, payload: Dict[str, Any]):
+        raise NotImplementedError
+
+    def list_calendars(self, user_id, consent_token):
+        return self._call("list-calendars", {"user_id": user_id, "consent_token": consent_token})
+
+    def list_events(
+        self, user_id, consent_token, calendar_id=None, time_min=None, time_max=None,
+        sync_token=None, updated_min=None, show_deleted=None, page_token=None, max_results=None
+    ):
+        """
+        With `sync_token` (from a previous response's nextSyncToken) only changes since
+        that sync are returned, cancelled events included; the server answers 410 once
+        the token has expired. `updated_min` + `show_deleted` is the watermark equivalent.
+        `page_token` / `max_results` select one page; see iter_events to walk them all.
+        """
+        payload = {"user_id": user_id, "consent_token": consent_token}
+        if calendar_id: payload["calendar_id"] = calendar_id
+        if time_min: payload["time_min"] = time_min
+        if time_max: payload["time_max"] = time_max
+        if sync_token: payload["sync_token"] = sync_token
+        if updated_min: payload["updated_min"] = updated_min
+        if show_deleted is not None: payload["show_deleted"] = show_deleted
+        if page_token: payload["page_token"] = page_token
+        if max_results: payload["max_results"] = max_results
+        return self._call("list-events", payload)
+
+    def search_events(self, user_id, consent_token, query, calendar_id=None, page_token=None, max_results=None):
+        payload = {"user_id": user_id, "consent_token": consent_token, "query": query}
+        if calendar_id: payload["calendar_id"] = calendar_id
+        if page_token: payload["page_token"] = page_token
+        if max_results: payload["max_results"] = max_results
+        return self._call("search-events", payload)
+
+    _stream_class = EventStream
+
+    def iter_events(
+        self, user_id, consent_token, calendar_id=None, time_min=None, time_max=None,
+        sync_token=None, updated_min=None, show_deleted=None, page_token=None,
+        page_size: int = MCP_PAGE_SIZE, max_events: Optional[int] = None
+    ) -> EventStream:
+        """list_events across all pages (from `page_token`, if given), yielded event by event."""
+        return self._stream_class(
+            lambda page_token: self.list_events(
+                user_id, consent_token, calendar_id, time_min, time_max,
+                sync_token, updated_min, show_deleted, page_token, page_size
+            ),
+            max_events,
+            page_token
+        )
+
+    def iter_search_events(
+        self, user_id, consent_token, query, calendar_id=None, page_token=None,
+        page_size: int = MCP_PAGE_SIZE, max_events: Optional[int] = None
+    ) -> EventStream:
+        """search_events across all pages (from `page_token`, if given), yielded event by event."""
+        return self._stream_class(
+            lambda page_token: self.search_events(user_id, consent_token, query, calendar_id, page_token, page_size),
+            max_events,
+            page_token
+        )
+
+    def create_event(self, user_id, consent_token, event_data, calendar_id=None):
+        payload = {"user_id": user_id, "consent_token": consent_token, "event_data": event_data}
+        if calendar_id: payload["calendar_id"] = calendar_id
+        return self._call("create-event", payload)
+
+    def update_event(self, user_id, consent_token, event_id, update_data, calendar_id=None):
+        payload = {
+            "user_id": user_id,
+            "consent_token": consent_token,
+            "event_id": event_id,
+            "update_data": update_data,
+        }
+        if calendar_id: payload["calendar_id"] = calendar_id
+        return self._call("update-event", payload)
+
+    def delete_event(self, user_id, consent_token, event_id, calendar_id=None):
+        payload = {"user_id": user_id, "consent_token": consent_token, "event_id": event_id}
+        if calendar_id: payload["calendar_id"] = calendar_id
+        return self._call("delete-event", payload)
+
+    def get_freebusy(self, user_id, consent_token, time_min, time_max, calendar_ids: Optional[List[str]] = None):
+        payload = {
+            "user_id": user_id,
+            "consent_token": consent_token,
+            "time_min": time_min,
+            "time_max": time_max,
+        }
+        if calendar_ids: payload["calendar_ids"] = calendar_ids
+        return self._call("get-freebusy", payload)
+
+    def list_colors(self, user_id, consent_token):
+        return self._call("list-colors", {"user_id": user_id, "consent_token": consent_token})
+
+    def _single_op(self, user_id, consent_token, op: Dict[str, Any]):
+        calendar_id = op.get("calendar_id")
+        if op["op"] == "create":
+            return self.create_event(user_id, consent_token, op["event_data"], calendar_id)
+        if op["op"] == "update":
+            return self.update_event(user_id, consent_token, op["event_id"], op["update_data"], calendar_id)
+        return self.delete_event(user_id, consent_token, op["event_id"], calendar_id)
+
+# ========== Sync Client ==========
+
+class MCPClient(_MCPTools):
+    """
+    Blocking MCP client over one keep-alive requests.Session.
+    Connections are pooled per host (`pool_connections` hosts, `pool_maxsize`
+    sockets each) and every request carries a (connect, read) timeout.
+    With a `cache`, read-only tools are served through it and writes invalidate it.
+    With a `policy`, each request goes through its retries, circuit breakers and hedging.
+    """
+
+    def __init__(
+        self,
+        base_url: str = MCP_BASE_URL,
+        connect_timeout: float = MCP_CONNECT_TIMEOUT_S,
+        read_timeout: float = MCP_READ_TIMEOUT_S,
+        pool_connections: int = MCP_POOL_CONNECTIONS,
+        pool_maxsize: int = MCP_POOL_MAXSIZE,
+        cache: Optional[MCPResponseCache] = None,
+        policy: Optional[TransportPolicy] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.policy = policy
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.batch_supported: Optional[bool] = None  # learned on the first batch_events call
+
+    def _call(self, tool: str, payload: Dict[str, Any]):
+        if self.cache is not None:
+            return self.cache.call(tool, payload, lambda: self._post(tool, payload))
+        return self._post(tool, payload)
+
+    def _post(self, tool: str, payload: Dict[str, Any]):
+        if self.policy is not None:
+            return self.policy.call(tool, lambda: self._send(tool, payload))
+        return self._send(tool, payload)
+
+    def _send(self, tool: str, payload: Dict[str, Any]):
+        resp = self.session.post(f"{self.base_url}/{tool}", json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def batch_events(
+        self,
+        user_id,
+        consent_token,
+        ops: List[Dict[str, Any]],
+        calendar_id: Optional[str] = None,
+        max_concurrency: int = MCP_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply mixed create/update/delete ops. Sent as batch-events requests of up to
+        MCP_BATCH_MAX_OPS ops; if the server has no such tool, as parallel single-event
+        calls (at most `max_concurrency` in flight). One result per op, in order. If a
+        later batch request fails, its ops get {"ok": False, "error": ...} entries and the
+        results of the batches already applied are kept; only a failure of the first
+        request is raised.
+        """
+        ops = normalize_ops(ops, calendar_id)
+        if not ops:
+            return []
+
+        if self.batch_supported is not False:
+            results = []
+            try:
+                for chunk in _chunks(ops, MCP_BATCH_MAX_OPS):
+                    payload = {"user_id": user_id, "consent_token": consent_token, "operations": chunk}
+                    try:
+                        results.extend(self._call("batch-events", payload)["results"])
+                    except Exception as e:
+                        if not results:
+                            raise
+                        # Earlier chunks are applied; report this one per op instead of losing them
+                        results.extend(_failure(e) for _ in chunk)
+                self.batch_supported = True
+                return results
+            except Exception as e:
+                if error_status(e) not in _BATCH_UNSUPPORTED:
+                    raise
+                self.batch_supported = False
+
+        def run(op):
+            try:
+                return {"ok": True, "result": self._single_op(user_id, consent_token, op)}
+            except Exception as e:
+                return _failure(e)
+
+        if max_concurrency <= 1 or len(ops) == 1:
+            return [run(op) for op in ops]
+        with ThreadPoolExecutor(min(max_concurrency, len(ops))) as pool:
+            return list(pool.map(run, ops))
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "MCPClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# ========== Async Client ==========
+
+class AsyncMCPClient(_MCPTools):
+    """
+    MCPClient's surface over a pooled httpx.AsyncClient; every method returns an
+    awaitable, and iter_events / iter_search_events an AsyncEventStream.
+    httpx has no per-host pools, so the pool holds at most `pool_connections` x
+    `pool_maxsize` sockets in total, as many as MCPClient could keep open.
+    """
+
+    _stream_class = AsyncEventStream
+
+    def __init__(
+        self,
+        base_url: str = MCP_BASE_URL,
+        connect_timeout: float = MCP_CONNECT_TIMEOUT_S,
+        read_timeout: float = MCP_READ_TIMEOUT_S,
+        pool_connections: int = MCP_POOL_CONNECTIONS,
+        pool_maxsize: int = MCP_POOL_MAXSIZE,
+        policy: Optional[TransportPolicy] = None
+    ):
+        if httpx is None:
+            raise RuntimeError("AsyncMCPClient requires httpx (pip install httpx)")
+        self.base_url = base_url.rstrip("/")
+        self.policy = policy
+        self.batch_supported: Optional[bool] = None
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_connections * pool_maxsize,
+                max_keepalive_connections=pool_connections * pool_maxsize
+            )
+        )
+
+    async def _call(self, tool: str, payload: Dict[str, Any]):
+        if self.policy is not None:
+            return await self.policy.acall(tool, lambda: self._send(tool, payload))
+        return await self._send(tool, payload)
+
+    async def _send(self, tool: str, payload: Dict[str, Any]):
+        resp = await self.client.post(f"/{tool}", json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def batch_events(
+        self,
+        user_id,
+        consent_token,
+        ops: List[Dict[str, Any]],
+        calendar_id: Optional[str] = None,
+        max_concurrency: int = MCP_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Async MCPClient.batch_events."""
+        ops = normalize_ops(ops, calendar_id)
+        if not ops:
+            return []
+
+        if self.batch_supported is not False:
+            results = []
+            try:
+                for chunk in _chunks(ops, MCP_BATCH_MAX_OPS):
+                    payload = {"user_id": user_id, "consent_token": consent_token, "operations": chunk}
+                    try:
+                        results.extend((await self._call("batch-events", payload))["results"])
+                    except Exception as e:
+                        if not results:
+                            raise
+                        # Earlier chunks are applied; report this one per op instead of losing them
+                        results.extend(_failure(e) for _ in chunk)
+                self.batch_supported = True
+                return results
+            except Exception as e:
+                if error_status(e) not in _BATCH_UNSUPPORTED:
+                    raise
+                self.batch_supported = False
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(op):
+            async with semaphore:
+                try:
+                    return {"ok": True, "result": await self._single_op(user_id, consent_token, op)}
+                except Exception as e:
+                    return _failure(e)
+
+        return list(await asyncio.gather(*(run(op) for op in ops)))
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+# ========== Default Client ==========
+
+_client: Optional[MCPClient] = None
+_client_lock = threading.Lock()
+
+def get_mcp_client() -> MCPClient:
+    """Process-wide MCPClient, created on first use so connections are reused across calls."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = MCPClient(
+                cache=MCPResponseCache() if MCP_CACHE_ENABLED else None,
+                policy=TransportPolicy() if MCP_TRANSPORT_POLICY_ENABLED else None
+            )
+        return _client
+
+def set_mcp_client(client: Optional[MCPClient]) -> None:
+    """Swap the process-wide client (None recreates it from config on next use)."""
+    global _client
+    with _client_lock:
+        _client = client
@@ -0,0 +1,309 @@
+# hushh_mcp/operons/mcp_policy.py
+#
+# How MCP calls behave when the server is slow or failing:
+#   - idempotent reads are retried on transient errors with jittered exponential backoff
+#   - each tool endpoint (POST /<tool>) has a circuit breaker; while it is open calls
+#     fail fast with CircuitOpenError, and after a cool-down one probe is let through
+#   - latency-critical reads can be hedged: if the first request has not answered
+#     within a delay, a second one is sent and whichever succeeds first wins
+# Writes are never retried or hedged: a failed write may still have reached the calendar.
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+import requests
+
+from hushh_mcp.config import (
+    MCP_RETRY_MAX_ATTEMPTS,
+    MCP_RETRY_BASE_DELAY_S,
+    MCP_RETRY_MAX_DELAY_S,
+    MCP_BREAKER_FAILURE_THRESHOLD,
+    MCP_BREAKER_RESET_S,
+    MCP_HEDGE_TOOLS,
+    MCP_HEDGE_DELAY_S,
+    MCP_POOL_MAXSIZE
+)
+from hushh_mcp.operons.mcp_cache import DEFAULT_TTLS
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Tools that never change the calendar, so repeating them is safe
+IDEMPOTENT_TOOLS = frozenset(DEFAULT_TTLS)
+
+# Statuses worth retrying: throttling and server-side failures
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by a requests / httpx error, if any."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+def is_transient(error: BaseException) -> bool:
+    """Connection failures, timeouts and TRANSIENT_STATUSES; other errors are the caller's problem."""
+    status = error_status(error)
+    if status is not None:
+        return status in TRANSIENT_STATUSES
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return httpx is not None and isinstance(error, httpx.TransportError)
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, tool: str, retry_in_s: float):
+        super().__init__(f"MCP endpoint '{tool}' is unavailable (circuit open, next probe in {retry_in_s:.1f}s)")
+        self.tool = tool
+        self.retry_in_s = retry_in_s
+
+# ========== Backoff ==========
+
+class RetryPolicy:
+    """Up to `max_attempts` tries; before try n+1 wait uniform(0, min(max_delay_s, base_delay_s * 2**n))."""
+
+    def __init__(
+        self,
+        max_attempts: int = MCP_RETRY_MAX_ATTEMPTS,
+        base_delay_s: float = MCP_RETRY_BASE_DELAY_S,
+        max_delay_s: float = MCP_RETRY_MAX_DELAY_S,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self._rng = rng or random.Random()
+
+    def backoff(self, attempt: int) -> float:
+        """Delay after failed attempt `attempt` (0-based). Full jitter keeps retrying workers from syncing up."""
+        return self._rng.uniform(0, min(self.max_delay_s, self.base_delay_s * (2 ** attempt)))
+
+# ========== Circuit Breaker ==========
+
+class CircuitBreaker:
+    """
+    closed: calls pass; `failure_threshold` consecutive failures open the circuit.
+    open: calls are rejected until `reset_timeout_s` has passed, then it is half-open.
+    half-open: one probe call passes (others are rejected); success closes the
+    circuit, failure opens it for another `reset_timeout_s`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        tool: str,
+        failure_threshold: int = MCP_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout_s: float = MCP_BREAKER_RESET_S,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.tool = tool
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout_s:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError. Every admitted call must end in record_success/record_failure."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            waited = self._clock() - self._opened_at
+            if self._state == self.OPEN and waited >= self.reset_timeout_s:
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(self.tool, max(0.0, self.reset_timeout_s - waited))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._probing = False
+
+# ========== Transport Policy ==========
+
+def _parse_tools(tools) -> frozenset:
+    if isinstance(tools, str):
+        tools = tools.split(",")
+    return frozenset(tool.strip() for tool in tools if tool.strip())
+
+class TransportPolicy:
+    """
+    Retry, circuit-breaker and hedging rules shared by every call of one MCP client.
+    call() wraps a blocking request, acall() an async one. Hedging only applies to
+    idempotent tools in `hedge_tools`; a blocking request that loses a hedge race is
+    left to finish in the background.
+    """
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        failure_threshold: int = MCP_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout_s: float = MCP_BREAKER_RESET_S,
+        hedge_tools: Iterable[str] = MCP_HEDGE_TOOLS,
+        hedge_delay_s: float = MCP_HEDGE_DELAY_S,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.hedge_tools = _parse_tools(hedge_tools) & IDEMPOTENT_TOOLS
+        self.hedge_delay_s = hedge_delay_s
+        self._clock = clock
+        self._sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.hedges = 0
+        self.rejected = 0
+
+    def breaker(self, tool: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(tool)
+            if breaker is None:
+                breaker = self._breakers[tool] = CircuitBreaker(
+                    tool, self.failure_threshold, self.reset_timeout_s, self._clock
+                )
+            return breaker
+
+    def call(self, tool: str, send: Callable[[], Any]):
+        """Run `send` (one request to `tool`) under this policy."""
+        attempts = self.retry.max_attempts if tool in IDEMPOTENT_TOOLS else 1
+        breaker = self.breaker(tool)
+        for attempt in range(attempts):
+            self._admit(breaker)
+            try:
+                result = self._hedged(send) if tool in self.hedge_tools else send()
+            except Exception as e:
+                if not self._failed(breaker, e, attempt, attempts):
+                    raise
+                self._sleep(self.retry.backoff(attempt))
+                continue
+            breaker.record_success()
+            return result
+
+    async def acall(self, tool: str, send: Callable[[], Awaitable[Any]]):
+        """call() for a coroutine-returning `send`."""
+        attempts = self.retry.max_attempts if tool in IDEMPOTENT_TOOLS else 1
+        breaker = self.breaker(tool)
+        for attempt in range(attempts):
+            self._admit(breaker)
+            try:
+                result = await (self._ahedged(send) if tool in self.hedge_tools else send())
+            except Exception as e:
+                if not self._failed(breaker, e, attempt, attempts):
+                    raise
+                await asyncio.sleep(self.retry.backoff(attempt))
+                continue
+            breaker.record_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "hedges": self.hedges,
+                "rejected": self.rejected,
+                "open": sorted(tool for tool, b in self._breakers.items() if b.state != CircuitBreaker.CLOSED),
+            }
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+
+    # ----- internals -----
+
+    def _admit(self, breaker: CircuitBreaker) -> None:
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            self._count("rejected")
+            raise
+
+    def _failed(self, breaker: CircuitBreaker, error: BaseException, attempt: int, attempts: int) -> bool:
+        """Record the outcome of a failed attempt; True if it should be retried."""
+        if not is_transient(error):
+            # The endpoint answered; the request itself was bad (4xx, 410, ...)
+            breaker.record_success()
+            return False
+        breaker.record_failure()
+        if attempt + 1 >= attempts:
+            return False
+        self._count("retries")
+        return True
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _hedged(self, send: Callable[[], Any]):
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(MCP_POOL_MAXSIZE, thread_name_prefix="mcp-hedge")
+            pool = self._hedge_pool
+        first = pool.submit(send)
+        done, _ = wait([first], timeout=self.hedge_delay_s)
+        if done:
+            return first.result()
+
+        self._count("hedges")
+        pending = {first, pool.submit(send)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _ahedged(self, send: Callable[[], Awaitable[Any]]):
+        first = asyncio.ensure_future(send())
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_delay_s)
+        if done:
+            return first.result()
+
+        self._count("hedges")
+        pending = {first, asyncio.ensure_future(send())}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -20,7 +20,7 @@ def reschedule_task(user_id, consent_token, calendar_id, event_id, new_time, rea
         conflicts=conflicts or "None"
     )
     import json
-    suggestion_text = gemini_chat(prompt)
+    suggestion_text = gemini_chat(prompt, template="reschedule_task")
     try:
         suggestion = json.loads(suggestion_text)
     except Exception:
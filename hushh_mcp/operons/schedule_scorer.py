@@ -0,0 +1,202 @@
+# hushh_mcp/operons/schedule_scorer.py
+#
+# Deterministic ranking of meeting times inside free slots.
+#
+# Candidates start every `step` minutes within each free slot. Times overlapping a
+# do-not-disturb window are never offered; the rest are scored 0..1 per criterion and
+# combined with WEIGHTS:
+#   preferred - share of the meeting inside preferred hours
+#   buffer    - breathing room to the neighbouring meetings (up to buffer_minutes each side)
+#   fit       - avoids leaving gaps too short to use (< min_slot_minutes) next to the meeting
+#   focus     - share of the meeting outside focus blocks
+#   early     - earlier in the search window, as a tie-breaker
+#
+# Preferences (all optional except the duration):
+#   duration_minutes | duration ("1h", "90m", "1h30m")
+#   preferred_hours, focus_blocks, do_not_disturb: "HH:MM-HH:MM" (daily, in `timezone`),
+#       {"start": ..., "end": ...} (one-off), or a list of those
+#   buffer_minutes, min_slot_minutes, step_minutes, working_hours, timezone,
+#   max_suggestions, weights ({criterion: weight})
+
+import datetime
+import re
+from typing import Any, Dict, Iterable, List
+from zoneinfo import ZoneInfo
+
+from hushh_mcp.config import (
+    CALENDAR_WORKING_HOURS,
+    CALENDAR_TIMEZONE,
+    CALENDAR_MIN_SLOT_MINUTES,
+    CALENDAR_SCHEDULE_STEP_MINUTES,
+    CALENDAR_SCHEDULE_BUFFER_MINUTES
+)
+from hushh_mcp.operons.freebusy_engine import (
+    BusyTimeline,
+    Interval,
+    parse_working_hours,
+    to_epoch,
+    to_iso,
+    working_windows
+)
+
+WEIGHTS = {"preferred": 3.0, "buffer": 2.0, "fit": 1.5, "focus": 4.0, "early": 0.5}
+
+ALL_DAYS = tuple(range(7))
+
+_DAY_S = 24 * 3600
+
+_DURATION = re.compile(
+    r"^\s*(?:(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h))?\s*(?:(\d+)\s*(?:minutes?|mins?|m))?\s*$", re.IGNORECASE
+)
+
+def parse_duration_minutes(value) -> int:
+    """45, "45", "45m", "1h", "1.5h", "1h30m", "2 hours", "1 hr 30 mins" -> minutes."""
+    if isinstance(value, (int, float)):
+        minutes = int(value)
+    elif isinstance(value, str) and value.strip().isdigit():
+        minutes = int(value)
+    else:
+        match = _DURATION.match(value or "") if isinstance(value, str) else None
+        if not match or not any(match.groups()):
+            raise ValueError(f"Invalid duration {value!r}")
+        minutes = int(float(match.group(1) or 0) * 60) + int(match.group(2) or 0)
+    if minutes <= 0:
+        raise ValueError(f"Duration must be positive, got {value!r}")
+    return minutes
+
+# ========== Preferences ==========
+
+class SchedulePreferences:
+    """A user_preferences dict, validated and converted to seconds / minute ranges once."""
+
+    def __init__(self, preferences: Dict[str, Any]):
+        duration = preferences.get("duration_minutes", preferences.get("duration"))
+        if duration is None:
+            raise ValueError("Preferences need a duration (duration_minutes or duration)")
+        self.duration_s = parse_duration_minutes(duration) * 60
+        self.buffer_s = int(preferences.get("buffer_minutes", CALENDAR_SCHEDULE_BUFFER_MINUTES)) * 60
+        self.min_slot_s = int(preferences.get("min_slot_minutes", CALENDAR_MIN_SLOT_MINUTES)) * 60
+        self.step_s = max(1, int(preferences.get("step_minutes", CALENDAR_SCHEDULE_STEP_MINUTES))) * 60
+        working_hours = preferences.get("working_hours", CALENDAR_WORKING_HOURS)
+        self.working_hours = parse_working_hours(working_hours) if working_hours else None
+        self.tz = ZoneInfo(preferences.get("timezone") or CALENDAR_TIMEZONE)
+        self.max_suggestions = int(preferences.get("max_suggestions", 3))
+        self.weights = {**WEIGHTS, **preferences.get("weights", {})}
+        self.preferred = _ranges(preferences.get("preferred_hours"))
+        self.focus = _ranges(preferences.get("focus_blocks"))
+        self.do_not_disturb = _ranges(preferences.get("do_not_disturb"))
+
+def _ranges(value) -> List[Any]:
+    """Normalize to a list of (start_minute, end_minute) daily ranges and {"start", "end"} one-offs."""
+    if not value:
+        return []
+    if isinstance(value, (str, dict)):
+        value = [value]
+    return [item if isinstance(item, dict) else parse_working_hours(item) for item in value]
+
+def _expand(ranges: List[Any], start: int, end: int, tz) -> BusyTimeline:
+    """The ranges as absolute intervals over [start, end)."""
+    intervals: List[Interval] = []
+    for item in ranges:
+        if isinstance(item, dict):
+            item_start, item_end = to_epoch(item.get("start"), tz), to_epoch(item.get("end"), tz)
+            if item_start is not None and item_end is not None:
+                intervals.append((item_start, item_end))
+        else:
+            intervals.extend(working_windows(start, end, item, tz, ALL_DAYS))
+    return BusyTimeline(intervals)
+
+def _overlap(timeline: BusyTimeline, start: int, end: int) -> int:
+    return sum(busy_end - busy_start for busy_start, busy_end in timeline.busy_between(start, end))
+
+# ========== Ranking ==========
+
+class Candidate:
+    __slots__ = ("start", "end", "score", "parts")
+
+    def __init__(self, start: int, end: int, score: float, parts: Dict[str, float]):
+        self.start = start
+        self.end = end
+        self.score = score
+        self.parts = parts
+
+def rank_slots(free: Iterable[Interval], preferences: SchedulePreferences, start: int, end: int) -> List[Candidate]:
+    """Best `max_suggestions` candidates within the `free` intervals of the [start, end) window."""
+    prefs = preferences
+    preferred = _expand(prefs.preferred, start, end, prefs.tz)
+    focus = _expand(prefs.focus, start, end, prefs.tz)
+    do_not_disturb = _expand(prefs.do_not_disturb, start, end, prefs.tz)
+    # Free-slot edges on a working-hours boundary do not border a meeting and need no buffer.
+    # Windows are taken over a wider range so that edges merely clipped to [start, end) (e.g. a
+    # window spanning just the given free slots) are not mistaken for working-hours boundaries.
+    boundaries = set()
+    if prefs.working_hours is not None:
+        for window_start, window_end in working_windows(start - _DAY_S, end + _DAY_S, prefs.working_hours, prefs.tz):
+            boundaries.update(edge for edge in (window_start, window_end) if start <= edge <= end)
+
+    weights = prefs.weights
+    total_weight = sum(weights.values()) or 1.0
+    span = max(1, end - start)
+    duration = prefs.duration_s
+    candidates = []
+    for free_start, free_end in free:
+        # Start on the step grid (in the user's timezone offset, so :00 / :15 / ...)
+        offset = int(datetime.datetime.fromtimestamp(free_start, prefs.tz).utcoffset().total_seconds())
+        slot_start = free_start + (-(free_start + offset)) % prefs.step_s
+        while slot_start + duration <= free_end:
+            slot_end = slot_start + duration
+            if do_not_disturb.is_free(slot_start, slot_end):
+                parts = {
+                    "preferred": _overlap(preferred, slot_start, slot_end) / duration if prefs.preferred else 1.0,
+                    "buffer": _buffer_score(slot_start - free_start, free_start in boundaries,
+                                            free_end - slot_end, free_end in boundaries, prefs.buffer_s),
+                    "fit": _fit_score(slot_start - free_start, free_end - slot_end, prefs),
+                    "focus": 1.0 - _overlap(focus, slot_start, slot_end) / duration,
+                    "early": 1.0 - (slot_start - start) / span,
+                }
+                score = sum(weights.get(name, 0) * value for name, value in parts.items()) / total_weight
+                candidates.append(Candidate(slot_start, slot_end, score, parts))
+            slot_start += prefs.step_s
+
+    candidates.sort(key=lambda candidate: (-candidate.score, candidate.start))
+    return candidates[:prefs.max_suggestions]
+
+def _buffer_score(before: int, before_open: bool, after: int, after_open: bool, buffer_s: int) -> float:
+    if buffer_s <= 0:
+        return 1.0
+    before = buffer_s if before_open else min(before, buffer_s)
+    after = buffer_s if after_open else min(after, buffer_s)
+    return (before + after) / (2 * buffer_s)
+
+def _fit_score(before: int, after: int, prefs: SchedulePreferences) -> float:
+    if prefs.min_slot_s <= 0:
+        return 1.0
+    # Gaps longer than a buffer but too short for another meeting are wasted time
+    wasted = sum(gap for gap in (before, after) if prefs.buffer_s < gap < prefs.min_slot_s)
+    return 1.0 - wasted / (2 * prefs.min_slot_s)
+
+def describe(candidate: Candidate, preferences: SchedulePreferences) -> str:
+    """One-sentence reason for a pick, built from its score parts."""
+    local_start = datetime.datetime.fromtimestamp(candidate.start, preferences.tz)
+    local_end = datetime.datetime.fromtimestamp(candidate.end, preferences.tz)
+    minutes = (candidate.end - candidate.start) // 60
+    reasons = [f"{minutes}-minute slot on {local_start:%a %d %b} {local_start:%H:%M}-{local_end:%H:%M}"]
+    parts = candidate.parts
+    if preferences.preferred:
+        reasons.append("within preferred hours" if parts["preferred"] >= 1.0 else
+                       f"{parts['preferred']:.0%} within preferred hours")
+    if preferences.buffer_s:
+        reasons.append("with buffers before and after" if parts["buffer"] >= 1.0 else "with a reduced buffer")
+    if preferences.focus:
+        reasons.append("clear of focus time" if parts["focus"] >= 1.0 else "overlapping some focus time")
+    if parts["fit"] >= 1.0:
+        reasons.append("leaving no unusable gaps")
+    return ", ".join(reasons) + "."
+
+def suggestion(candidate: Candidate, preferences: SchedulePreferences) -> Dict[str, Any]:
+    return {
+        "suggested_time": to_iso(candidate.start, preferences.tz),
+        "end_time": to_iso(candidate.end, preferences.tz),
+        "score": round(candidate.score, 4),
+        "reason": describe(candidate, preferences),
+    }
@@ -1,26 +1,89 @@
 # hushh_mcp/operons/suggest_schedule.py
+from hushh_mcp.config import CALENDAR_SCHEDULER_LLM
 from hushh_mcp.consent.token import validate_token
 from hushh_mcp.constants import ConsentScope
-from hushh_mcp.agents.calendar_agent.state.prompts import SUGGEST_SCHEDULE_PROMPT
+from hushh_mcp.agents.calendar_agent.state.prompts import SUGGEST_SCHEDULE_PROMPT, EXPLAIN_SCHEDULE_PROMPT
 from hushh_mcp.agents.calendar_agent.state.gemini_llm import gemini_chat
+from hushh_mcp.operons.freebusy_engine import free_intervals, timelines_from_freebusy, to_epoch
+from hushh_mcp.operons.schedule_scorer import SchedulePreferences, rank_slots, suggestion
 import json
 
-def suggest_optimal_schedule(user_id, consent_token, free_busy, user_preferences):
+# Used when the preferences do not say how long the task takes
+DEFAULT_PREFERENCES = {"duration_minutes": 60}
+
+def suggest_optimal_schedule(user_id, consent_token, free_busy, user_preferences, llm=CALENDAR_SCHEDULER_LLM):
     """
-    Uses LLM to suggest a schedule based on free/busy slots (from get-freebusy) and user preferences.
+    Suggests a time for a task from free/busy data and user preferences.
+    Candidate times are ranked locally (see schedule_scorer); the LLM is only asked
+    when nothing fits and llm is "fallback" / "explain", or to phrase the reason when
+    llm is "explain". `free_busy` may be a detect_available_slots result, a list of
+    {"start", "end"} free slots, or a get-freebusy response.
     """
     valid, reason, parsed = validate_token(consent_token, expected_scope=ConsentScope.AGENT_GCAL_READ)
     if not valid or parsed.user_id != user_id:
         raise PermissionError(f"Consent validation failed: {reason}")
 
+    user_preferences = user_preferences or {}
+    try:
+        preferences = SchedulePreferences({**DEFAULT_PREFERENCES, **user_preferences}
+                                          if "duration" not in user_preferences else user_preferences)
+    except ValueError as e:
+        # e.g. a duration such as "half an hour": the LLM fallback can still read it
+        preferences, no_slot_reason = None, f"Could not read the preferences: {e}."
+    else:
+        no_slot_reason = "No free slot fits the requested duration and constraints."
+    free, window = _free_intervals(free_busy, preferences) if preferences else ([], None)
+    ranked = rank_slots(free, preferences, *window) if window else []
+
+    if ranked:
+        best, *alternatives = [suggestion(candidate, preferences) for candidate in ranked]
+        result = {**best, "alternatives": alternatives, "source": "local"}
+        if llm == "explain":
+            result["reason"] = gemini_chat(EXPLAIN_SCHEDULE_PROMPT.format(
+                task_description=user_preferences.get("task", "No task provided"),
+                suggested_time=best["suggested_time"],
+                end_time=best["end_time"],
+                notes=best["reason"],
+                preferences=user_preferences
+            ), template="explain_schedule")
+        return result
+
+    if llm not in ("fallback", "explain"):
+        return {"suggested_time": None, "reason": no_slot_reason, "alternatives": [], "source": "local"}
+
     prompt = SUGGEST_SCHEDULE_PROMPT.format(
         task_description=user_preferences.get("task", "No task provided"),
         free_slots=free_busy,
         preferences=user_preferences
     )
-    suggestion_text = gemini_chat(prompt)
+    suggestion_text = gemini_chat(prompt, template="suggest_schedule")
     try:
-        suggestion = json.loads(suggestion_text)
+        result = json.loads(suggestion_text)
     except Exception:
-        suggestion = {"suggested_time": None, "reason": suggestion_text}
-    return suggestion
\ No newline at end of file
+        result = {"suggested_time": None, "reason": suggestion_text}
+    result["source"] = "llm"
+    return result
+
+def _free_intervals(free_busy, preferences):
+    """(free intervals, (window start, window end)) in epoch seconds; window is None if unknown."""
+    if isinstance(free_busy, dict) and "free_slots" in free_busy:
+        bounds = free_busy.get("free_busy") or {}
+        free_busy, window = free_busy["free_slots"], (to_epoch(bounds.get("timeMin")), to_epoch(bounds.get("timeMax")))
+    else:
+        window = (None, None)
+
+    if isinstance(free_busy, list):
+        free = [(to_epoch(slot.get("start")), to_epoch(slot.get("end"))) for slot in free_busy]
+        free = sorted((start, end) for start, end in free if start is not None and end is not None)
+        if not free:
+            return [], None
+        return free, (window[0] or free[0][0], window[1] or max(end for _, end in free))
+
+    if isinstance(free_busy, dict) and ("calendars" in free_busy or "busy" in free_busy):
+        start, end = to_epoch(free_busy.get("timeMin")), to_epoch(free_busy.get("timeMax"))
+        if start is None or end is None:
+            return [], None
+        timelines = list(timelines_from_freebusy(free_busy).values())
+        free = free_intervals(timelines, start, end, preferences.working_hours, tz=preferences.tz)
+        return free, (start, end)
+    return [], None
@@ -1,15 +1,30 @@
 # hushh_mcp/agents/calendar_agent/operons/utils.py
 
-from hushh_mcp.agents.calendar_agent.state.gemini_llm import gemini_chat
+import datetime
 
-def parse_time_range(natural_language_str):
-    # Use Gemini to parse natural language time ranges if needed
-    prompt = f"Parse this time range into ISO 8601 start and end datetimes: '{natural_language_str}'. Respond as JSON: {{'start': '...', 'end': '...'}}"
-    response = gemini_chat(prompt)
+from hushh_mcp.agents.calendar_agent.state.gemini_llm import gemini_chat, gemini_chat_many
+
+def parse_time_range(natural_language_str, today=None):
+    # Use Gemini to parse natural language time ranges if needed. Today's date is part of the
+    # prompt, so "tomorrow afternoon" is resolved (and cached) per day.
+    response = gemini_chat(_time_range_prompt(natural_language_str, today), template="parse_time_range")
+    return _parse_time_range_response(response)
+
+def parse_time_ranges(natural_language_strs, today=None):
+    # Several phrases at once: asked concurrently and micro-batched into as few Gemini calls as possible
+    prompts = [_time_range_prompt(text, today) for text in natural_language_strs]
+    responses = gemini_chat_many(prompts, template="parse_time_range")
+    return [_parse_time_range_response(response) for response in responses]
+
+def _time_range_prompt(natural_language_str, today=None):
+    today = today or datetime.date.today()
+    return f"Today is {today.isoformat()}. Parse this time range into ISO 8601 start and end datetimes: '{natural_language_str}'. Respond as JSON: {{'start': '...', 'end': '...'}}"
+
+def _parse_time_range_response(response):
     try:
         import json
         parsed = json.loads(response)
         return (parsed["start"], parsed["end"])
     except Exception:
         # Fallback to a static example
-        return ("2025-07-25T15:00:00Z", "2025-07-25T17:00:00Z")
\ No newline at end of file
+        return ("2025-07-25T15:00:00Z", "2025-07-25T17:00:00Z")
@@ -1,11 +1,12 @@
 # hushh_mcp/trust/link.py
 
 import hmac
-import hashlib
 import time
+from typing import Optional
 from hushh_mcp.types import TrustLink, UserID, AgentID, ConsentScope
 from hushh_mcp.constants import TRUST_LINK_PREFIX
-from hushh_mcp.config import SECRET_KEY, DEFAULT_TRUST_LINK_EXPIRY_MS
+from hushh_mcp.config import DEFAULT_TRUST_LINK_EXPIRY_MS
+from hushh_mcp.keyring import LEGACY_KEY_ID, get_keyring
 
 # ========== TrustLink Creator ==========
 
@@ -20,7 +21,8 @@ def create_trust_link(
     expires_at = created_at + expires_in_ms
 
     raw = f"{from_agent}|{to_agent}|{scope}|{created_at}|{expires_at}|{signed_by_user}"
-    signature = _sign(raw)
+    key_id = get_keyring().active_key_id
+    signature = _sign(raw, key_id)
 
     return TrustLink(
         from_agent=from_agent,
@@ -29,7 +31,8 @@ def create_trust_link(
         created_at=created_at,
         expires_at=expires_at,
         signed_by_user=signed_by_user,
-        signature=signature
+        signature=signature,
+        key_id=key_id
     )
 
 # ========== TrustLink Verifier ==========
@@ -39,8 +42,12 @@ def verify_trust_link(link: TrustLink) -> bool:
     if now > link.expires_at:
         return False
 
+    key_id = LEGACY_KEY_ID if link.key_id is None else link.key_id
+    if not get_keyring().has_key(key_id):
+        return False
+
     raw = f"{link.from_agent}|{link.to_agent}|{link.scope}|{link.created_at}|{link.expires_at}|{link.signed_by_user}"
-    expected_sig = _sign(raw)
+    expected_sig = _sign(raw, key_id)
 
     return hmac.compare_digest(link.signature, expected_sig)
 
@@ -51,9 +58,5 @@ def is_trusted_for_scope(link: TrustLink, required_scope: ConsentScope) -> bool:
 
 # ========== Internal Signer ==========
 
-def _sign(input_string: str) -> str:
-    return hmac.new(
-        SECRET_KEY.encode(),
-        input_string.encode(),
-        hashlib.sha256
-    ).hexdigest()
+def _sign(input_string: str, key_id: Optional[int] = None) -> str:
+    return get_keyring().hexmac(input_string.encode(), key_id)
@@ -0,0 +1,184 @@
+# hushh_mcp/trust/registry.py
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from hushh_mcp.keyring import Keyring, get_keyring
+from hushh_mcp.trust.link import verify_trust_link
+from hushh_mcp.types import TrustLink, UserID, AgentID, ConsentScope
+
+DEFAULT_MAX_DELEGATION_DEPTH = 4
+
+# (to_agent, scope, user) -> {signature: link}
+IndexKey = Tuple[str, str, str]
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+def _scope_key(scope: ConsentScope) -> str:
+    return scope.value if isinstance(scope, ConsentScope) else str(scope)
+
+def _fingerprint(link: TrustLink) -> tuple:
+    # Everything the signature covers, plus the key it was checked against
+    return (
+        link.from_agent, link.to_agent, _scope_key(link.scope), link.created_at,
+        link.expires_at, link.signed_by_user, link.signature, link.key_id
+    )
+
+# ========== TrustLink Registry ==========
+
+class TrustLinkRegistry:
+    """
+    In-memory set of verified TrustLinks that answers
+    "may agent X act for user U on scope S?", directly or through a chain of delegations.
+
+    - Signature checks are cached per link signature until the link's expires_at.
+    - Links are indexed by (to_agent, scope, user) for O(1) lookup of who delegated to an agent.
+    - With `root_agents`, a chain must start at one of them (e.g. the identity agent);
+      without, any single valid link to the agent is enough.
+    - Expired links are evicted lazily on every operation.
+    """
+
+    def __init__(
+        self,
+        root_agents: Optional[Iterable[AgentID]] = None,
+        max_depth: int = DEFAULT_MAX_DELEGATION_DEPTH
+    ):
+        self.root_agents: Optional[Set[str]] = set(root_agents) if root_agents is not None else None
+        self.max_depth = max_depth
+        self._index: Dict[IndexKey, Dict[str, TrustLink]] = {}
+        self._verified: Dict[str, Tuple[tuple, Keyring]] = {}
+        self._expiry_heap: List[Tuple[int, str, IndexKey]] = []
+        self._lock = threading.Lock()
+
+    # ----- verification -----
+
+    def verify(self, link: TrustLink) -> bool:
+        """verify_trust_link with a per-signature cache that lasts until the link expires."""
+        now = _now_ms()
+        if now > link.expires_at:
+            return False
+
+        keyring = get_keyring()
+        fingerprint = _fingerprint(link)
+        with self._lock:
+            cached = self._verified.get(link.signature)
+        if cached is not None and cached[0] == fingerprint and cached[1] is keyring:
+            return True
+
+        if not verify_trust_link(link):
+            return False
+
+        with self._lock:
+            self._verified[link.signature] = (fingerprint, keyring)
+            heapq.heappush(self._expiry_heap, (link.expires_at, link.signature, self._key(link)))
+        return True
+
+    # ----- registration -----
+
+    def add(self, link: TrustLink) -> bool:
+        """Verify and index a link. Returns False (and stores nothing) if it does not verify."""
+        if not self.verify(link):
+            return False
+        with self._lock:
+            self._index.setdefault(self._key(link), {})[link.signature] = link
+        return True
+
+    def add_many(self, links: Iterable[TrustLink]) -> int:
+        return sum(1 for link in links if self.add(link))
+
+    def remove(self, link: TrustLink) -> None:
+        key = self._key(link)
+        with self._lock:
+            bucket = self._index.get(key)
+            if bucket is not None:
+                bucket.pop(link.signature, None)
+                if not bucket:
+                    del self._index[key]
+            self._verified.pop(link.signature, None)
+
+    def links_to(self, agent: AgentID, user: UserID, scope: ConsentScope) -> List[TrustLink]:
+        with self._lock:
+            self._evict_expired_locked(_now_ms())
+            return list(self._index.get((agent, _scope_key(scope), user), {}).values())
+
+    # ----- chain resolution -----
+
+    def resolve_chain(
+        self,
+        agent: AgentID,
+        user: UserID,
+        scope: ConsentScope,
+        max_depth: Optional[int] = None
+    ) -> Optional[List[TrustLink]]:
+        """
+        Shortest chain of live links from a root agent to `agent` for (user, scope),
+        ordered root first, or None if there is none within max_depth hops.
+        """
+        max_depth = self.max_depth if max_depth is None else max_depth
+        scope_key = _scope_key(scope)
+        keyring = get_keyring()
+
+        with self._lock:
+            self._evict_expired_locked(_now_ms())
+
+            # Breadth-first, walking links backwards from the agent towards a root
+            frontier = deque([(agent, [])])
+            visited = {agent}
+            while frontier:
+                current, chain = frontier.popleft()
+                if len(chain) >= max_depth:
+                    continue
+                for link in self._index.get((current, scope_key, user), {}).values():
+                    if not self._still_verified_locked(link, keyring):
+                        continue
+                    path = [link] + chain
+                    if self.root_agents is None or link.from_agent in self.root_agents:
+                        return path
+                    if link.from_agent not in visited:
+                        visited.add(link.from_agent)
+                        frontier.append((link.from_agent, path))
+        return None
+
+    def is_trusted(self, agent: AgentID, user: UserID, scope: ConsentScope) -> bool:
+        return self.resolve_chain(agent, user, scope) is not None
+
+    # ----- maintenance -----
+
+    def evict_expired(self, now: Optional[int] = None) -> int:
+        with self._lock:
+            return self._evict_expired_locked(now if now is not None else _now_ms())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(bucket) for bucket in self._index.values())
+
+    def _evict_expired_locked(self, now: int) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, signature, key = heapq.heappop(heap)
+            self._verified.pop(signature, None)
+            bucket = self._index.get(key)
+            if bucket is not None and bucket.pop(signature, None) is not None:
+                removed += 1
+                if not bucket:
+                    del self._index[key]
+        return removed
+
+    def _still_verified_locked(self, link: TrustLink, keyring: Keyring) -> bool:
+        entry = self._verified.get(link.signature)
+        if entry is not None and entry[1] is keyring:
+            return True
+        # The keyring was swapped since this link was checked; re-verify against the new one
+        if not verify_trust_link(link):
+            return False
+        self._verified[link.signature] = (_fingerprint(link), keyring)
+        return True
+
+    @staticmethod
+    def _key(link: TrustLink) -> IndexKey:
+        return (link.to_agent, _scope_key(link.scope), link.signed_by_user)
@@ -1,6 +1,6 @@
 # hushh_mcp/types.py
 
-from typing import Literal, TypedDict, Optional, NewType
+from typing import List, Literal, TypedDict, Optional, NewType
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
@@ -19,10 +19,12 @@ class HushhConsentToken(BaseModel):
     token: str
     user_id: UserID
     agent_id: AgentID
-    scope: ConsentScope
+    scope: ConsentScope  # primary scope (the first one granted)
+    scopes: Optional[List[ConsentScope]] = None  # every granted scope, for multi-scope tokens
     issued_at: int  # epoch ms
     expires_at: int  # epoch ms
     signature: str
+    key_id: Optional[int] = None  # keyring key ID (see consent/compact.py)
 
 # ==================== TrustLink ====================
 
@@ -34,6 +36,7 @@ class TrustLink(BaseModel):
     expires_at: int
     signed_by_user: UserID
     signature: str
+    key_id: Optional[int] = None  # keyring key ID (see consent/compact.py)
 
 # ==================== Vault Structures ====================
 
@@ -0,0 +1,57 @@
+# hushh_mcp/vault/__init__.py
+
+import json
+import time
+from typing import Optional
+
+from hushh_mcp.config import AGENT_ID, VAULT_ENCRYPTION_KEY
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.types import VaultKey, VaultRecord
+from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
+from hushh_mcp.vault.store import VaultStore, get_vault_store, set_vault_store
+
+# ========== Consent Audit Records ==========
+
+def store_consent(
+    path: str,
+    data: dict,
+    user_id: str = "system",
+    agent_id: str = AGENT_ID,
+    scope: ConsentScope = ConsentScope.CUSTOM_TEMPORARY,
+    expires_in_ms: Optional[int] = None
+) -> VaultRecord:
+    """
+    Encrypt `data` (JSON) and persist it in the vault store under `path`.
+    Used by agents to record consent decisions and the actions taken under them.
+    """
+    now = int(time.time() * 1000)
+    record = VaultRecord(
+        key=VaultKey(user_id=user_id, scope=scope),
+        data=encrypt_data(json.dumps(data, default=str), VAULT_ENCRYPTION_KEY),
+        agent_id=agent_id,
+        created_at=now,
+        updated_at=now,
+        expires_at=now + expires_in_ms if expires_in_ms is not None else None
+    )
+    get_vault_store().put(record, name=path)
+    return record
+
+def load_consent(
+    path: str,
+    user_id: str = "system",
+    scope: ConsentScope = ConsentScope.CUSTOM_TEMPORARY
+) -> Optional[dict]:
+    record = get_vault_store().get(VaultKey(user_id=user_id, scope=scope), name=path)
+    if record is None:
+        return None
+    return json.loads(decrypt_data(record.data, VAULT_ENCRYPTION_KEY))
+
+__all__ = [
+    "VaultStore",
+    "get_vault_store",
+    "set_vault_store",
+    "store_consent",
+    "load_consent",
+    "encrypt_data",
+    "decrypt_data"
+]
@@ -0,0 +1,172 @@
+# hushh_mcp/vault/codec.py
+#
+# Serialization of vault values (agent memory, context) to bytes before encryption.
+#
+# Every encoded value is described by a format tag, "<codec>[+<compression>]", e.g.
+# "orjson", "msgpack+zstd". The tag is stored next to the ciphertext (VaultRecord.metadata
+# "codec") so any reader can decode it. Values written before codecs existed have no tag
+# and were produced by str(); they are read back with ast.literal_eval (never eval).
+#
+# orjson, ormsgpack and zstandard are optional: without them "json" and "zlib" are used.
+# datetime / date values are stored as ISO-8601 strings by every codec.
+
+import ast
+import datetime
+import json
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from hushh_mcp.config import VAULT_CODEC, VAULT_COMPRESSION, VAULT_COMPRESSION_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Tag of values written with str() before this module existed
+LEGACY_FORMAT = "str"
+
+# ========== Codecs ==========
+
+class Codec:
+    """Turns a JSON-like value into bytes and back."""
+
+    def __init__(self, name: str, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+def _json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+_CODECS: Dict[str, Codec] = {
+    "json": Codec(
+        "json",
+        lambda value: json.dumps(value, default=_json_default, separators=(",", ":")).encode(),
+        lambda data: json.loads(data)
+    ),
+}
+
+if orjson is not None:
+    _CODECS["orjson"] = Codec(
+        "orjson",
+        lambda value: orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads
+    )
+
+if ormsgpack is not None:
+    _CODECS["msgpack"] = Codec(
+        "msgpack",
+        lambda value: ormsgpack.packb(value, default=_json_default, option=ormsgpack.OPT_NON_STR_KEYS),
+        ormsgpack.unpackb
+    )
+
+def register_codec(codec: Codec) -> None:
+    if "+" in codec.name:
+        raise ValueError("codec names may not contain '+'")
+    _CODECS[codec.name] = codec
+
+# ========== Compression ==========
+
+class _Compressor:
+    def __init__(self, name: str, compress: Callable[[bytes], bytes], decompress: Callable[[bytes], bytes]):
+        self.name = name
+        self.compress = compress
+        self.decompress = decompress
+
+_COMPRESSORS: Dict[str, _Compressor] = {
+    "zlib": _Compressor("zlib", lambda data: zlib.compress(data, 6), zlib.decompress),
+}
+
+if zstandard is not None:
+    # zstd contexts are not thread-safe; cheap enough to create per call
+    _COMPRESSORS["zstd"] = _Compressor(
+        "zstd",
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data)
+    )
+
+# ========== Format Selection ==========
+
+# Built-in formats whose library may be missing; they fall back instead of failing
+_OPTIONAL_CODECS = frozenset({"orjson", "msgpack"})
+_OPTIONAL_COMPRESSORS = frozenset({"zstd"})
+
+def _resolve(codec: Optional[str], compression: Optional[str]) -> Tuple[Codec, Optional[_Compressor]]:
+    codec = codec or VAULT_CODEC
+    if codec not in _CODECS:
+        if codec not in _OPTIONAL_CODECS:
+            raise ValueError(f"Unknown vault codec: '{codec}' (expected one of {', '.join(sorted(set(_CODECS) | _OPTIONAL_CODECS))})")
+        # orjson / msgpack configured but not installed
+        codec = "orjson" if "orjson" in _CODECS else "json"
+
+    compression = VAULT_COMPRESSION if compression is None else compression
+    compressor = None
+    if compression and compression != "none":
+        compressor = _COMPRESSORS.get(compression)
+        if compressor is None:
+            if compression not in _OPTIONAL_COMPRESSORS:
+                raise ValueError(f"Unknown vault compression: '{compression}' (expected zstd, zlib or none)")
+            # zstd configured but zstandard not installed
+            compressor = _COMPRESSORS["zlib"]
+    return _CODECS[codec], compressor
+
+def parse_format(tag: Optional[str]) -> Tuple[str, Optional[str]]:
+    codec, _, compression = (tag or LEGACY_FORMAT).partition("+")
+    return codec, compression or None
+
+# ========== Encode / Decode ==========
+
+def encode_value(
+    value: Any,
+    codec: Optional[str] = None,
+    compression: Optional[str] = None,
+    min_compress_bytes: int = VAULT_COMPRESSION_MIN_BYTES
+) -> Tuple[str, bytes]:
+    """
+    Serialize `value`, compressing it if it is at least `min_compress_bytes` long.
+    Returns (format tag, bytes).
+    """
+    chosen, compressor = _resolve(codec, compression)
+    data = chosen.encode(value)
+    if compressor is not None and len(data) >= min_compress_bytes:
+        return f"{chosen.name}+{compressor.name}", compressor.compress(data)
+    return chosen.name, data
+
+def decode_value(data: bytes, tag: Optional[str]) -> Any:
+    """Inverse of encode_value. A missing tag means a legacy str() value."""
+    codec, compression = parse_format(tag)
+    if codec == LEGACY_FORMAT:
+        return _decode_legacy(data)
+
+    if compression is not None:
+        compressor = _COMPRESSORS.get(compression)
+        if compressor is None:
+            raise RuntimeError(f"Cannot decode '{tag}': {compression} support is not installed")
+        data = compressor.decompress(data)
+
+    chosen = _CODECS.get(codec)
+    if chosen is None:
+        raise RuntimeError(f"Cannot decode '{tag}': unknown or unavailable codec '{codec}'")
+    return chosen.decode(data)
+
+def _decode_legacy(data: bytes) -> Any:
+    plaintext = data.decode("utf-8")
+    try:
+        return ast.literal_eval(plaintext)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return plaintext
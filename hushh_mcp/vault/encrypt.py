@@ -1,59 +1,112 @@
 # hushh_mcp/vault/encrypt.py
 
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from cryptography.exceptions import InvalidTag
+from functools import lru_cache
+from typing import Union
 import os
 import base64
+from hushh_mcp.config import VAULT_DEFAULT_ALGORITHM
 from hushh_mcp.types import EncryptedPayload
 
 # ==================== Constants ====================
 
-IV_LENGTH = 12  # GCM recommended IV size
+IV_LENGTH = 12  # GCM recommended IV size; also the ChaCha20-Poly1305 nonce size
 TAG_LENGTH = 16
 ALGORITHM_NAME = "aes-256-gcm"
+CHACHA20_ALGORITHM_NAME = "chacha20-poly1305"
+
+# Both AEADs take a 256-bit key, 96-bit nonce and produce a 128-bit tag,
+# so payloads differ only in the recorded algorithm name.
+AEAD_ALGORITHMS = {
+    ALGORITHM_NAME: AESGCM,
+    CHACHA20_ALGORITHM_NAME: ChaCha20Poly1305,
+}
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# ==================== Cipher ====================
+
+class VaultCipher:
+    """
+    An AEAD (AES-256-GCM or ChaCha20-Poly1305) bound to one key. The key is parsed
+    once; every call is a single one-shot operation on a `iv || ciphertext || tag` buffer.
+    """
+
+    def __init__(self, key_hex: str, algorithm: str = ALGORITHM_NAME):
+        aead_class = AEAD_ALGORITHMS.get(algorithm)
+        if aead_class is None:
+            raise RuntimeError(f"Unsupported vault algorithm: '{algorithm}'")
+        self.algorithm = algorithm
+        try:
+            self._aead = aead_class(bytes.fromhex(key_hex))
+        except Exception as e:
+            raise RuntimeError(f"Invalid vault key: {str(e)}")
+
+    def encrypt_bytes(self, plaintext: BytesLike, associated_data: BytesLike = None) -> bytes:
+        try:
+            iv = os.urandom(IV_LENGTH)
+            return iv + self._aead.encrypt(iv, plaintext, associated_data)
+        except Exception as e:
+            raise RuntimeError(f"Encryption failed: {str(e)}")
+
+    def decrypt_bytes(self, blob: BytesLike, associated_data: BytesLike = None) -> bytes:
+        view = memoryview(blob)
+        if len(view) < IV_LENGTH + TAG_LENGTH:
+            raise RuntimeError("Decryption failed: ciphertext is too short")
+        try:
+            return self._aead.decrypt(view[:IV_LENGTH], view[IV_LENGTH:], associated_data)
+        except InvalidTag:
+            raise ValueError("Decryption failed: Invalid authentication tag. Possible tampering.")
+        except Exception as e:
+            raise RuntimeError(f"Decryption failed: {str(e)}")
+
+@lru_cache(maxsize=32)
+def get_cipher(key_hex: str, algorithm: str = ALGORITHM_NAME) -> VaultCipher:
+    """Shared VaultCipher per (key, algorithm), so callers of the string API do not re-parse the key."""
+    return VaultCipher(key_hex, algorithm)
 
 # ==================== Encrypt ====================
 
-def encrypt_data(plaintext: str, key_hex: str) -> EncryptedPayload:
+def encrypt_data(plaintext: str, key_hex: str, algorithm: str = VAULT_DEFAULT_ALGORITHM) -> EncryptedPayload:
     try:
-        key = bytes.fromhex(key_hex)
-        iv = os.urandom(IV_LENGTH)
-        backend = default_backend()
-
-        cipher = Cipher(algorithms.AES(key), modes.GCM(iv), backend=backend)
-        encryptor = cipher.encryptor()
-
-        ciphertext = encryptor.update(plaintext.encode('utf-8')) + encryptor.finalize()
-        tag = encryptor.tag
-
-        return EncryptedPayload(
-            ciphertext=base64.b64encode(ciphertext).decode('utf-8'),
-            iv=base64.b64encode(iv).decode('utf-8'),
-            tag=base64.b64encode(tag).decode('utf-8'),
-            encoding="base64",
-            algorithm=ALGORITHM_NAME
-        )
+        data = plaintext.encode('utf-8')
     except Exception as e:
         raise RuntimeError(f"Encryption failed: {str(e)}")
+    return encrypt_raw(data, key_hex, algorithm)
+
+def encrypt_raw(data: BytesLike, key_hex: str, algorithm: str = VAULT_DEFAULT_ALGORITHM) -> EncryptedPayload:
+    """encrypt_data for values that are already bytes (e.g. codec output)."""
+    try:
+        cipher = get_cipher(key_hex, algorithm)
+    except Exception as e:
+        raise RuntimeError(f"Encryption failed: {str(e)}")
+
+    blob = cipher.encrypt_bytes(data)
+    return EncryptedPayload(
+        ciphertext=base64.b64encode(blob[IV_LENGTH:-TAG_LENGTH]).decode('utf-8'),
+        iv=base64.b64encode(blob[:IV_LENGTH]).decode('utf-8'),
+        tag=base64.b64encode(blob[-TAG_LENGTH:]).decode('utf-8'),
+        encoding="base64",
+        algorithm=cipher.algorithm
+    )
 
 # ==================== Decrypt ====================
 
 def decrypt_data(payload: EncryptedPayload, key_hex: str) -> str:
+    decrypted = decrypt_raw(payload, key_hex)
     try:
-        key = bytes.fromhex(key_hex)
-        iv = base64.b64decode(payload.iv)
-        tag = base64.b64decode(payload.tag)
-        ciphertext = base64.b64decode(payload.ciphertext)
-
-        backend = default_backend()
-        cipher = Cipher(algorithms.AES(key), modes.GCM(iv, tag), backend=backend)
-        decryptor = cipher.decryptor()
-
-        decrypted = decryptor.update(ciphertext) + decryptor.finalize()
         return decrypted.decode('utf-8')
+    except Exception as e:
+        raise RuntimeError(f"Decryption failed: {str(e)}")
 
-    except InvalidTag:
-        raise ValueError("Decryption failed: Invalid authentication tag. Possible tampering.")
+def decrypt_raw(payload: EncryptedPayload, key_hex: str) -> bytes:
+    """decrypt_data without the utf-8 decode."""
+    try:
+        cipher = get_cipher(key_hex, payload.algorithm)
+        blob = base64.b64decode(payload.iv) + base64.b64decode(payload.ciphertext) + base64.b64decode(payload.tag)
     except Exception as e:
         raise RuntimeError(f"Decryption failed: {str(e)}")
+
+    # Raises ValueError on a bad tag, RuntimeError otherwise
+    return cipher.decrypt_bytes(blob)
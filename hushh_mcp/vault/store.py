@@ -0,0 +1,273 @@
+# hushh_mcp/vault/store.py
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from hushh_mcp.config import VAULT_DB_PATH, VAULT_COMPACTION_INTERVAL_S
+from hushh_mcp.types import EncryptedPayload, VaultKey, VaultRecord, UserID, AgentID, ConsentScope
+
+# Records are addressed by (user_id, scope, name): a VaultKey plus a free-form name,
+# so one user can hold many records (e.g. one per context key) under the same scope.
+# Only the already-encrypted EncryptedPayload is ever written to disk.
+
+NamedRecord = Tuple[str, VaultRecord]
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+def _scope_key(scope: ConsentScope) -> str:
+    return scope.value if isinstance(scope, ConsentScope) else str(scope)
+
+# ========== Vault Store ==========
+
+class VaultStore:
+    """
+    SQLite-backed store for encrypted VaultRecords.
+
+    - Secondary indexes on (user_id, scope), agent_id and expires_at.
+    - put_many() writes a whole batch in one transaction.
+    - delete() is a soft delete (sets `deleted`); reads skip deleted and expired rows.
+    - compact() hard-deletes expired and soft-deleted rows; with a positive
+      `compaction_interval_s` a daemon thread runs it periodically.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vault_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            name TEXT NOT NULL DEFAULT '',
+            agent_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER,
+            expires_at INTEGER,
+            deleted INTEGER NOT NULL DEFAULT 0,
+            metadata TEXT,
+            UNIQUE (user_id, scope, name)
+        );
+        CREATE INDEX IF NOT EXISTS idx_vault_records_user_scope
+            ON vault_records (user_id, scope);
+        CREATE INDEX IF NOT EXISTS idx_vault_records_agent_id
+            ON vault_records (agent_id);
+        CREATE INDEX IF NOT EXISTS idx_vault_records_expires_at
+            ON vault_records (expires_at) WHERE expires_at IS NOT NULL;
+    """
+
+    _UPSERT = """
+        INSERT INTO vault_records
+            (user_id, scope, name, agent_id, payload, created_at, updated_at, expires_at, deleted, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (user_id, scope, name) DO UPDATE SET
+            agent_id = excluded.agent_id,
+            payload = excluded.payload,
+            updated_at = excluded.updated_at,
+            expires_at = excluded.expires_at,
+            deleted = excluded.deleted,
+            metadata = excluded.metadata
+    """
+
+    _COLUMNS = "user_id, scope, name, agent_id, payload, created_at, updated_at, expires_at, deleted, metadata"
+    _LIVE = "deleted = 0 AND (expires_at IS NULL OR expires_at >= ?)"
+
+    def __init__(
+        self,
+        path: str = VAULT_DB_PATH,
+        compaction_interval_s: float = VAULT_COMPACTION_INTERVAL_S
+    ):
+        self.path = path
+        self.compaction_interval_s = compaction_interval_s
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")  # only takes effect on a new file
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        if compaction_interval_s > 0:
+            self._compactor = threading.Thread(
+                target=self._compaction_loop, name="vault-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    # ----- writes -----
+
+    def put(self, record: VaultRecord, name: str = "") -> None:
+        self.put_many([(name, record)])
+
+    def put_many(self, records: Iterable[NamedRecord]) -> int:
+        """Insert or replace (name, record) pairs in a single transaction. Returns the batch size."""
+        rows = [self._to_row(name, record) for name, record in records]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(self._UPSERT, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def delete(self, key: VaultKey, name: str = "") -> bool:
+        """Soft-delete one record. Returns False if there was no live record to delete."""
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE vault_records SET deleted = 1, updated_at = ? "
+                "WHERE user_id = ? AND scope = ? AND name = ? AND deleted = 0",
+                (_now_ms(), key.user_id, _scope_key(key.scope), name)
+            ).rowcount
+        return updated > 0
+
+    def delete_many(self, key: VaultKey, names: Iterable[str]) -> int:
+        """Soft-delete several records under one VaultKey in a single transaction."""
+        now = _now_ms()
+        rows = [(now, key.user_id, _scope_key(key.scope), name) for name in names]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "UPDATE vault_records SET deleted = 1, updated_at = ? "
+                    "WHERE user_id = ? AND scope = ? AND name = ? AND deleted = 0",
+                    rows
+                )
+                deleted = self._conn.total_changes - before
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return deleted
+
+    # ----- reads -----
+
+    def get(self, key: VaultKey, name: str = "") -> Optional[VaultRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM vault_records "
+                f"WHERE user_id = ? AND scope = ? AND name = ? AND {self._LIVE}",
+                (key.user_id, _scope_key(key.scope), name, _now_ms())
+            ).fetchone()
+        return self._from_row(row)[1] if row else None
+
+    def query(
+        self,
+        user_id: Optional[UserID] = None,
+        scope: Optional[ConsentScope] = None,
+        agent_id: Optional[AgentID] = None,
+        include_deleted: bool = False
+    ) -> List[NamedRecord]:
+        """(name, record) pairs matching every given filter, served from the secondary indexes."""
+        clauses, params = [], []
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if scope is not None:
+            clauses.append("scope = ?")
+            params.append(_scope_key(scope))
+        if agent_id is not None:
+            clauses.append("agent_id = ?")
+            params.append(agent_id)
+        if not include_deleted:
+            clauses.append(self._LIVE)
+            params.append(_now_ms())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM vault_records {where} ORDER BY id", params
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def __len__(self) -> int:
+        """Number of live (not deleted, not expired) records."""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM vault_records WHERE {self._LIVE}", (_now_ms(),)
+            ).fetchone()[0]
+
+    # ----- maintenance -----
+
+    def compact(self, now: Optional[int] = None) -> int:
+        """Hard-delete expired and soft-deleted records and release their pages. Returns rows removed."""
+        now = now if now is not None else _now_ms()
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM vault_records WHERE deleted = 1 OR expires_at < ?", (now,)
+            ).rowcount
+            if removed:
+                self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+        return removed
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            self._conn.close()
+
+    def _compaction_loop(self) -> None:
+        while not self._stop.wait(self.compaction_interval_s):
+            try:
+                self.compact()
+            except sqlite3.Error:
+                pass  # retried on the next tick
+
+    # ----- row mapping -----
+
+    @staticmethod
+    def _to_row(name: str, record: VaultRecord) -> tuple:
+        return (
+            record.key.user_id,
+            _scope_key(record.key.scope),
+            name,
+            record.agent_id,
+            record.data.model_dump_json(),
+            record.created_at,
+            record.updated_at,
+            record.expires_at,
+            int(bool(record.deleted)),
+            json.dumps(record.metadata) if record.metadata is not None else None,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> NamedRecord:
+        user_id, scope, name, agent_id, payload, created_at, updated_at, expires_at, deleted, metadata = row
+        return name, VaultRecord(
+            key=VaultKey(user_id=user_id, scope=scope),
+            data=EncryptedPayload.model_validate_json(payload),
+            agent_id=agent_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            expires_at=expires_at,
+            deleted=bool(deleted),
+            metadata=json.loads(metadata) if metadata is not None else None,
+        )
+
+# ========== Default Store ==========
+
+_vault_store: Optional[VaultStore] = None
+_vault_store_lock = threading.Lock()
+
+def get_vault_store() -> VaultStore:
+    """Process-wide store at VAULT_DB_PATH, opened on first use."""
+    global _vault_store
+    with _vault_store_lock:
+        if _vault_store is None:
+            _vault_store = VaultStore()
+        return _vault_store
+
+def set_vault_store(store: Optional[VaultStore]) -> None:
+    """Swap the process-wide store; None reopens VAULT_DB_PATH on next use."""
+    global _vault_store
+    with _vault_store_lock:
+        _vault_store = store
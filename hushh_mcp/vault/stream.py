@@ -0,0 +1,193 @@
+# hushh_mcp/vault/stream.py
+#
+# Chunked AEAD encryption (AES-256-GCM or ChaCha20-Poly1305) for payloads too large
+# to hold in memory as one str.
+#
+# Stream layout (all integers big-endian):
+#
+#   header = MAGIC "HVS1" | algorithm u8 | chunk_size u32 | nonce_prefix 8 bytes (random per stream)
+#   frame  = flags u8 (FINAL_FLAG on the last frame) | length u32 | ciphertext || tag
+#
+# Chunk i is sealed with nonce = nonce_prefix || i (u32) and AAD = header || i (u32) || flags,
+# so every frame authenticates on its own, and reordering, splicing between streams or
+# dropping trailing frames is detected. An empty input still produces one (final) frame.
+
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, Union
+
+from cryptography.exceptions import InvalidTag
+
+from hushh_mcp.config import VAULT_DEFAULT_ALGORITHM
+from hushh_mcp.vault.encrypt import AEAD_ALGORITHMS
+
+# ==================== Constants ====================
+
+MAGIC = b"HVS1"
+ALGORITHM_AES_256_GCM = 1
+ALGORITHM_CHACHA20_POLY1305 = 2
+ALGORITHM_IDS = {
+    "aes-256-gcm": ALGORITHM_AES_256_GCM,
+    "chacha20-poly1305": ALGORITHM_CHACHA20_POLY1305,
+}
+_ALGORITHM_NAMES = {algorithm_id: name for name, algorithm_id in ALGORITHM_IDS.items()}
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+NONCE_PREFIX_LENGTH = 8
+TAG_LENGTH = 16
+FINAL_FLAG = 0x01
+
+_HEADER = struct.Struct(">4sBI8s")
+_FRAME = struct.Struct(">BI")
+_INDEX = struct.Struct(">I")
+
+Source = Union[BinaryIO, Iterable[bytes]]
+
+# ==================== Helpers ====================
+
+def _read_chunks(source: Source, chunk_size: int) -> Iterator[bytes]:
+    """Yield exactly chunk_size-byte pieces (the last may be shorter) from a file or byte iterator."""
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    buffer = bytearray()
+    for piece in source:
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Decryption failed: stream is truncated.")
+    return data
+
+class _IterReader:
+    """Minimal read(n) view over an iterable of byte strings."""
+
+    def __init__(self, pieces: Iterable[bytes]):
+        self._pieces = iter(pieces)
+        self._buffer = bytearray()
+
+    def read(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            piece = next(self._pieces, None)
+            if piece is None:
+                break
+            self._buffer += piece
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+# ==================== Encrypt ====================
+
+def _aead(algorithm: str, key_hex: str):
+    return AEAD_ALGORITHMS[algorithm](bytes.fromhex(key_hex))
+
+def iter_encrypt(
+    source: Source,
+    key_hex: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    algorithm: str = VAULT_DEFAULT_ALGORITHM
+) -> Iterator[bytes]:
+    """Yield the encrypted stream (header, then one frame per chunk) without buffering the input."""
+    if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE} bytes")
+
+    try:
+        algorithm_id = ALGORITHM_IDS[algorithm]
+        aead = _aead(algorithm, key_hex)
+    except Exception as e:
+        raise RuntimeError(f"Encryption failed: {str(e)}")
+
+    nonce_prefix = os.urandom(NONCE_PREFIX_LENGTH)
+    header = _HEADER.pack(MAGIC, algorithm_id, chunk_size, nonce_prefix)
+    yield header
+
+    chunks = _read_chunks(source, chunk_size)
+    current = next(chunks, b"")
+    index = 0
+    while True:
+        upcoming = next(chunks, None)
+        flags = FINAL_FLAG if upcoming is None else 0
+        if index > 0xFFFFFFFF:
+            raise RuntimeError("Encryption failed: stream exceeds the maximum number of chunks")
+
+        counter = _INDEX.pack(index)
+        sealed = aead.encrypt(nonce_prefix + counter, current, header + counter + bytes((flags,)))
+        yield _FRAME.pack(flags, len(sealed)) + sealed
+
+        if upcoming is None:
+            return
+        current = upcoming
+        index += 1
+
+def encrypt_stream(
+    source: Source,
+    sink: BinaryIO,
+    key_hex: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    algorithm: str = VAULT_DEFAULT_ALGORITHM
+) -> int:
+    """Encrypt `source` into the file-like `sink`. Returns the number of bytes written."""
+    written = 0
+    for block in iter_encrypt(source, key_hex, chunk_size, algorithm):
+        sink.write(block)
+        written += len(block)
+    return written
+
+# ==================== Decrypt ====================
+
+def iter_decrypt(source: Source, key_hex: str) -> Iterator[bytes]:
+    """Yield plaintext chunks, each one authenticated before it is released."""
+    stream = source if hasattr(source, "read") else _IterReader(source)
+
+    header = _read_exact(stream, _HEADER.size)
+    magic, algorithm, chunk_size, nonce_prefix = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise RuntimeError("Decryption failed: not an encrypted vault stream.")
+    if algorithm not in _ALGORITHM_NAMES:
+        raise RuntimeError(f"Decryption failed: unsupported stream algorithm {algorithm}.")
+    # The header is only authenticated with the first frame, so bound reads before trusting it
+    if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"Decryption failed: declared chunk size exceeds {MAX_CHUNK_SIZE} bytes.")
+
+    try:
+        aead = _aead(_ALGORITHM_NAMES[algorithm], key_hex)
+    except Exception as e:
+        raise RuntimeError(f"Decryption failed: {str(e)}")
+
+    index = 0
+    while True:
+        flags, length = _FRAME.unpack(_read_exact(stream, _FRAME.size))
+        if length > chunk_size + TAG_LENGTH:
+            raise ValueError("Decryption failed: frame larger than the declared chunk size.")
+        sealed = _read_exact(stream, length)
+
+        counter = _INDEX.pack(index)
+        try:
+            plaintext = aead.decrypt(nonce_prefix + counter, sealed, header + counter + bytes((flags,)))
+        except InvalidTag:
+            raise ValueError("Decryption failed: Invalid authentication tag. Possible tampering.")
+        yield plaintext
+
+        if flags & FINAL_FLAG:
+            if stream.read(1):
+                raise ValueError("Decryption failed: unexpected data after the final frame.")
+            return
+        index += 1
+
+def decrypt_stream(source: Source, sink: BinaryIO, key_hex: str) -> int:
+    """Decrypt into the file-like `sink`. Returns the number of plaintext bytes written."""
+    written = 0
+    for chunk in iter_decrypt(source, key_hex):
+        sink.write(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,28 @@
+# tests/conftest.py
+
+import pytest
+from mcp_stub import StubMCPServer
+from hushh_mcp.agents.calendar_agent.state.event_index import EventIndexRegistry, set_event_index_registry
+from hushh_mcp.agents.calendar_agent.state.memory import CalendarMemoryManager, set_memory_manager
+from hushh_mcp.config import CALENDAR_INDEX_PERSIST
+from hushh_mcp.vault.store import VaultStore, set_vault_store
+
+
+@pytest.fixture(autouse=True)
+def vault_store(tmp_path):
+    """A fresh vault file per test, behind the process-wide store, memory manager and event index registry."""
+    store = VaultStore(str(tmp_path / "hushh_vault.db"), compaction_interval_s=0)
+    set_vault_store(store)
+    set_memory_manager(CalendarMemoryManager(store=store))
+    set_event_index_registry(EventIndexRegistry(store if CALENDAR_INDEX_PERSIST else None))
+    yield store
+    set_event_index_registry(None)
+    set_memory_manager(None)
+    set_vault_store(None)
+    store.close()
+
+
+@pytest.fixture
+def mcp_stub():
+    with StubMCPServer() as server:
+        yield server
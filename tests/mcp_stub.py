@@ -0,0 +1,124 @@
+# tests/mcp_stub.py
+#
+# Minimal in-process stand-in for the calendar MCP server, for tests and benchmarks.
+# Speaks HTTP/1.1 with keep-alive so connection reuse is observable.
+
+import json
+import socket
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Deque, Dict, Optional, Set, Union
+
+Handler = Callable[[dict], dict]
+
+# A fault for one request: an HTTP status to answer with, seconds to stall before
+# answering normally, DROP to close the connection without a response, or None (no fault)
+Fault = Union[int, float, str, None]
+DROP = "drop"
+
+
+class StubError(Exception):
+    """Raise from a handler to answer with a specific HTTP status."""
+
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message or f"HTTP {status}")
+        self.status = status
+
+
+def _default_response(tool: str, body: dict) -> dict:
+    if tool == "list-events":
+        return {"items": [{"id": "evt1", "summary": "Standup"}]}
+    return {"tool": tool, "ok": True}
+
+
+class StubMCPServer:
+    """
+    Serves POST /<tool>; override responses per tool with `handlers[tool] = fn(body) -> dict`.
+    Tools listed in `unsupported` answer 404, like a server without that tool.
+    inject(tool, *faults) queues faults consumed by that tool's next requests, in order.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, Handler] = {}
+        self.unsupported: Set[str] = set()
+        self.faults: Dict[str, Deque[Fault]] = {}
+        self.calls: Counter = Counter()
+        self.connections = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; avoid Nagle / delayed-ACK stalls
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                tool = self.path.strip("/")
+                with stub._lock:
+                    stub.calls[tool] += 1
+                    queued = stub.faults.get(tool)
+                    fault = queued.popleft() if queued else None
+                if fault == DROP:
+                    self.close_connection = True
+                    return
+                if isinstance(fault, float):
+                    time.sleep(fault)
+                handler = stub.handlers.get(tool)
+                try:
+                    if isinstance(fault, int):
+                        status, response = fault, {"error": f"injected {fault}"}
+                    elif tool in stub.unsupported:
+                        status, response = 404, {"error": f"unknown tool {tool}"}
+                    else:
+                        status, response = 200, handler(body) if handler else _default_response(tool, body)
+                except Exception as e:
+                    status, response = getattr(e, "status", 500), {"error": str(e)}
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        class _Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 256
+
+        self._server = _Server(("127.0.0.1", 0), _RequestHandler)
+        self._thread: Optional[threading.Thread] = None
+
+    def inject(self, tool: str, *faults: Fault) -> None:
+        with self._lock:
+            self.faults.setdefault(tool, deque()).extend(faults)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubMCPServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubMCPServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,150 @@
+# tests/test_calendar_memory.py
+
+import threading
+import pytest
+from hushh_mcp.agents.calendar_agent.state.memory import (
+    CalendarAgentMemory,
+    CalendarMemoryManager,
+    MEMORY_SCOPE
+)
+from hushh_mcp.types import VaultKey
+from hushh_mcp.vault.store import VaultStore
+
+
+USER_ID = "user_memory"
+CONTEXT = {"events": [{"id": "evt_1", "summary": "Standup"}]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VaultStore(str(tmp_path / "vault.db"), compaction_interval_s=0)
+    yield store
+    store.close()
+
+
+def test_one_shared_context_per_user():
+    manager = CalendarMemoryManager()
+    assert manager.memory_for(USER_ID) is manager.memory_for(USER_ID)
+
+    CalendarAgentMemory(USER_ID, manager=manager).save_context("last_synced_events", CONTEXT)
+    assert CalendarAgentMemory(USER_ID, manager=manager).load_context("last_synced_events") == CONTEXT
+
+    manager.memory_for(USER_ID).clear_context("last_synced_events")
+    assert manager.memory_for(USER_ID).load_context("last_synced_events") is None
+
+
+def test_lru_eviction_respects_byte_budget():
+    manager = CalendarMemoryManager(max_bytes=2000)
+    for i in range(20):
+        manager.memory_for(f"user_{i}").save_context("ctx", {"note": "x" * 100})
+
+    assert manager.total_bytes <= 2000
+    assert 0 < len(manager) < 20
+    # Most recent user survives, the oldest is gone
+    assert manager.memory_for("user_19").load_context("ctx") == {"note": "x" * 100}
+    assert manager.memory_for("user_0").load_context("ctx") is None
+
+
+def test_expired_decrypted_value_is_decrypted_again():
+    manager = CalendarMemoryManager(ttl_ms=0)
+    memory = manager.memory_for(USER_ID)
+    memory.save_context("ctx", CONTEXT)
+
+    first = memory.load_context("ctx")
+    second = memory.load_context("ctx")
+    assert first == second == CONTEXT
+    assert first is not second
+
+
+def test_write_through_reads_back_after_eviction(store):
+    manager = CalendarMemoryManager(max_bytes=1, store=store)
+    manager.memory_for(USER_ID).save_context("ctx", CONTEXT)
+    manager.memory_for("user_other").save_context("ctx", {"a": 1})
+
+    assert store.get(VaultKey(user_id=USER_ID, scope=MEMORY_SCOPE), name="ctx") is not None
+    assert manager.memory_for(USER_ID).load_context("ctx") == CONTEXT
+
+
+def test_write_behind_defers_until_flush(store):
+    manager = CalendarMemoryManager(store=store, write_behind=True)
+    memory = manager.memory_for(USER_ID)
+    memory.save_context("ctx", CONTEXT)
+    assert store.query(user_id=USER_ID) == []
+
+    assert memory.flush() == 1
+    assert len(store.query(user_id=USER_ID, scope=MEMORY_SCOPE)) == 1
+    assert memory.flush() == 0
+
+    # A fresh manager (e.g. another process) reads it back from the vault
+    assert CalendarMemoryManager(store=store).memory_for(USER_ID).load_context("ctx") == CONTEXT
+
+
+def test_concurrent_saves_are_consistent():
+    manager = CalendarMemoryManager()
+
+    def worker(n):
+        memory = manager.memory_for(f"user_{n % 4}")
+        for i in range(50):
+            memory.save_context(f"k{i % 5}", {"n": n, "i": i})
+            memory.load_context(f"k{i % 5}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    expected = sum(
+        entry.size for context in manager._users.values() for entry in context.entries.values()
+    )
+    assert manager.total_bytes == expected
+    assert len(manager) == 4
+
+
+def test_failed_write_behind_eviction_keeps_dirty_context(store):
+    class FlakyStore(VaultStore):
+        failures = 1
+
+        def put_many(self, records):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("disk full")
+            return super().put_many(records)
+
+    flaky = FlakyStore(store.path, compaction_interval_s=0)
+    manager = CalendarMemoryManager(max_bytes=1, store=flaky, write_behind=True)
+    manager.memory_for(USER_ID).save_context("ctx", CONTEXT)
+    manager.memory_for("user_other").save_context("ctx", {"a": 1})
+
+    # The write failed: the evicted user is still in memory, counted and dirty
+    assert len(manager) == 2
+    assert manager.total_bytes == sum(context.size for context in manager._users.values())
+    assert manager.memory_for(USER_ID).load_context("ctx") == CONTEXT
+
+    assert manager.flush() == 2
+    assert flaky.get(VaultKey(user_id=USER_ID, scope=MEMORY_SCOPE), name="ctx") is not None
+    flaky.close()
+
+
+def test_failed_write_through_leaves_memory_unchanged(store):
+    class FailingStore(VaultStore):
+        def put(self, record, name=""):
+            raise RuntimeError("disk full")
+
+    failing = FailingStore(store.path, compaction_interval_s=0)
+    manager = CalendarMemoryManager(store=failing, write_behind=False)
+    with pytest.raises(RuntimeError):
+        manager.memory_for(USER_ID).save_context("ctx", CONTEXT)
+    assert manager.total_bytes == 0
+    assert manager.memory_for(USER_ID).load_context("ctx") is None
+    failing.close()
+
+
+def test_default_manager_persists_to_the_vault(store, monkeypatch):
+    from hushh_mcp.agents.calendar_agent.state import memory
+    monkeypatch.setattr(memory, "get_vault_store", lambda: store)
+    memory.set_memory_manager(None)
+    try:
+        assert memory.get_memory_manager().store is store
+    finally:
+        memory.set_memory_manager(None)
@@ -0,0 +1,77 @@
+# tests/test_conflict_engine.py
+
+import random
+from hushh_mcp.agents.cal_adk.operons.conflict_engine import ConflictIndex, conflicts_with, overlaps, parse_event
+from hushh_mcp.operons.freebusy_engine import to_epoch
+
+
+EVENTS = [
+    {"event": "Standup", "time": "2025-07-29T09:00:00", "duration": "30m"},
+    {"event": "Design review", "time": "2025-07-29T09:15:00", "duration": "1h"},
+    {"event": "Lunch", "time": "2025-07-29T12:00:00", "duration": "1h"},
+    {"event": "Team Meeting", "time": "2025-07-29T13:00:00", "duration": "1h"},
+    {"event": "Offsite", "start": {"date": "2025-07-28"}, "end": {"date": "2025-07-31"}},
+    {"event": "Broken", "time": "someday", "duration": "1h"},
+]
+
+
+def names(events):
+    return [event["event"] for event in events]
+
+
+def test_parse_event_forms():
+    assert parse_event({"time": "2025-07-29T09:00:00", "duration": "1h30m"}) == (
+        to_epoch("2025-07-29T09:00:00"), to_epoch("2025-07-29T10:30:00")
+    )
+    assert parse_event({"time": "2025-07-29T09:00:00", "duration": "later"}) is None
+    assert parse_event({"start": {"dateTime": "2025-07-29T09:00:00Z"}, "end": {"dateTime": "2025-07-29T10:00:00Z"}})
+
+
+def test_back_to_back_events_do_not_overlap():
+    assert not overlaps((0, 10), (10, 20))
+    assert overlaps((0, 11), (10, 20))
+
+
+def test_conflicts_for_proposed_event():
+    index = ConflictIndex(EVENTS)
+    assert names(index.skipped) == ["Broken"]
+    proposed = {"time": "2025-07-29T09:20:00", "duration": "1h"}
+    assert names(index.conflicts_for_event(proposed)) == ["Offsite", "Standup", "Design review"]
+    assert names(index.conflicts_for_event({"time": "2025-07-29T12:00:00", "duration": "1h"})) == ["Offsite", "Lunch"]
+    assert names(index.conflicts_for_event({"time": "2025-08-01T12:00:00", "duration": "1h"})) == []
+    assert names(conflicts_with(EVENTS, proposed)) == ["Standup", "Design review", "Offsite"]
+
+
+def test_all_overlaps_sweep():
+    pairs = {(a["event"], b["event"]) for a, b in ConflictIndex(EVENTS).all_overlaps()}
+    assert pairs == {
+        ("Offsite", "Standup"),
+        ("Offsite", "Design review"),
+        ("Offsite", "Lunch"),
+        ("Offsite", "Team Meeting"),
+        ("Standup", "Design review"),
+    }
+
+
+def test_matches_brute_force_on_random_calendars():
+    rng = random.Random(11)
+    events = [
+        {"event": str(i), "time": f"2025-07-{1 + rng.randrange(5):02d}T{rng.randrange(24):02d}:{rng.choice([0, 15, 30, 45]):02d}:00",
+         "duration": rng.choice(["15m", "30m", "1h", "2h", "3h", "26h"])}
+        for i in range(300)
+    ]
+    index = ConflictIndex(events)
+    intervals = {event["event"]: parse_event(event) for event in events}
+
+    expected = {
+        frozenset((a, b)) for a in intervals for b in intervals
+        if a < b and overlaps(intervals[a], intervals[b])
+    }
+    assert {frozenset((a["event"], b["event"])) for a, b in index.all_overlaps()} == expected
+
+    for _ in range(50):
+        proposed = {"time": f"2025-07-{1 + rng.randrange(5):02d}T{rng.randrange(24):02d}:00:00", "duration": "1h"}
+        window = parse_event(proposed)
+        brute = sorted(name for name, interval in intervals.items() if overlaps(interval, window))
+        assert sorted(names(index.conflicts_for(*window))) == brute
+        assert sorted(names(conflicts_with(events, proposed))) == brute
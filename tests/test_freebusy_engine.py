@@ -0,0 +1,153 @@
+# tests/test_freebusy_engine.py
+
+import pytest
+from hushh_mcp.agents.calendar_agent.state.event_index import (
+    CalendarEventIndex,
+    EventIndexRegistry,
+    set_event_index_registry
+)
+from hushh_mcp.consent.token import issue_token
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.operons.detect_slots import detect_available_slots
+from hushh_mcp.operons.freebusy_engine import (
+    BusyTimeline,
+    FreeBusyEngine,
+    find_free_slots,
+    merge_intervals,
+    set_freebusy_engine,
+    to_epoch
+)
+from hushh_mcp.operons.gcal_sync import sync_with_gcal
+from hushh_mcp.operons.mcp_client import MCPClient, set_mcp_client
+
+
+USER_ID = "user_slots"
+AGENT_ID = "calendar_agent"
+MONDAY = ("2025-07-28T00:00:00Z", "2025-07-29T00:00:00Z")
+
+
+def event(event_id, start, end, **extra):
+    return {"id": event_id, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+
+def at(hour, minute=0, day=28):
+    return f"2025-07-{day:02d}T{hour:02d}:{minute:02d}:00Z"
+
+
+def spans(slots):
+    return [(slot["start"][11:16], slot["end"][11:16]) for slot in slots]
+
+
+def test_merge_intervals_sweeps_overlaps_and_touching():
+    assert merge_intervals([(5, 8), (1, 3), (2, 4), (8, 9), (11, 12)]) == [(1, 4), (5, 9), (11, 12)]
+
+
+def test_timeline_range_queries():
+    timeline = BusyTimeline([(10, 20), (30, 40), (50, 60)])
+    assert timeline.busy_between(15, 55) == [(15, 20), (30, 40), (50, 55)]
+    assert timeline.busy_between(20, 30) == []
+    assert timeline.is_free(20, 30)
+    assert not timeline.is_free(39, 45)
+
+
+def test_free_slots_respect_working_hours_and_min_duration():
+    timeline = BusyTimeline.from_events([
+        event("a", at(9), at(10)),
+        event("b", at(10, 15), at(11)),  # leaves a 15 minute gap
+        event("c", at(13), at(15, 30)),
+        event("d", at(6), at(7)),        # before working hours
+    ])
+    slots = find_free_slots([timeline], *MONDAY, working_hours="09:00-17:00", min_duration_minutes=30)
+    assert spans(slots) == [("11:00", "13:00"), ("15:30", "17:00")]
+    assert slots[0]["duration_minutes"] == 120
+
+
+def test_free_slots_across_calendars_and_days():
+    work = BusyTimeline.from_events([event("a", at(9), at(12))])
+    personal = BusyTimeline.from_events([
+        event("b", at(11), at(13)),
+        {"id": "holiday", "start": {"date": "2025-07-29"}, "end": {"date": "2025-07-30"}},
+    ])
+    slots = find_free_slots(
+        [work, personal], "2025-07-28T00:00:00Z", "2025-08-02T00:00:00Z",
+        working_hours=("09:00", "17:00"), min_duration_minutes=60
+    )
+    days = sorted({slot["start"][:10] for slot in slots})
+    # Tuesday is an all-day event; Saturday is not a working day
+    assert days == ["2025-07-28", "2025-07-30", "2025-07-31", "2025-08-01"]
+    assert spans(slots)[0] == ("13:00", "17:00")
+
+
+def test_non_blocking_events_are_ignored():
+    timeline = BusyTimeline.from_events([
+        event("cancelled", at(9), at(10), status="cancelled"),
+        event("free", at(10), at(11), transparency="transparent"),
+        event("declined", at(11), at(12), attendees=[{"self": True, "responseStatus": "declined"}]),
+    ])
+    assert len(timeline) == 0
+
+
+def test_working_hours_follow_the_timezone():
+    # The UTC day of MONDAY is Sunday 20:00 - Monday 20:00 in New York
+    slots = find_free_slots([BusyTimeline()], *MONDAY, working_hours="09:00-17:00",
+                            min_duration_minutes=30, timezone="America/New_York")
+    assert [(slot["start"], slot["end"]) for slot in slots] == [
+        ("2025-07-28T09:00:00-04:00", "2025-07-28T17:00:00-04:00")
+    ]
+
+
+def test_engine_rebuilds_only_when_the_index_changes():
+    index = CalendarEventIndex(USER_ID, "primary")
+    index.apply([event("a", at(9), at(10))], full=True, time_range=MONDAY)
+    engine = FreeBusyEngine()
+
+    first = engine.timeline(index)
+    assert engine.timeline(index) is first
+    assert engine.covers(index, to_epoch(at(9)), to_epoch(at(17)))
+    assert not engine.covers(index, to_epoch(at(9)), to_epoch(at(9, day=29)))
+
+    index.apply([event("b", at(11), at(12))], full=False, time_range=MONDAY)
+    assert engine.timeline(index) is not first
+    assert len(engine.timeline(index)) == 2
+
+
+@pytest.fixture
+def calendar(mcp_stub):
+    events = [event("a", at(9), at(12)), event("b", at(14), at(15))]
+    mcp_stub.handlers["list-events"] = lambda body: {"items": events, "nextSyncToken": "1"}
+    mcp_stub.handlers["get-freebusy"] = lambda body: {
+        "calendars": {"primary": {"busy": [{"start": at(9), "end": at(16)}]}}
+    }
+    set_mcp_client(MCPClient(mcp_stub.url))
+    set_event_index_registry(EventIndexRegistry())
+    set_freebusy_engine(None)
+    yield mcp_stub
+    set_mcp_client(None)
+    set_event_index_registry(None)
+    set_freebusy_engine(None)
+
+
+@pytest.fixture
+def token():
+    return issue_token(USER_ID, AGENT_ID, ConsentScope.AGENT_GCAL_READ).token
+
+
+def test_detect_slots_uses_the_server_until_synced(calendar, token):
+    result = detect_available_slots(USER_ID, token, time_min=MONDAY[0], time_max=MONDAY[1])
+    assert result["source"] == "mcp"
+    assert spans(result["free_slots"]) == [("16:00", "17:00")]
+    assert calendar.calls["get-freebusy"] == 1
+
+    sync_with_gcal(USER_ID, token, MONDAY)
+    result = detect_available_slots(USER_ID, token, time_min=MONDAY[0], time_max=MONDAY[1])
+    assert result["source"] == "local"
+    assert spans(result["free_slots"]) == [("12:00", "14:00"), ("15:00", "17:00")]
+    assert result["free_busy"]["calendars"]["primary"]["busy"][0] == {"start": at(9), "end": at(12)}
+    assert calendar.calls["get-freebusy"] == 1
+
+
+def test_detect_slots_outside_the_synced_range_asks_the_server(calendar, token):
+    sync_with_gcal(USER_ID, token, MONDAY)
+    result = detect_available_slots(USER_ID, token, time_min=MONDAY[0], time_max=at(0, day=30))
+    assert result["source"] == "mcp"
+    assert calendar.calls["get-freebusy"] == 1
@@ -0,0 +1,42 @@
+# tests/test_gcal_batch.py
+
+import pytest
+from hushh_mcp.consent.token import issue_token
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.operons.gcal_sync import batch_events
+from hushh_mcp.operons.mcp_client import MCPClient, set_mcp_client
+
+
+USER_ID = "user_batch"
+AGENT_ID = "calendar_agent"
+
+
+@pytest.fixture
+def shared_client(mcp_stub):
+    set_mcp_client(MCPClient(mcp_stub.url))
+    yield mcp_stub
+    set_mcp_client(None)
+
+
+def test_batch_validates_consent_once_and_reports_partial_failures(shared_client):
+    shared_client.unsupported.add("batch-events")
+
+    def fail(body):
+        raise RuntimeError("conflict")
+    shared_client.handlers["update-event"] = fail
+
+    token = issue_token(USER_ID, AGENT_ID, ConsentScope.AGENT_GCAL_WRITE)
+    ops = [{"op": "create", "event_data": {"summary": f"Event {i}"}} for i in range(5)]
+    ops.append({"op": "update", "event_id": "evt1", "update_data": {}})
+
+    result = batch_events(USER_ID, token.token, ops)
+    assert result["status"] == "partial"
+    assert result["failed"] == 1
+    assert shared_client.calls["create-event"] == 5
+
+
+def test_batch_requires_write_scope(shared_client):
+    token = issue_token(USER_ID, AGENT_ID, ConsentScope.AGENT_GCAL_READ)
+    with pytest.raises(PermissionError):
+        batch_events(USER_ID, token.token, [{"op": "delete", "event_id": "evt1"}])
+    assert sum(shared_client.calls.values()) == 0
@@ -0,0 +1,212 @@
+# tests/test_gcal_incremental_sync.py
+
+import pytest
+from mcp_stub import StubError
+from hushh_mcp.agents.calendar_agent.state.event_index import (
+    EventIndexRegistry,
+    get_event_index,
+    set_event_index_registry
+)
+from hushh_mcp.consent.token import issue_token
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.operons.gcal_sync import sync_with_gcal
+from hushh_mcp.operons.mcp_client import MCPClient, set_mcp_client
+from hushh_mcp.vault.store import VaultStore
+
+
+USER_ID = "user_sync"
+AGENT_ID = "calendar_agent"
+TIME_RANGE = ("2025-07-01T00:00:00Z", "2025-08-01T00:00:00Z")
+
+
+class FakeCalendar:
+    """
+    list-events with Google-style sync tokens: token N means 'changes after version N'.
+    Results are paged `page_size` at a time; page tokens are offsets.
+    """
+
+    def __init__(self, page_size=100):
+        self.version = 0
+        self.events = {}
+        self.log = []  # (version, event)
+        self.requests = []
+        self.expired = False
+        self.page_size = page_size
+
+    def put(self, event_id, summary, status="confirmed"):
+        self.version += 1
+        event = {"id": event_id, "summary": summary, "status": status, "updated": f"2025-07-20T00:00:{self.version:02d}Z"}
+        self.events[event_id] = event
+        self.log.append((self.version, event))
+
+    def __call__(self, body):
+        self.requests.append(body)
+        if "sync_token" in body:
+            if self.expired:
+                raise StubError(410, "sync token expired")
+            since = int(body["sync_token"])
+            latest = {}
+            for version, event in self.log:
+                if version > since:
+                    latest[event["id"]] = event
+            items = list(latest.values())
+        else:
+            items = [e for e in self.events.values() if e["status"] != "cancelled"]
+        items.sort(key=lambda e: e["id"])
+
+        offset = int(body.get("page_token", 0))
+        end = offset + min(body.get("max_results", self.page_size), self.page_size)
+        if end < len(items):
+            return {"items": items[offset:end], "nextPageToken": str(end)}
+        return {"items": items[offset:], "nextSyncToken": str(self.version)}
+
+
+@pytest.fixture
+def calendar(mcp_stub):
+    fake = FakeCalendar()
+    mcp_stub.handlers["list-events"] = fake
+    set_mcp_client(MCPClient(mcp_stub.url))
+    set_event_index_registry(EventIndexRegistry())
+    yield fake
+    set_mcp_client(None)
+    set_event_index_registry(None)
+
+
+@pytest.fixture
+def token():
+    return issue_token(USER_ID, AGENT_ID, ConsentScope.AGENT_GCAL_READ).token
+
+
+def test_first_sync_is_full_then_only_deltas(calendar, token):
+    calendar.put("a", "Standup")
+    calendar.put("b", "Review")
+
+    first = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert first["full_sync"]
+    assert sorted(e["id"] for e in first["added"]) == ["a", "b"]
+
+    calendar.put("b", "Design review")
+    calendar.put("c", "Lunch")
+    calendar.put("a", "Standup", status="cancelled")
+
+    second = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert not second["full_sync"]
+    assert [e["id"] for e in second["added"]] == ["c"]
+    assert [e["summary"] for e in second["changed"]] == ["Design review"]
+    assert second["removed"] == ["a"]
+    assert calendar.requests[-1]["sync_token"] == "2"
+    assert "time_min" not in calendar.requests[-1]
+
+    assert sorted(get_event_index(USER_ID, "primary").events) == ["b", "c"]
+
+
+def test_unchanged_calendar_yields_empty_delta(calendar, token):
+    calendar.put("a", "Standup")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+    delta = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert delta == {"added": [], "changed": [], "removed": [], "full_sync": False, "truncated": False}
+
+
+def test_expired_sync_token_falls_back_to_full_sync(calendar, token):
+    calendar.put("a", "Standup")
+    calendar.put("b", "Review")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+
+    calendar.expired = True
+    del calendar.events["b"]
+    delta = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert delta["full_sync"]
+    assert delta["removed"] == ["b"]
+    assert "sync_token" not in calendar.requests[-1]
+
+
+def test_new_range_or_explicit_full_forces_full_sync(calendar, token):
+    calendar.put("a", "Standup")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+
+    assert sync_with_gcal(USER_ID, token, ("2025-09-01T00:00:00Z", "2025-10-01T00:00:00Z"))["full_sync"]
+    assert sync_with_gcal(USER_ID, token, TIME_RANGE, full=True)["full_sync"]
+
+
+def test_index_persists_across_restarts(calendar, token, tmp_path):
+    store = VaultStore(str(tmp_path / "vault.db"), compaction_interval_s=0)
+    set_event_index_registry(EventIndexRegistry(store))
+    calendar.put("a", "Standup")
+    calendar.put("b", "Review")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+    calendar.put("b", "Review", status="cancelled")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+
+    # A new process: the index and sync token come back from the vault
+    set_event_index_registry(EventIndexRegistry(store))
+    index = get_event_index(USER_ID, "primary")
+    assert sorted(index.events) == ["a"]
+    assert index.sync_token == "3"
+
+    calendar.put("c", "Lunch")
+    delta = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    store.close()
+    assert not delta["full_sync"]
+    assert [e["id"] for e in delta["added"]] == ["c"]
+
+
+def test_calendars_sharing_an_id_prefix_load_separately(calendar, token, vault_store):
+    set_event_index_registry(EventIndexRegistry(vault_store))
+    calendar.put("a", "Standup")
+    sync_with_gcal(USER_ID, token, TIME_RANGE, calendar_id="team")
+    calendar.put("b", "Review")
+    sync_with_gcal(USER_ID, token, TIME_RANGE, calendar_id="team:ops")
+
+    set_event_index_registry(EventIndexRegistry(vault_store))
+    assert sorted(get_event_index(USER_ID, "team").events) == ["a"]
+    assert sorted(get_event_index(USER_ID, "team:ops").events) == ["a", "b"]
+
+
+def test_sync_streams_every_page(calendar, token):
+    calendar.page_size = 2
+    for event_id in "abcde":
+        calendar.put(event_id, "Meeting")
+
+    delta = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert len(delta["added"]) == 5
+    assert not delta["truncated"]
+    assert len(calendar.requests) == 3
+    assert get_event_index(USER_ID, "primary").sync_token == "5"
+
+
+def test_truncated_sync_resumes_where_it_stopped(calendar, token):
+    calendar.page_size = 2
+    for event_id in "abcde":
+        calendar.put(event_id, "Meeting")
+
+    first = sync_with_gcal(USER_ID, token, TIME_RANGE, max_events=3)
+    assert first["truncated"]
+    assert [e["id"] for e in first["added"]] == ["a", "b", "c"]
+    # Stopped inside the second page: the third was never requested
+    assert len(calendar.requests) == 2
+    index = get_event_index(USER_ID, "primary")
+    assert index.sync_token is None
+
+    second = sync_with_gcal(USER_ID, token, TIME_RANGE, max_events=3)
+    assert second["full_sync"]
+    assert not second["truncated"]
+    assert [e["id"] for e in second["added"]] == ["d", "e"]
+    assert calendar.requests[-2]["page_token"] == "2"
+    assert sorted(index.events) == ["a", "b", "c", "d", "e"]
+    assert index.sync_token == "5"
+
+
+def test_truncated_full_sync_removes_missing_events_only_when_complete(calendar, token):
+    calendar.page_size = 2
+    for event_id in "abcd":
+        calendar.put(event_id, "Meeting")
+    sync_with_gcal(USER_ID, token, TIME_RANGE)
+
+    del calendar.events["a"]
+    partial = sync_with_gcal(USER_ID, token, TIME_RANGE, full=True, max_events=2)
+    assert partial["removed"] == []
+
+    rest = sync_with_gcal(USER_ID, token, TIME_RANGE)
+    assert rest["full_sync"]
+    assert rest["removed"] == ["a"]
+    assert sorted(get_event_index(USER_ID, "primary").events) == ["b", "c", "d"]
@@ -0,0 +1,77 @@
+# tests/test_keyring.py
+
+import base64
+import hashlib
+import hmac
+import time
+import pytest
+from hushh_mcp.keyring import Keyring, get_keyring, set_keyring
+from hushh_mcp.consent.token import issue_token, validate_token
+from hushh_mcp.trust.link import create_trust_link, verify_trust_link
+from hushh_mcp.config import SECRET_KEY
+from hushh_mcp.constants import ConsentScope
+
+
+USER_ID = "user_rotate"
+AGENT_ID = "calendar_agent"
+SCOPE = ConsentScope.AGENT_GCAL_READ
+NEW_SECRET = "n" * 48
+
+
+@pytest.fixture
+def restore_keyring():
+    original = get_keyring()
+    yield
+    set_keyring(original)
+
+
+def test_keyring_rejects_missing_active_key():
+    with pytest.raises(ValueError):
+        Keyring({0: SECRET_KEY}, active_key_id=1)
+
+
+def test_rotation_keeps_old_tokens_valid(restore_keyring):
+    old_v1 = issue_token(USER_ID, AGENT_ID, SCOPE, version=1)
+    old_v2 = issue_token(USER_ID, AGENT_ID, SCOPE, version=2)
+
+    set_keyring(Keyring({0: SECRET_KEY, 1: NEW_SECRET}, active_key_id=1))
+    new_token = issue_token(USER_ID, AGENT_ID, SCOPE, version=2)
+    assert new_token.key_id == 1
+
+    for token_obj in (old_v1, old_v2, new_token):
+        valid, reason, parsed = validate_token(token_obj.token, SCOPE)
+        assert valid is True, reason
+        assert parsed.key_id == token_obj.key_id
+
+
+def test_retired_key_removal_invalidates_tokens(restore_keyring):
+    token_obj = issue_token(USER_ID, AGENT_ID, SCOPE)
+    assert validate_token(token_obj.token, SCOPE)[0] is True  # now cached
+
+    set_keyring(Keyring({1: NEW_SECRET}, active_key_id=1))
+    assert validate_token(token_obj.token, SCOPE) == (False, "Unknown signing key", None)
+
+
+def test_legacy_token_without_key_id():
+    issued_at = int(time.time() * 1000)
+    raw = f"{USER_ID}|{AGENT_ID}|{SCOPE.value}|{issued_at}|{issued_at + 60_000}"
+    signature = hmac.new(SECRET_KEY.encode(), raw.encode(), hashlib.sha256).hexdigest()
+    legacy = f"HCT:{base64.urlsafe_b64encode(raw.encode()).decode()}.{signature}"
+
+    valid, reason, parsed = validate_token(legacy, SCOPE)
+    assert valid is True, reason
+    assert parsed.key_id == 0
+
+
+def test_trust_link_rotation(restore_keyring):
+    link = create_trust_link("agent_identity", "agent_shopper", ConsentScope.VAULT_READ_EMAIL, USER_ID)
+
+    set_keyring(Keyring({0: SECRET_KEY, 1: NEW_SECRET}, active_key_id=1))
+    assert verify_trust_link(link) is True
+    rotated = create_trust_link("agent_identity", "agent_shopper", ConsentScope.VAULT_READ_EMAIL, USER_ID)
+    assert rotated.key_id == 1
+    assert verify_trust_link(rotated) is True
+
+    set_keyring(Keyring({1: NEW_SECRET}, active_key_id=1))
+    assert verify_trust_link(link) is False
+    assert verify_trust_link(link.model_copy(update={"key_id": None})) is False
@@ -0,0 +1,155 @@
+# tests/test_llm_async.py
+
+import asyncio
+import datetime
+import json
+import threading
+import time
+import pytest
+from hushh_mcp.agents.calendar_agent.state import gemini_llm
+from hushh_mcp.agents.calendar_agent.state.llm_async import AsyncLLM, TokenBucket, split_batch_response
+from hushh_mcp.agents.calendar_agent.state.llm_cache import LLMResponseCache, set_llm_cache
+from hushh_mcp.operons.utils import parse_time_ranges
+
+
+MONDAY = datetime.date(2025, 7, 28)
+REQUESTS_MARKER = "Requests (JSON array): "
+
+
+class FakeModel:
+    """A local generate(prompt, system): echoes prompts, answers batch prompts with a JSON array."""
+
+    def __init__(self, latency=0.0, batch_reply=None):
+        self.latency = latency
+        self.batch_reply = batch_reply
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt, system=None):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if REQUESTS_MARKER in prompt:
+                if self.batch_reply is not None:
+                    return self.batch_reply
+                requests = json.loads(prompt.split(REQUESTS_MARKER, 1)[1].split("\n", 1)[0])
+                return json.dumps([self.answer(request) for request in requests])
+            return self.answer(prompt)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @staticmethod
+    def answer(prompt):
+        if "Parse this time range" in prompt:
+            day = prompt.split("Today is ", 1)[1][:10]
+            return json.dumps({"start": f"{day}T12:00:00Z", "end": f"{day}T17:00:00Z"})
+        return f"answer: {prompt}"
+
+
+@pytest.fixture
+def fake():
+    return FakeModel()
+
+
+@pytest.fixture
+def llm(fake):
+    llm = AsyncLLM(fake, max_concurrency=4, rate_per_s=0, batch_window_s=0.02, batch_max_prompts=8)
+    yield llm
+    llm.close()
+
+
+async def gather(llm, prompts, **kwargs):
+    return await asyncio.gather(*(llm.chat(prompt, **kwargs) for prompt in prompts))
+
+
+def test_concurrency_is_bounded(fake, llm):
+    fake.latency = 0.05
+    started = time.perf_counter()
+    answers = asyncio.run(gather(llm, [f"q{i}" for i in range(12)]))
+    elapsed = time.perf_counter() - started
+
+    assert answers == [f"answer: q{i}" for i in range(12)]
+    assert fake.max_in_flight == 4
+    assert elapsed < 12 * 0.05 * 0.75
+
+
+def test_token_bucket_paces_calls_after_the_burst():
+    now = [0.0]
+    bucket = TokenBucket(rate_per_s=10, burst=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, pytest.approx(0.1), pytest.approx(0.2)]
+    now[0] = 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_rate_limit_applies_to_model_calls(fake):
+    llm = AsyncLLM(fake, max_concurrency=8, rate_per_s=50, burst=1, batch_max_prompts=1)
+    try:
+        started = time.perf_counter()
+        asyncio.run(gather(llm, [f"q{i}" for i in range(6)]))
+        assert time.perf_counter() - started >= 5 / 50 * 0.9
+        assert llm.stats()["rate_limited"] == 5
+    finally:
+        llm.close()
+
+
+def test_short_prompts_are_micro_batched(fake, llm):
+    prompts = [f"short {i}" for i in range(5)] + ["short 0"]
+    answers = asyncio.run(gather(llm, prompts, batch=True))
+
+    assert answers == [f"answer: {prompt}" for prompt in prompts]
+    assert len(fake.prompts) == 1
+    assert llm.stats()["batched_prompts"] == 5
+
+    # Long prompts and prompts with a system prompt are not batched
+    asyncio.run(gather(llm, ["x" * 10_000, "y"], batch=True))
+    asyncio.run(llm.chat("z", system="Be brief.", batch=True))
+    assert len(fake.prompts) == 4
+
+
+def test_unsplittable_batch_reply_falls_back_to_single_calls(fake, llm):
+    fake.batch_reply = "Sure! Here are your answers..."
+    answers = asyncio.run(gather(llm, ["a", "b", "c"], batch=True))
+    assert answers == ["answer: a", "answer: b", "answer: c"]
+    assert len(fake.prompts) == 4
+    assert llm.stats()["batch_fallbacks"] == 1
+
+    assert split_batch_response('```json\n["x", {"start": "s"}]\n```', 2) == ["x", '{"start": "s"}']
+    assert split_batch_response('["x"]', 2) is None
+
+
+def test_errors_reach_every_waiting_caller(llm):
+    def broken(prompt, system=None):
+        raise RuntimeError("model unavailable")
+    llm.generate = broken
+
+    async def run():
+        return await asyncio.gather(*(llm.chat(p, batch=True) for p in "ab"), return_exceptions=True)
+    assert [str(error) for error in asyncio.run(run())] == ["model unavailable"] * 2
+
+
+def test_sync_callers_share_the_loop_thread_and_cache(fake, llm, monkeypatch):
+    monkeypatch.setattr(gemini_llm, "_async_llm", llm)
+    cache = LLMResponseCache()
+    set_llm_cache(cache)
+    try:
+        phrases = ["tomorrow afternoon", "next friday", "this evening"]
+        results = parse_time_ranges(phrases, today=MONDAY)
+        assert results == [("2025-07-28T12:00:00Z", "2025-07-28T17:00:00Z")] * 3
+        assert len(fake.prompts) == 1
+
+        # From other threads at once, and again from the cache
+        threads = [threading.Thread(target=parse_time_ranges, args=(phrases, MONDAY)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(fake.prompts) == 1
+        assert cache.stats()["memory_hits"] == 9
+    finally:
+        set_llm_cache(None)
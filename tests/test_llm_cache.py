@@ -0,0 +1,153 @@
+# tests/test_llm_cache.py
+
+import datetime
+import pytest
+from hushh_mcp.agents.calendar_agent.state import gemini_llm
+from hushh_mcp.agents.calendar_agent.state.llm_cache import (
+    LLMResponseCache,
+    SQLiteResponseStore,
+    prompt_key,
+    set_llm_cache
+)
+from hushh_mcp.agents.calendar_agent.state.llm_providers import StubProvider, set_llm_provider
+from hushh_mcp.operons.utils import parse_time_range
+
+
+MODEL = "gemini-test"
+MONDAY = datetime.date(2025, 7, 28)
+PARSE_RESPONSE = '{"start": "2025-07-29T12:00:00Z", "end": "2025-07-29T17:00:00Z"}'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def unreachable(prompt, system=None):
+    raise AssertionError("the model must not be called")
+
+
+@pytest.fixture
+def model():
+    stub = StubProvider(default="ok")
+    set_llm_provider(stub)
+    yield stub
+    set_llm_provider(None)
+
+
+@pytest.fixture
+def cache():
+    cache = LLMResponseCache()
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(None)
+
+
+def test_key_normalizes_whitespace_but_not_content():
+    key = prompt_key(MODEL, None, "Summarize:\n  Events: [a, b]\n")
+    assert key == prompt_key(MODEL, "", "Summarize:\r\n\tEvents:   [a, b]   \n\n\n")
+    assert key != prompt_key(MODEL, None, "Summarize:\nEvents: [a, c]")
+    assert key != prompt_key(MODEL, "Be brief.", "Summarize:\nEvents: [a, b]")
+    assert key != prompt_key("gemini-other", None, "Summarize:\nEvents: [a, b]")
+
+
+def test_gemini_chat_calls_the_model_once_per_prompt(model, cache):
+    for _ in range(3):
+        assert gemini_llm.gemini_chat("Summarize my week", template="summarize_calendar") == "ok"
+    gemini_llm.gemini_chat("Summarize my week", system="Be brief.", template="summarize_calendar")
+    assert len(model.calls) == 2
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"]) == (2, 2)
+    assert stats["hit_rate"] == 0.5
+    assert stats["templates"]["summarize_calendar"]["hit_rate"] == 0.5
+
+
+def test_parse_time_range_is_cached_per_day(model, cache):
+    model.default = PARSE_RESPONSE
+    tuesday = datetime.date(2025, 7, 29)
+    for _ in range(3):
+        assert parse_time_range("tomorrow afternoon", today=MONDAY) == ("2025-07-29T12:00:00Z", "2025-07-29T17:00:00Z")
+    parse_time_range("tomorrow afternoon", today=tuesday)
+    assert len(model.calls) == 2
+
+
+def test_ttls_are_per_template():
+    clock = Clock()
+    cache = LLMResponseCache(ttls={"parse_time_range": 3600, "reschedule_task": 0}, default_ttl_s=60, clock=clock)
+    calls = []
+
+    def ask(prompt, template):
+        return cache.get_or_call(MODEL, None, prompt, lambda: calls.append(prompt) or prompt, template)
+
+    for _ in range(2):
+        ask("parse", "parse_time_range")
+        ask("other", None)
+        ask("move", "reschedule_task")
+    assert calls == ["parse", "other", "move", "move"]
+
+    clock.now += 120
+    ask("parse", "parse_time_range")
+    ask("other", None)
+    assert calls[-1] == "other" and calls.count("parse") == 1
+
+
+def test_memory_tier_is_lru_bounded_and_disk_tier_promotes(tmp_path):
+    store = SQLiteResponseStore(str(tmp_path / "llm.db"))
+    cache = LLMResponseCache(store, max_entries=2)
+    for prompt in ("a", "b", "c"):
+        cache.put(MODEL, None, prompt, prompt.upper())
+    assert cache.stats()["size"] == 2 and len(store) == 3
+
+    assert cache.get(MODEL, None, "a") == "A"
+    assert cache.get(MODEL, None, "a") == "A"
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+    store.close()
+
+
+def test_expired_disk_entries_are_dropped(tmp_path):
+    clock = Clock()
+    store = SQLiteResponseStore(str(tmp_path / "llm.db"))
+    LLMResponseCache(store, default_ttl_s=10, clock=clock).put(MODEL, None, "p", "r")
+    clock.now += 11
+    assert LLMResponseCache(store, clock=clock).get(MODEL, None, "p") is None
+    assert len(store) == 0
+    store.close()
+
+
+def test_expired_rows_are_purged_when_the_store_opens(tmp_path):
+    path = str(tmp_path / "llm.db")
+    store = SQLiteResponseStore(path)
+    LLMResponseCache(store, default_ttl_s=10, clock=lambda: 0.0).put(MODEL, None, "old", "r")
+    LLMResponseCache(store, default_ttl_s=10).put(MODEL, None, "fresh", "r")
+    store.close()
+
+    assert len(SQLiteResponseStore(path, purge_on_open=False)) == 2
+    reopened = SQLiteResponseStore(path)
+    assert len(reopened) == 1
+    reopened.close()
+
+
+def test_replay_runs_offline_from_a_recorded_cache(tmp_path, model):
+    path = str(tmp_path / "recorded.db")
+    model.default = PARSE_RESPONSE
+    recorder = LLMResponseCache(SQLiteResponseStore(path))
+    set_llm_cache(recorder)
+    try:
+        parse_time_range("tomorrow afternoon", today=MONDAY)
+        recorder.store.close()
+
+        # A later run: far past every TTL, and the model is unreachable
+        replay = LLMResponseCache(SQLiteResponseStore(path, purge_on_open=False), mode="replay", clock=lambda: 10 ** 12)
+        set_llm_cache(replay)
+        model.respond = unreachable
+        assert parse_time_range("tomorrow afternoon", today=MONDAY) == ("2025-07-29T12:00:00Z", "2025-07-29T17:00:00Z")
+        with pytest.raises(RuntimeError):
+            gemini_llm.gemini_chat("never recorded")
+        replay.store.close()
+    finally:
+        set_llm_cache(None)
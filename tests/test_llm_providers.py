@@ -0,0 +1,72 @@
+# tests/test_llm_providers.py
+
+import os
+import subprocess
+import sys
+import pytest
+from hushh_mcp.agents.calendar_agent.state import gemini_llm
+from hushh_mcp.agents.calendar_agent.state.llm_cache import LLMResponseCache, set_llm_cache
+from hushh_mcp.agents.calendar_agent.state.llm_providers import (
+    GeminiProvider,
+    LLMProvider,
+    StubProvider,
+    create_provider,
+    register_provider,
+    set_llm_provider
+)
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def provider():
+    set_llm_cache(LLMResponseCache())
+    yield
+    set_llm_cache(None)
+    set_llm_provider(None)
+
+
+def test_operons_import_without_sdk_or_api_key():
+    script = (
+        "import sys\n"
+        "import hushh_mcp.operons.utils, hushh_mcp.operons.detect_slots\n"
+        "assert 'google.generativeai' not in sys.modules\n"
+        "from hushh_mcp.operons.utils import parse_time_range\n"
+        "print(parse_time_range('tomorrow'))\n"
+    )
+    env = {**os.environ, "GEMINI_API_KEY": "", "LLM_PROVIDER": "stub", "LLM_CACHE_ENABLED": "false"}
+    result = subprocess.run([sys.executable, "-W", "ignore", "-c", script], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert "2025-07-25T15:00:00Z" in result.stdout
+
+
+def test_gemini_needs_a_key_only_when_called():
+    gemini = GeminiProvider(api_key=None)
+    assert gemini.model_name
+    with pytest.raises(ValueError):
+        gemini.generate("hello")
+
+
+def test_stub_answers_by_prompt_content(provider):
+    stub = StubProvider({"Parse this time range": '{"start": "s", "end": "e"}'}, default="fine")
+    set_llm_provider(stub)
+    assert gemini_llm.gemini_chat("Parse this time range into ISO 8601: 'noon'") == '{"start": "s", "end": "e"}'
+    assert gemini_llm.gemini_chat("How is my week?", system="Be brief.") == "fine"
+    assert stub.calls[-1] == ("How is my week?", "Be brief.")
+
+
+def test_providers_are_selected_by_name(provider):
+    class EchoProvider(LLMProvider):
+        name = "echo"
+
+        def generate(self, prompt, system=None):
+            return prompt.upper()
+
+    register_provider("echo", lambda: EchoProvider("echo-1"))
+    assert isinstance(create_provider("stub"), StubProvider)
+    set_llm_provider(create_provider("ECHO"))
+    assert gemini_llm.gemini_chat("hi") == "HI"
+    with pytest.raises(ValueError):
+        create_provider("gpt-9")
@@ -0,0 +1,112 @@
+# tests/test_mcp_cache.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hushh_mcp.consent.token import issue_token, revoke_token
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.operons.mcp_cache import MCPResponseCache, cache_key
+from hushh_mcp.operons.mcp_client import MCPClient
+
+
+USER_ID = "user_cache"
+TOKEN = "HCT:stub"
+TIME_MIN = "2025-07-28T00:00:00Z"
+TIME_MAX = "2025-07-29T00:00:00Z"
+
+
+def test_key_ignores_calendar_order_but_not_token():
+    a = cache_key("get-freebusy", {"user_id": USER_ID, "consent_token": "t1", "calendar_ids": ["b", "a"], "time_min": TIME_MIN})
+    b = cache_key("get-freebusy", {"time_min": TIME_MIN, "calendar_ids": ["a", "b"], "consent_token": "t1", "user_id": USER_ID})
+    assert a == b
+    assert a != cache_key("get-freebusy", {"user_id": USER_ID, "consent_token": "t2", "calendar_ids": ["a", "b"], "time_min": TIME_MIN})
+    assert a != cache_key("get-freebusy", {"user_id": "user_other", "consent_token": "t1", "calendar_ids": ["a", "b"], "time_min": TIME_MIN})
+
+
+def test_other_or_revoked_tokens_miss_the_cache(mcp_stub):
+    token = issue_token(USER_ID, "calendar_agent", ConsentScope.AGENT_GCAL_READ).token
+    with MCPClient(mcp_stub.url, cache=MCPResponseCache()) as client:
+        client.list_calendars(USER_ID, token)
+        client.list_calendars(USER_ID, token)
+        assert mcp_stub.calls["list-calendars"] == 1
+
+        client.list_calendars(USER_ID, "HCT:made-up")
+        assert mcp_stub.calls["list-calendars"] == 2
+
+        revoke_token(token)
+        client.list_calendars(USER_ID, token)
+        assert mcp_stub.calls["list-calendars"] == 3
+
+
+def test_repeated_reads_hit_the_cache(mcp_stub):
+    with MCPClient(mcp_stub.url, cache=MCPResponseCache()) as client:
+        for _ in range(5):
+            client.get_freebusy(USER_ID, TOKEN, TIME_MIN, TIME_MAX)
+            client.list_colors(USER_ID, TOKEN)
+        client.get_freebusy(USER_ID, TOKEN, TIME_MIN, "2025-07-30T00:00:00Z")
+        stats = client.cache.stats()
+
+    assert mcp_stub.calls["get-freebusy"] == 2
+    assert mcp_stub.calls["list-colors"] == 1
+    assert stats["hits"] == 8
+
+
+def test_entries_expire_per_endpoint(mcp_stub):
+    cache = MCPResponseCache(ttls={"list-events": 0.05, "list-calendars": 60})
+    with MCPClient(mcp_stub.url, cache=cache) as client:
+        client.list_events(USER_ID, TOKEN)
+        client.list_calendars(USER_ID, TOKEN)
+        time.sleep(0.1)
+        client.list_events(USER_ID, TOKEN)
+        client.list_calendars(USER_ID, TOKEN)
+
+    assert mcp_stub.calls["list-events"] == 2
+    assert mcp_stub.calls["list-calendars"] == 1
+
+
+def test_concurrent_identical_reads_share_one_call(mcp_stub):
+    release = threading.Event()
+
+    def slow(body):
+        release.wait(2)
+        return {"items": []}
+    mcp_stub.handlers["list-events"] = slow
+
+    with MCPClient(mcp_stub.url, cache=MCPResponseCache()) as client:
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(client.list_events, USER_ID, TOKEN) for _ in range(8)]
+            time.sleep(0.2)
+            release.set()
+            results = [f.result() for f in futures]
+
+    assert results == [{"items": []}] * 8
+    assert mcp_stub.calls["list-events"] == 1
+
+
+def test_writes_invalidate_only_that_user(mcp_stub):
+    with MCPClient(mcp_stub.url, cache=MCPResponseCache()) as client:
+        client.list_events(USER_ID, TOKEN)
+        client.list_events("user_other", TOKEN)
+        client.create_event(USER_ID, TOKEN, {"summary": "New"})
+        client.list_events(USER_ID, TOKEN)
+        client.list_events("user_other", TOKEN)
+
+    assert mcp_stub.calls["list-events"] == 3
+
+
+def test_errors_are_not_cached(mcp_stub):
+    attempts = []
+
+    def flaky(body):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return {"items": []}
+    mcp_stub.handlers["list-events"] = flaky
+
+    with MCPClient(mcp_stub.url, cache=MCPResponseCache()) as client:
+        try:
+            client.list_events(USER_ID, TOKEN)
+        except Exception:
+            pass
+        assert client.list_events(USER_ID, TOKEN) == {"items": []}
@@ -0,0 +1,223 @@
+# tests/test_mcp_client.py
+
+import asyncio
+import pytest
+import requests
+from hushh_mcp.operons import mcp_adapter, mcp_client
+from hushh_mcp.operons.mcp_client import AsyncMCPClient, MCPClient, set_mcp_client
+
+
+USER_ID = "user_mcp"
+TOKEN = "HCT:stub"
+
+
+def test_client_reuses_one_connection(mcp_stub):
+    with MCPClient(mcp_stub.url) as client:
+        for _ in range(20):
+            assert client.list_events(USER_ID, TOKEN)["items"][0]["id"] == "evt1"
+
+    assert mcp_stub.calls["list-events"] == 20
+    assert mcp_stub.connections == 1
+
+
+def test_request_body_matches_tool_arguments(mcp_stub):
+    mcp_stub.handlers["update-event"] = lambda body: body
+    with MCPClient(mcp_stub.url) as client:
+        body = client.update_event(USER_ID, TOKEN, "evt1", {"summary": "Moved"}, calendar_id="primary")
+
+    assert body == {
+        "user_id": USER_ID,
+        "consent_token": TOKEN,
+        "event_id": "evt1",
+        "update_data": {"summary": "Moved"},
+        "calendar_id": "primary",
+    }
+
+
+def test_http_errors_are_raised(mcp_stub):
+    def fail(body):
+        raise RuntimeError("boom")
+    mcp_stub.handlers["list-colors"] = fail
+
+    with MCPClient(mcp_stub.url) as client:
+        with pytest.raises(requests.HTTPError):
+            client.list_colors(USER_ID, TOKEN)
+
+
+def test_module_functions_use_the_shared_client(mcp_stub):
+    set_mcp_client(MCPClient(mcp_stub.url))
+    try:
+        mcp_adapter.list_calendars(USER_ID, TOKEN)
+        mcp_adapter.get_freebusy(USER_ID, TOKEN, "2025-07-28T00:00:00Z", "2025-07-29T00:00:00Z")
+    finally:
+        set_mcp_client(None)
+
+    assert mcp_stub.calls["list-calendars"] == 1
+    assert mcp_stub.calls["get-freebusy"] == 1
+    assert mcp_stub.connections == 1
+
+
+def test_async_client_has_the_same_surface(mcp_stub):
+    async def run():
+        async with AsyncMCPClient(mcp_stub.url) as client:
+            return await asyncio.gather(*(client.list_events(USER_ID, TOKEN) for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert len(results) == 10
+    assert mcp_stub.calls["list-events"] == 10
+
+
+BATCH = [
+    {"op": "create", "event_data": {"summary": "Kickoff"}},
+    {"op": "update", "event_id": "evt1", "update_data": {"summary": "Moved"}},
+    {"op": "delete", "event_id": "evt2"},
+]
+
+
+def test_batch_events_sends_one_request(mcp_stub):
+    mcp_stub.handlers["batch-events"] = lambda body: {
+        "results": [{"ok": True, "result": {"op": op["op"]}} for op in body["operations"]]
+    }
+    with MCPClient(mcp_stub.url) as client:
+        results = client.batch_events(USER_ID, TOKEN, BATCH, calendar_id="primary")
+
+    assert [r["result"]["op"] for r in results] == ["create", "update", "delete"]
+    assert mcp_stub.calls["batch-events"] == 1
+    assert sum(mcp_stub.calls[t] for t in ("create-event", "update-event", "delete-event")) == 0
+
+
+def test_batch_events_falls_back_to_parallel_single_calls(mcp_stub):
+    mcp_stub.unsupported.add("batch-events")
+
+    def fail(body):
+        raise RuntimeError("event not found")
+    mcp_stub.handlers["delete-event"] = fail
+
+    with MCPClient(mcp_stub.url) as client:
+        results = client.batch_events(USER_ID, TOKEN, BATCH)
+        client.batch_events(USER_ID, TOKEN, BATCH[:1])
+        assert client.batch_supported is False
+
+    assert [r["ok"] for r in results] == [True, True, False]
+    assert "HTTPError" in results[2]["error"]
+    # The missing endpoint is only probed once
+    assert mcp_stub.calls["batch-events"] == 1
+    assert mcp_stub.calls["create-event"] == 2
+
+
+def test_batch_events_keeps_applied_chunks_when_a_later_one_fails(mcp_stub, monkeypatch):
+    monkeypatch.setattr(mcp_client, "MCP_BATCH_MAX_OPS", 2)
+    requests_seen = []
+
+    def handler(body):
+        requests_seen.append(body)
+        if len(requests_seen) == 2:
+            raise RuntimeError("server crashed")
+        return {"results": [{"ok": True, "result": {"op": op["op"]}} for op in body["operations"]]}
+    mcp_stub.handlers["batch-events"] = handler
+
+    ops = BATCH + BATCH[:2]
+    with MCPClient(mcp_stub.url) as client:
+        results = client.batch_events(USER_ID, TOKEN, ops)
+
+    assert [r["ok"] for r in results] == [True, True, False, False, True]
+    assert "HTTPError" in results[2]["error"]
+    assert mcp_stub.calls["batch-events"] == 3
+
+    async def run():
+        async with AsyncMCPClient(mcp_stub.url) as client:
+            return await client.batch_events(USER_ID, TOKEN, ops)
+    requests_seen.clear()
+    assert [r["ok"] for r in asyncio.run(run())] == [True, True, False, False, True]
+
+
+def test_batch_events_raises_when_the_first_chunk_fails(mcp_stub):
+    def handler(body):
+        raise RuntimeError("server crashed")
+    mcp_stub.handlers["batch-events"] = handler
+    with MCPClient(mcp_stub.url) as client:
+        with pytest.raises(requests.HTTPError):
+            client.batch_events(USER_ID, TOKEN, BATCH)
+
+
+def test_batch_events_rejects_malformed_ops_before_sending(mcp_stub):
+    with MCPClient(mcp_stub.url) as client:
+        with pytest.raises(ValueError, match="op 1: missing update_data"):
+            client.batch_events(USER_ID, TOKEN, [BATCH[0], {"op": "update", "event_id": "evt1"}])
+    assert sum(mcp_stub.calls.values()) == 0
+
+
+def test_async_batch_events_fallback(mcp_stub):
+    mcp_stub.unsupported.add("batch-events")
+
+    async def run():
+        async with AsyncMCPClient(mcp_stub.url) as client:
+            return await client.batch_events(USER_ID, TOKEN, BATCH, max_concurrency=2)
+
+    assert [r["ok"] for r in asyncio.run(run())] == [True, True, True]
+
+
+def paged(total, page_size):
+    """list-events/search-events handler over `total` events; page tokens are offsets."""
+    def handler(body):
+        offset = int(body.get("page_token", 0))
+        end = offset + min(body.get("max_results", page_size), page_size)
+        response = {"items": [{"id": f"evt{i}"} for i in range(offset, min(end, total))]}
+        if end < total:
+            response["nextPageToken"] = str(end)
+        else:
+            response["nextSyncToken"] = "sync1"
+        return response
+    return handler
+
+
+def test_iter_events_follows_page_tokens(mcp_stub):
+    mcp_stub.handlers["list-events"] = paged(7, 3)
+    with MCPClient(mcp_stub.url) as client:
+        stream = client.iter_events(USER_ID, TOKEN)
+        ids = [event["id"] for event in stream]
+
+    assert ids == [f"evt{i}" for i in range(7)]
+    assert stream.pages == mcp_stub.calls["list-events"] == 3
+    assert stream.complete and not stream.truncated
+    assert stream.next_sync_token == "sync1"
+
+
+def test_iter_events_stops_fetching_at_max_events(mcp_stub):
+    mcp_stub.handlers["list-events"] = paged(100, 10)
+    with MCPClient(mcp_stub.url) as client:
+        stream = client.iter_events(USER_ID, TOKEN, max_events=15)
+        assert len(list(stream)) == 15
+        assert stream.truncated and not stream.complete
+        assert stream.resume_token == "10"
+
+        # Breaking out early stops paging too
+        for _ in client.iter_search_events(USER_ID, TOKEN, "standup"):
+            break
+
+        rest = client.iter_events(USER_ID, TOKEN, page_token=stream.resume_token, max_events=5)
+        assert [event["id"] for event in rest] == [f"evt{i}" for i in range(10, 15)]
+
+    assert mcp_stub.calls["list-events"] == 3
+    assert mcp_stub.calls["search-events"] == 1
+
+
+def test_bare_list_responses_are_one_page(mcp_stub):
+    mcp_stub.handlers["search-events"] = lambda body: [{"id": "evt1"}, {"id": "evt2"}]
+    with MCPClient(mcp_stub.url) as client:
+        stream = client.iter_search_events(USER_ID, TOKEN, "review")
+        assert len(list(stream)) == 2
+    assert stream.complete and stream.pages == 1
+
+
+def test_async_iter_events(mcp_stub):
+    mcp_stub.handlers["list-events"] = paged(7, 3)
+
+    async def run():
+        async with AsyncMCPClient(mcp_stub.url) as client:
+            stream = client.iter_events(USER_ID, TOKEN, max_events=5)
+            return [event["id"] async for event in stream], stream
+
+    ids, stream = asyncio.run(run())
+    assert ids == [f"evt{i}" for i in range(5)]
+    assert stream.truncated and stream.pages == 2
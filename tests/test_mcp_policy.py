@@ -0,0 +1,155 @@
+# tests/test_mcp_policy.py
+
+import asyncio
+import time
+import pytest
+import requests
+from mcp_stub import DROP
+from hushh_mcp.operons.mcp_client import AsyncMCPClient, MCPClient
+from hushh_mcp.operons.mcp_policy import CircuitBreaker, CircuitOpenError, RetryPolicy, TransportPolicy
+
+
+USER_ID = "user_policy"
+TOKEN = "HCT:stub"
+DAY = ("2025-07-28T00:00:00Z", "2025-07-29T00:00:00Z")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def policy(**kwargs):
+    kwargs.setdefault("retry", RetryPolicy(max_attempts=3, base_delay_s=0))
+    kwargs.setdefault("hedge_tools", ())
+    return TransportPolicy(**kwargs)
+
+
+def test_reads_are_retried_on_transient_errors(mcp_stub):
+    mcp_stub.inject("list-events", 503, DROP)
+    transport = policy()
+    with MCPClient(mcp_stub.url, policy=transport) as client:
+        assert client.list_events(USER_ID, TOKEN)["items"][0]["id"] == "evt1"
+
+    assert mcp_stub.calls["list-events"] == 3
+    assert transport.stats()["retries"] == 2
+
+
+def test_retries_give_up_after_max_attempts(mcp_stub):
+    mcp_stub.inject("list-calendars", 500, 500, 500, 500)
+    with MCPClient(mcp_stub.url, policy=policy()) as client:
+        with pytest.raises(requests.HTTPError):
+            client.list_calendars(USER_ID, TOKEN)
+    assert mcp_stub.calls["list-calendars"] == 3
+
+
+def test_writes_and_client_errors_are_not_retried(mcp_stub):
+    mcp_stub.inject("create-event", 503)
+    mcp_stub.inject("list-events", 410)
+    transport = policy()
+    with MCPClient(mcp_stub.url, policy=transport) as client:
+        with pytest.raises(requests.HTTPError):
+            client.create_event(USER_ID, TOKEN, {"summary": "Kickoff"})
+        with pytest.raises(requests.HTTPError):
+            client.list_events(USER_ID, TOKEN, sync_token="1")
+
+    assert mcp_stub.calls["create-event"] == 1
+    assert mcp_stub.calls["list-events"] == 1
+    # A 410 means the endpoint is healthy
+    assert transport.breaker("list-events").state == CircuitBreaker.CLOSED
+
+
+def test_backoff_is_jittered_and_capped():
+    retry = RetryPolicy(max_attempts=5, base_delay_s=0.1, max_delay_s=0.5)
+    delays = [retry.backoff(attempt) for attempt in range(5) for _ in range(50)]
+    assert all(0 <= delay <= 0.5 for delay in delays)
+    assert len(set(delays)) > 1
+    assert max(retry.backoff(0) for _ in range(50)) <= 0.1
+
+
+def test_breaker_opens_and_fails_fast(mcp_stub):
+    mcp_stub.inject("get-freebusy", *[503] * 4)
+    clock = FakeClock()
+    transport = policy(retry=RetryPolicy(max_attempts=1), failure_threshold=2, reset_timeout_s=30, clock=clock)
+    with MCPClient(mcp_stub.url, policy=transport) as client:
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                client.get_freebusy(USER_ID, TOKEN, *DAY)
+        with pytest.raises(CircuitOpenError):
+            client.get_freebusy(USER_ID, TOKEN, *DAY)
+        # Other endpoints have their own breaker
+        client.list_calendars(USER_ID, TOKEN)
+
+    assert mcp_stub.calls["get-freebusy"] == 2
+    assert transport.stats()["open"] == ["get-freebusy"]
+    assert transport.stats()["rejected"] == 1
+
+
+def test_half_open_probe_closes_or_reopens_the_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker("list-events", failure_threshold=1, reset_timeout_s=10, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_hedged_read_beats_a_stalled_request(mcp_stub):
+    mcp_stub.inject("get-freebusy", 1.0)
+    transport = policy(hedge_tools="get-freebusy", hedge_delay_s=0.05)
+    with MCPClient(mcp_stub.url, policy=transport) as client:
+        started = time.perf_counter()
+        result = client.get_freebusy(USER_ID, TOKEN, *DAY)
+        elapsed = time.perf_counter() - started
+
+    assert result["ok"]
+    assert elapsed < 0.5
+    assert mcp_stub.calls["get-freebusy"] == 2
+    assert transport.stats()["hedges"] == 1
+    transport.close()
+
+
+def test_fast_reads_are_not_hedged(mcp_stub):
+    transport = policy(hedge_tools="get-freebusy,create-event", hedge_delay_s=0.5)
+    with MCPClient(mcp_stub.url, policy=transport) as client:
+        client.get_freebusy(USER_ID, TOKEN, *DAY)
+    assert mcp_stub.calls["get-freebusy"] == 1
+    # Writes are never hedged
+    assert transport.hedge_tools == {"get-freebusy"}
+    transport.close()
+
+
+def test_async_client_retries_and_hedges(mcp_stub):
+    mcp_stub.inject("list-events", 502)
+    mcp_stub.inject("get-freebusy", 1.0)
+    transport = policy(hedge_tools="get-freebusy", hedge_delay_s=0.05)
+
+    async def run():
+        async with AsyncMCPClient(mcp_stub.url, policy=transport) as client:
+            events = await client.list_events(USER_ID, TOKEN)
+            started = time.perf_counter()
+            await client.get_freebusy(USER_ID, TOKEN, *DAY)
+            return events, time.perf_counter() - started
+
+    events, elapsed = asyncio.run(run())
+    assert events["items"][0]["id"] == "evt1"
+    assert mcp_stub.calls["list-events"] == 2
+    assert elapsed < 0.5
+    assert transport.stats() == {"retries": 1, "hedges": 1, "rejected": 0, "open": []}
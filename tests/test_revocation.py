@@ -0,0 +1,100 @@
+# tests/test_revocation.py
+
+import time
+from hushh_mcp.consent.revocation import (
+    BloomFilter,
+    InMemoryRevocationStore,
+    SQLiteRevocationStore,
+    token_digest
+)
+from hushh_mcp.consent.token import (
+    issue_token,
+    revoke_token,
+    validate_token,
+    is_token_revoked,
+    set_revocation_store
+)
+from hushh_mcp.constants import ConsentScope
+
+
+USER_ID = "user_revoke"
+AGENT_ID = "agent_shopper"
+SCOPE = ConsentScope.VAULT_READ_EMAIL
+
+
+def _future_ms(seconds: int = 3600) -> int:
+    return int(time.time() * 1000) + seconds * 1000
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    digests = [token_digest(f"token_{i}") for i in range(1000)]
+    for digest in digests:
+        bloom.add(digest)
+
+    assert all(digest in bloom for digest in digests)
+    false_positives = sum(token_digest(f"other_{i}") in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_in_memory_store_drops_expired_entries():
+    store = InMemoryRevocationStore()
+    store.add("HCT:live", _future_ms())
+    store.add("HCT:stale", int(time.time() * 1000) - 1000)
+
+    assert store.contains("HCT:live") is True
+    assert store.contains("HCT:stale") is False
+    assert len(store) == 1
+
+
+def test_sqlite_store_is_shared_and_persistent(tmp_path):
+    path = str(tmp_path / "revocations.db")
+    worker_a = SQLiteRevocationStore(path, refresh_interval_s=0)
+    worker_b = SQLiteRevocationStore(path, refresh_interval_s=0)
+
+    worker_a.add("HCT:shared", _future_ms())
+    assert worker_b.contains("HCT:shared") is True
+    assert worker_b.contains("HCT:unknown") is False
+
+    worker_a.close()
+    worker_b.close()
+    reopened = SQLiteRevocationStore(path)
+    assert reopened.contains("HCT:shared") is True
+    reopened.close()
+
+
+def test_sqlite_store_garbage_collects_expired(tmp_path):
+    store = SQLiteRevocationStore(str(tmp_path / "revocations.db"), gc_interval_s=3600)
+    store.add("HCT:old", int(time.time() * 1000) - 1000)
+    store.add("HCT:new", _future_ms())
+    assert store.contains("HCT:old") is False
+
+    assert store.purge_expired() == 1
+    assert len(store) == 1
+    assert store.contains("HCT:new") is True
+    store.close()
+
+
+def test_sqlite_store_collects_automatically(tmp_path):
+    store = SQLiteRevocationStore(str(tmp_path / "revocations.db"), gc_interval_s=0)
+    store.add("HCT:old", int(time.time() * 1000) - 1000)
+    store.add("HCT:new", _future_ms())
+
+    assert len(store) == 1
+    store.close()
+
+
+def test_revoke_token_uses_configured_store(tmp_path):
+    store = SQLiteRevocationStore(str(tmp_path / "revocations.db"))
+    set_revocation_store(store)
+    try:
+        token_obj = issue_token(USER_ID, AGENT_ID, SCOPE)
+        assert validate_token(token_obj.token, SCOPE)[0] is True
+
+        revoke_token(token_obj.token)
+        assert is_token_revoked(token_obj.token) is True
+        assert validate_token(token_obj.token, SCOPE) == (False, "Token has been revoked", None)
+        assert len(store) == 1
+    finally:
+        set_revocation_store(InMemoryRevocationStore())
+        store.close()
@@ -0,0 +1,130 @@
+# tests/test_schedule_scorer.py
+
+import pytest
+from unittest.mock import patch
+from hushh_mcp.consent.token import issue_token
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.operons.schedule_scorer import parse_duration_minutes
+from hushh_mcp.operons.suggest_schedule import suggest_optimal_schedule
+
+
+USER_ID = "user_schedule"
+AGENT_ID = "calendar_agent"
+MONDAY = {"timeMin": "2025-07-28T00:00:00Z", "timeMax": "2025-07-29T00:00:00Z"}
+
+
+def at(hour, minute=0):
+    return f"2025-07-28T{hour:02d}:{minute:02d}:00Z"
+
+
+def freebusy(*busy):
+    return {**MONDAY, "calendars": {"primary": {"busy": [{"start": at(*s), "end": at(*e)} for s, e in busy]}}}
+
+
+@pytest.fixture
+def token():
+    return issue_token(USER_ID, AGENT_ID, ConsentScope.AGENT_GCAL_READ).token
+
+
+@pytest.fixture
+def llm():
+    with patch("hushh_mcp.operons.suggest_schedule.gemini_chat") as chat:
+        yield chat
+
+
+def suggest(token, free_busy, **preferences):
+    return suggest_optimal_schedule(USER_ID, token, free_busy, preferences)
+
+
+def test_parse_duration():
+    assert [parse_duration_minutes(v) for v in (45, "45", "45m", "1h", "1.5h", "1h30m")] == [45, 45, 45, 60, 90, 90]
+    spelled = ("30 minutes", "2 hours", "1 hr", "1 hour 15 mins", "90 min")
+    assert [parse_duration_minutes(v) for v in spelled] == [30, 120, 60, 75, 90]
+    with pytest.raises(ValueError):
+        parse_duration_minutes("soon")
+
+
+def test_preferred_hours_win(token, llm):
+    result = suggest(token, freebusy(), duration="1h", preferred_hours="14:00-16:00")
+    assert result["suggested_time"] == at(14)
+    assert result["end_time"] == at(15)
+    assert result["source"] == "local"
+    assert "within preferred hours" in result["reason"]
+    assert len(result["alternatives"]) == 2
+    llm.assert_not_called()
+
+
+def test_do_not_disturb_is_never_offered_and_focus_is_avoided(token, llm):
+    result = suggest(token, freebusy(), duration_minutes=60, do_not_disturb="09:00-12:00",
+                     focus_blocks=["12:00-13:00", {"start": at(13), "end": at(14)}])
+    assert result["suggested_time"] == at(14)
+    for option in [result, *result["alternatives"]]:
+        assert option["suggested_time"] >= at(12)
+
+
+def test_buffers_and_fragmentation_shape_the_pick(token, llm):
+    # Only 10:00-11:00 is free
+    result = suggest(token, freebusy(((9,), (10,)), ((11,), (17,))),
+                     duration="30m", buffer_minutes=10, min_slot_minutes=30)
+    assert result["suggested_time"] == at(10, 15)
+
+
+def test_accepts_free_slot_lists_and_detect_results(token, llm):
+    slots = [{"start": at(15), "end": at(17)}, {"start": at(9), "end": at(10)}]
+    assert suggest(token, slots, duration="2h")["suggested_time"] == at(15)
+    detect_result = {"free_busy": freebusy(), "free_slots": slots, "source": "local"}
+    assert suggest(token, detect_result, duration="1h", buffer_minutes=0)["suggested_time"] == at(9)
+
+
+def test_spelled_out_durations_are_scheduled(token, llm):
+    for duration in ("30 minutes", "2 hours", "1 hr"):
+        assert suggest(token, freebusy(), duration=duration)["source"] == "local"
+    llm.assert_not_called()
+
+
+def test_unreadable_duration_goes_to_the_llm_or_finds_no_slot(token, llm):
+    result = suggest_optimal_schedule(USER_ID, token, freebusy(), {"duration": "half an hour"}, llm="never")
+    assert result["suggested_time"] is None and "half an hour" in result["reason"]
+    llm.assert_not_called()
+
+    llm.return_value = '{"suggested_time": "2025-07-28T09:00:00Z", "reason": "Morning is open"}'
+    result = suggest_optimal_schedule(USER_ID, token, freebusy(), {"duration": "half an hour"}, llm="fallback")
+    assert result["suggested_time"] == at(9) and result["source"] == "llm"
+
+
+def test_free_slot_list_edges_border_meetings(token, llm):
+    # The slot list only says 10:00-12:00 is free: a meeting at 10:00 sits flush against whatever ends then
+    slots = [{"start": at(10), "end": at(12)}]
+    result = suggest(token, slots, duration="1h", buffer_minutes=10, step_minutes=60)
+    assert result["suggested_time"] == at(10)
+    assert result["score"] < 1.0 and "with a reduced buffer" in result["reason"]
+
+    # A slot edge on the 09:00 working-hours opening still needs no buffer
+    result = suggest(token, [{"start": at(9), "end": at(10, 10)}], duration="1h", buffer_minutes=10, step_minutes=60)
+    assert "with buffers before and after" in result["reason"]
+
+
+def test_timezone_applies_to_daily_ranges(token, llm):
+    result = suggest(token, freebusy(), duration="1h", timezone="Asia/Kolkata",
+                     working_hours=None, preferred_hours="16:00-18:00")
+    assert result["suggested_time"] == "2025-07-28T16:00:00+05:30"
+
+
+def test_llm_is_only_a_fallback(token, llm):
+    full_day = freebusy(((0,), (23, 59)))
+    result = suggest_optimal_schedule(USER_ID, token, full_day, {"duration": "1h"}, llm="never")
+    assert result["suggested_time"] is None
+    llm.assert_not_called()
+
+    llm.return_value = '{"suggested_time": "2025-07-29T09:00:00Z", "reason": "Tomorrow morning is open"}'
+    result = suggest_optimal_schedule(USER_ID, token, full_day, {"duration": "1h"}, llm="fallback")
+    assert result == {"suggested_time": "2025-07-29T09:00:00Z", "reason": "Tomorrow morning is open", "source": "llm"}
+
+
+def test_llm_can_explain_the_local_pick(token, llm):
+    llm.return_value = "Early afternoon keeps your morning free."
+    result = suggest_optimal_schedule(USER_ID, token, freebusy(), {"duration": "1h", "preferred_hours": "13:00-15:00"},
+                                      llm="explain")
+    assert result["suggested_time"] == at(13)
+    assert result["reason"] == "Early afternoon keeps your morning free."
+    assert at(13) in llm.call_args[0][0]
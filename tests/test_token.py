@@ -4,9 +4,13 @@ import pytest
 import time
 from hushh_mcp.consent.token import (
     issue_token,
+    issue_tokens,
     validate_token,
+    validate_tokens,
     revoke_token,
-    is_token_revoked
+    is_token_revoked,
+    get_token_cache_stats,
+    clear_token_cache
 )
 from hushh_mcp.constants import ConsentScope
 from hushh_mcp.types import HushhConsentToken
@@ -58,3 +62,158 @@ def test_signature_tampering():
     valid, reason, _ = validate_token(tampered, VALID_SCOPE)
     assert valid is False
     assert "Malformed token" in reason or "Invalid token prefix" in reason
+
+
+def test_validation_cache_hit_and_scope_check():
+    clear_token_cache()
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE)
+
+    assert validate_token(token_obj.token, VALID_SCOPE)[0] is True
+    assert get_token_cache_stats()["misses"] == 1
+
+    valid, _, parsed = validate_token(token_obj.token, VALID_SCOPE)
+    assert valid is True
+    assert parsed.user_id == USER_ID
+    assert get_token_cache_stats()["hits"] == 1
+
+    valid, reason, _ = validate_token(token_obj.token, ConsentScope.VAULT_READ_PHONE)
+    assert valid is False
+    assert reason == "Scope mismatch"
+
+
+def test_revocation_evicts_cached_token():
+    clear_token_cache()
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE)
+    assert validate_token(token_obj.token, VALID_SCOPE)[0] is True
+    assert get_token_cache_stats()["size"] == 1
+
+    revoke_token(token_obj.token)
+    assert get_token_cache_stats()["size"] == 0
+
+    valid, reason, _ = validate_token(token_obj.token, VALID_SCOPE)
+    assert valid is False
+    assert reason == "Token has been revoked"
+
+
+def test_cached_token_still_expires():
+    clear_token_cache()
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, expires_in_ms=50)
+    assert validate_token(token_obj.token, VALID_SCOPE)[0] is True
+
+    time.sleep(0.1)
+    valid, reason, _ = validate_token(token_obj.token, VALID_SCOPE)
+    assert valid is False
+    assert reason == "Token expired"
+    assert get_token_cache_stats()["size"] == 0
+
+
+def test_batch_issue_and_validate():
+    grants = [(f"user_{i}", AGENT_ID, VALID_SCOPE) for i in range(5)]
+    tokens = issue_tokens(grants)
+    assert [t.user_id for t in tokens] == [g[0] for g in grants]
+    assert len({t.issued_at for t in tokens}) == 1
+
+    revoke_token(tokens[1].token)
+    results = validate_tokens([t.token for t in tokens] + ["HCT:garbage"], VALID_SCOPE)
+
+    assert len(results) == 6
+    assert results[0][0] is True and results[0][2].user_id == "user_0"
+    assert results[1] == (False, "Token has been revoked", None)
+    assert all(r[0] for r in results[2:5])
+    assert results[5][0] is False and "Malformed token" in results[5][1]
+
+
+def test_batch_matches_single_validation():
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE)
+    batch = validate_tokens([token_obj.token], ConsentScope.VAULT_READ_PHONE)
+    assert batch == [validate_token(token_obj.token, ConsentScope.VAULT_READ_PHONE)]
+
+
+def test_compact_token_roundtrip():
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=2)
+    assert token_obj.token.startswith("HCT2:")
+    assert len(token_obj.token) < len(issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=1).token)
+
+    valid, reason, parsed = validate_token(token_obj.token, VALID_SCOPE)
+    assert valid is True
+    assert reason is None
+    assert parsed.user_id == USER_ID
+    assert parsed.agent_id == AGENT_ID
+    assert parsed.scope == VALID_SCOPE
+    assert parsed.expires_at == token_obj.expires_at
+
+
+def test_compact_token_with_unknown_agent_and_checks():
+    token_obj = issue_token(USER_ID, "agent_custom_bot", VALID_SCOPE, version=2)
+    valid, _, parsed = validate_token(token_obj.token)
+    assert valid is True
+    assert parsed.agent_id == "agent_custom_bot"
+
+    valid, reason, _ = validate_token(token_obj.token, ConsentScope.VAULT_READ_PHONE)
+    assert reason == "Scope mismatch"
+
+    expired = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, expires_in_ms=-1000, version=2)
+    assert validate_token(expired.token, VALID_SCOPE)[1] == "Token expired"
+
+
+def test_compact_token_tampering():
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=2)
+    flipped = "A" if token_obj.token[12] != "A" else "B"
+    tampered = token_obj.token[:12] + flipped + token_obj.token[13:]
+
+    valid, reason, _ = validate_token(tampered, VALID_SCOPE)
+    assert valid is False
+    assert reason == "Invalid signature" or "Malformed token" in reason
+
+    valid, reason, _ = validate_token("HCT2:AAAA", VALID_SCOPE)
+    assert valid is False
+    assert "Malformed token" in reason
+
+
+def test_compact_token_rejects_unreleased_layouts():
+    from hushh_mcp.consent import compact
+    body = compact.decode(issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=2).token)[0]
+    for version in (2, 3):
+        with pytest.raises(ValueError, match="unsupported token version"):
+            compact.unpack_body(bytes([version]) + body[1:])
+
+
+def test_compact_token_revocation():
+    token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=2)
+    revoke_token(token_obj.token)
+    assert validate_token(token_obj.token, VALID_SCOPE) == (False, "Token has been revoked", None)
+
+
+def test_multi_scope_token_checks_all_required_scopes():
+    scopes = [ConsentScope.AGENT_GCAL_READ, ConsentScope.AGENT_GCAL_WRITE]
+    token_obj = issue_token(USER_ID, AGENT_ID, scopes)
+    assert token_obj.token.startswith("HCT2:")
+    assert set(token_obj.scopes) == set(scopes)
+
+    valid, reason, parsed = validate_token(token_obj.token, required_scopes=scopes)
+    assert valid is True
+    assert set(parsed.scopes) == set(scopes)
+
+    # A single granted scope still satisfies expected_scope
+    assert validate_token(token_obj.token, ConsentScope.AGENT_GCAL_WRITE)[0] is True
+
+    valid, reason, _ = validate_token(
+        token_obj.token,
+        required_scopes=[ConsentScope.AGENT_GCAL_READ, ConsentScope.VAULT_READ_PHONE]
+    )
+    assert valid is False
+    assert reason == "Scope mismatch"
+
+
+def test_required_scopes_on_single_scope_tokens():
+    for version in (1, 2):
+        token_obj = issue_token(USER_ID, AGENT_ID, VALID_SCOPE, version=version)
+        assert token_obj.scopes == [VALID_SCOPE]
+        assert validate_token(token_obj.token, required_scopes=[VALID_SCOPE])[0] is True
+
+        valid, reason, _ = validate_token(
+            token_obj.token,
+            required_scopes=[VALID_SCOPE, ConsentScope.AGENT_GCAL_READ]
+        )
+        assert valid is False
+        assert reason == "Scope mismatch"
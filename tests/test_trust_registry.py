@@ -0,0 +1,78 @@
+# tests/test_trust_registry.py
+
+import time
+from hushh_mcp.trust.link import create_trust_link
+from hushh_mcp.trust.registry import TrustLinkRegistry
+from hushh_mcp.constants import ConsentScope
+
+
+USER_ID = "user_nyx"
+OTHER_USER = "user_eve"
+IDENTITY = "agent_identity"
+SHOPPER = "agent_shopper"
+COURIER = "agent_courier"
+SCOPE = ConsentScope.VAULT_READ_EMAIL
+
+
+def test_direct_link_is_trusted():
+    registry = TrustLinkRegistry()
+    link = create_trust_link(IDENTITY, SHOPPER, SCOPE, USER_ID)
+    assert registry.add(link) is True
+
+    assert registry.is_trusted(SHOPPER, USER_ID, SCOPE) is True
+    assert registry.is_trusted(SHOPPER, OTHER_USER, SCOPE) is False
+    assert registry.is_trusted(SHOPPER, USER_ID, ConsentScope.VAULT_READ_PHONE) is False
+    assert registry.links_to(SHOPPER, USER_ID, SCOPE) == [link]
+
+
+def test_tampered_link_is_rejected_even_after_caching():
+    registry = TrustLinkRegistry()
+    link = create_trust_link(IDENTITY, SHOPPER, SCOPE, USER_ID)
+    assert registry.verify(link) is True
+
+    # Same signature, different delegatee: must not ride on the cached verification
+    forged = link.model_copy(update={"to_agent": COURIER})
+    assert registry.add(forged) is False
+    assert registry.is_trusted(COURIER, USER_ID, SCOPE) is False
+
+
+def test_delegation_chain_from_root():
+    registry = TrustLinkRegistry(root_agents=[IDENTITY], max_depth=2)
+    first = create_trust_link(IDENTITY, SHOPPER, SCOPE, USER_ID)
+    second = create_trust_link(SHOPPER, COURIER, SCOPE, USER_ID)
+    registry.add_many([first, second])
+
+    chain = registry.resolve_chain(COURIER, USER_ID, SCOPE)
+    assert [link.from_agent for link in chain] == [IDENTITY, SHOPPER]
+    assert registry.is_trusted(COURIER, USER_ID, SCOPE) is True
+
+    # One hop is not enough to reach the root
+    assert registry.resolve_chain(COURIER, USER_ID, SCOPE, max_depth=1) is None
+
+
+def test_chain_without_root_is_not_trusted():
+    registry = TrustLinkRegistry(root_agents=[IDENTITY])
+    registry.add(create_trust_link(SHOPPER, COURIER, SCOPE, USER_ID))
+    assert registry.is_trusted(COURIER, USER_ID, SCOPE) is False
+
+
+def test_delegation_cycle_terminates():
+    registry = TrustLinkRegistry(root_agents=[IDENTITY], max_depth=10)
+    registry.add_many([
+        create_trust_link(SHOPPER, COURIER, SCOPE, USER_ID),
+        create_trust_link(COURIER, SHOPPER, SCOPE, USER_ID),
+    ])
+    assert registry.is_trusted(COURIER, USER_ID, SCOPE) is False
+
+
+def test_expired_links_are_evicted():
+    registry = TrustLinkRegistry()
+    assert registry.add(create_trust_link(IDENTITY, SHOPPER, SCOPE, USER_ID, expires_in_ms=-1000)) is False
+
+    short = create_trust_link(IDENTITY, SHOPPER, SCOPE, USER_ID, expires_in_ms=50)
+    assert registry.add(short) is True
+    assert len(registry) == 1
+
+    time.sleep(0.1)
+    assert registry.is_trusted(SHOPPER, USER_ID, SCOPE) is False
+    assert len(registry) == 0
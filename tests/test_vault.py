@@ -3,7 +3,7 @@
 import pytest
 import json
 import base64
-from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
+from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data, VaultCipher, IV_LENGTH, TAG_LENGTH
 from hushh_mcp.config import VAULT_ENCRYPTION_KEY
 from hushh_mcp.types import EncryptedPayload
 
@@ -47,3 +47,42 @@ def test_decryption_fails_with_tampered_data():
 
     with pytest.raises(Exception, match="Decryption failed"):
         decrypt_data(corrupted, VAULT_ENCRYPTION_KEY)
+
+
+def test_vault_cipher_bytes_roundtrip():
+    cipher = VaultCipher(VAULT_ENCRYPTION_KEY)
+    data = bytearray(b"calendar-blob" * 100)
+
+    blob = cipher.encrypt_bytes(memoryview(data))
+    assert len(blob) == IV_LENGTH + len(data) + TAG_LENGTH
+    assert cipher.decrypt_bytes(memoryview(blob)) == bytes(data)
+
+
+def test_vault_cipher_interoperates_with_string_api():
+    encrypted = encrypt_data("hello vault", VAULT_ENCRYPTION_KEY)
+    blob = (
+        base64.b64decode(encrypted.iv)
+        + base64.b64decode(encrypted.ciphertext)
+        + base64.b64decode(encrypted.tag)
+    )
+    assert VaultCipher(VAULT_ENCRYPTION_KEY).decrypt_bytes(blob) == b"hello vault"
+
+
+def test_vault_cipher_rejects_tampering():
+    cipher = VaultCipher(VAULT_ENCRYPTION_KEY)
+    blob = bytearray(cipher.encrypt_bytes(b"secret"))
+    blob[-1] ^= 0x01
+
+    with pytest.raises(ValueError, match="Invalid authentication tag"):
+        cipher.decrypt_bytes(blob)
+
+
+def test_chacha20_payload_roundtrip():
+    encrypted = encrypt_data("offline calendar", VAULT_ENCRYPTION_KEY, algorithm="chacha20-poly1305")
+    assert encrypted.algorithm == "chacha20-poly1305"
+    assert decrypt_data(encrypted, VAULT_ENCRYPTION_KEY) == "offline calendar"
+
+    # The recorded algorithm drives decryption: relabelling the payload must fail
+    relabelled = encrypted.model_copy(update={"algorithm": "aes-256-gcm"})
+    with pytest.raises(ValueError, match="Invalid authentication tag"):
+        decrypt_data(relabelled, VAULT_ENCRYPTION_KEY)
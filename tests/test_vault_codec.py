@@ -0,0 +1,82 @@
+# tests/test_vault_codec.py
+
+import datetime
+import time
+import pytest
+from hushh_mcp.agents.calendar_agent.state.memory import CalendarMemoryManager, MEMORY_SCOPE
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.types import VaultKey, VaultRecord
+from hushh_mcp.vault.codec import encode_value, decode_value
+from hushh_mcp.vault.encrypt import encrypt_data
+from hushh_mcp.vault.store import VaultStore
+
+
+EVENTS = {
+    "items": [
+        {"id": f"evt_{i}", "summary": "Team sync", "start": {"dateTime": "2025-07-28T10:00:00Z"}, "attendees": []}
+        for i in range(50)
+    ]
+}
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgpack"])
+@pytest.mark.parametrize("compression", ["none", "zlib", "zstd"])
+def test_roundtrip_for_every_format(codec, compression):
+    tag, data = encode_value(EVENTS, codec=codec, compression=compression, min_compress_bytes=0)
+    assert tag.startswith(codec)
+    assert tag.endswith(compression) or compression == "none"
+    assert decode_value(data, tag) == EVENTS
+
+
+def test_small_values_are_not_compressed():
+    tag, _ = encode_value({"a": 1}, codec="orjson", compression="zstd", min_compress_bytes=1024)
+    assert tag == "orjson"
+
+
+def test_unknown_format_names_are_rejected():
+    with pytest.raises(ValueError, match="codec"):
+        encode_value(EVENTS, codec="ojson")
+    with pytest.raises(ValueError, match="compression"):
+        encode_value(EVENTS, compression="zsdt", min_compress_bytes=0)
+
+
+def test_missing_optional_library_falls_back(monkeypatch):
+    from hushh_mcp.vault import codec
+    monkeypatch.delitem(codec._CODECS, "msgpack")
+    monkeypatch.delitem(codec._COMPRESSORS, "zstd")
+    tag, data = encode_value(EVENTS, codec="msgpack", compression="zstd", min_compress_bytes=0)
+    assert tag == "orjson+zlib"
+    assert decode_value(data, tag) == EVENTS
+
+
+def test_datetimes_are_stored_as_iso_strings():
+    when = datetime.datetime(2025, 7, 28, 10, 0, tzinfo=datetime.timezone.utc)
+    for codec in ["json", "orjson", "msgpack"]:
+        tag, data = encode_value({"start": when}, codec=codec, compression="none")
+        assert decode_value(data, tag)["start"].startswith("2025-07-28T10:00:00")
+
+
+def test_legacy_values_are_parsed_without_eval():
+    assert decode_value(str(EVENTS).encode(), None) == EVENTS
+    # Code is never executed; unparseable text comes back as-is
+    assert decode_value(b"__import__('os').getcwd()", None) == "__import__('os').getcwd()"
+
+
+def test_memory_reads_legacy_records_from_the_vault(tmp_path):
+    store = VaultStore(str(tmp_path / "vault.db"), compaction_interval_s=0)
+    store.put(VaultRecord(
+        key=VaultKey(user_id="user_legacy", scope=MEMORY_SCOPE),
+        data=encrypt_data(str(EVENTS), VAULT_ENCRYPTION_KEY),
+        agent_id="calendar_agent",
+        created_at=int(time.time() * 1000)
+    ), name="last_synced_events")
+
+    manager = CalendarMemoryManager(store=store)
+    memory = manager.memory_for("user_legacy")
+    assert memory.load_context("last_synced_events") == EVENTS
+
+    # Rewritten entries carry their format tag
+    memory.save_context("last_synced_events", EVENTS)
+    record = store.get(VaultKey(user_id="user_legacy", scope=MEMORY_SCOPE), name="last_synced_events")
+    store.close()
+    assert record.metadata["codec"]
@@ -0,0 +1,106 @@
+# tests/test_vault_store.py
+
+import time
+import pytest
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.constants import ConsentScope
+from hushh_mcp.types import VaultKey, VaultRecord
+from hushh_mcp.vault import VaultStore, set_vault_store, store_consent, load_consent
+from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
+
+
+USER_ID = "user_vault"
+AGENT_ID = "calendar_agent"
+SCOPE = ConsentScope.VAULT_READ_CALENDAR
+
+
+def _record(text: str, user_id: str = USER_ID, expires_at: int = None) -> VaultRecord:
+    now = int(time.time() * 1000)
+    return VaultRecord(
+        key=VaultKey(user_id=user_id, scope=SCOPE),
+        data=encrypt_data(text, VAULT_ENCRYPTION_KEY),
+        agent_id=AGENT_ID,
+        created_at=now,
+        expires_at=expires_at,
+        metadata={"source": "test"}
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VaultStore(str(tmp_path / "vault.db"), compaction_interval_s=0)
+    yield store
+    store.close()
+
+
+def test_put_get_roundtrip_survives_reopen(tmp_path):
+    path = str(tmp_path / "vault.db")
+    store = VaultStore(path, compaction_interval_s=0)
+    store.put(_record("standup at 9"), name="context:today")
+    store.close()
+
+    reopened = VaultStore(path, compaction_interval_s=0)
+    record = reopened.get(VaultKey(user_id=USER_ID, scope=SCOPE), name="context:today")
+    reopened.close()
+
+    assert record.metadata == {"source": "test"}
+    assert decrypt_data(record.data, VAULT_ENCRYPTION_KEY) == "standup at 9"
+
+
+def test_put_many_and_indexed_queries(store):
+    batch = [(f"event_{i}", _record(f"event {i}", user_id=f"user_{i % 2}")) for i in range(10)]
+    assert store.put_many(batch) == 10
+
+    assert len(store.query(user_id="user_0", scope=SCOPE)) == 5
+    assert len(store.query(agent_id=AGENT_ID)) == 10
+    assert store.query(agent_id="agent_other") == []
+
+    # Writing the same name again replaces rather than duplicates
+    store.put(_record("moved"), name="event_0")
+    assert len(store) == 11
+
+
+def test_soft_delete_hides_record_until_compaction(store):
+    key = VaultKey(user_id=USER_ID, scope=SCOPE)
+    store.put(_record("secret"), name="a")
+
+    assert store.delete(key, name="a")
+    assert not store.delete(key, name="a")
+    assert store.get(key, name="a") is None
+    assert len(store.query(user_id=USER_ID, include_deleted=True)) == 1
+
+    assert store.compact() == 1
+    assert store.query(user_id=USER_ID, include_deleted=True) == []
+
+
+def test_expired_records_are_hidden_and_compacted(store):
+    past = int(time.time() * 1000) - 1000
+    store.put(_record("stale", expires_at=past), name="old")
+    store.put(_record("fresh"), name="new")
+
+    assert [name for name, _ in store.query(user_id=USER_ID)] == ["new"]
+    assert store.compact() == 1
+    assert len(store) == 1
+
+
+def test_background_compaction(tmp_path):
+    store = VaultStore(str(tmp_path / "vault.db"), compaction_interval_s=0.05)
+    store.put(_record("stale", expires_at=int(time.time() * 1000) - 1), name="old")
+
+    deadline = time.time() + 2
+    while store.query(include_deleted=True) and time.time() < deadline:
+        time.sleep(0.02)
+    store.close()
+    assert time.time() < deadline
+
+
+def test_store_consent_persists_encrypted_json(store):
+    set_vault_store(store)
+    try:
+        store_consent("/vault/scheduling_action_user_vault", {"slot": "10:00", "accepted": True})
+        assert load_consent("/vault/scheduling_action_user_vault") == {"slot": "10:00", "accepted": True}
+    finally:
+        set_vault_store(None)
+
+    _, record = store.query(user_id="system")[0]
+    assert "10:00" not in record.data.ciphertext
@@ -0,0 +1,81 @@
+# tests/test_vault_stream.py
+
+import io
+import os
+import struct
+import pytest
+from hushh_mcp.vault.stream import MAX_CHUNK_SIZE, encrypt_stream, decrypt_stream, iter_encrypt, iter_decrypt
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+
+
+CHUNK_SIZE = 1024
+PAYLOAD = os.urandom(CHUNK_SIZE * 5 + 123)
+
+
+def _encrypt(payload: bytes) -> bytes:
+    sink = io.BytesIO()
+    encrypt_stream(io.BytesIO(payload), sink, VAULT_ENCRYPTION_KEY, chunk_size=CHUNK_SIZE)
+    return sink.getvalue()
+
+
+def _decrypt(blob: bytes) -> bytes:
+    sink = io.BytesIO()
+    decrypt_stream(io.BytesIO(blob), sink, VAULT_ENCRYPTION_KEY)
+    return sink.getvalue()
+
+
+def test_stream_roundtrip_file_objects():
+    assert _decrypt(_encrypt(PAYLOAD)) == PAYLOAD
+
+
+def test_stream_roundtrip_iterators():
+    pieces = [PAYLOAD[i:i + 700] for i in range(0, len(PAYLOAD), 700)]
+    frames = list(iter_encrypt(pieces, VAULT_ENCRYPTION_KEY, chunk_size=CHUNK_SIZE))
+    chunks = list(iter_decrypt(frames, VAULT_ENCRYPTION_KEY))
+
+    assert b"".join(chunks) == PAYLOAD
+    assert all(len(chunk) == CHUNK_SIZE for chunk in chunks[:-1])
+
+
+def test_empty_stream_roundtrip():
+    assert _decrypt(_encrypt(b"")) == b""
+
+
+def test_stream_detects_tampering():
+    blob = bytearray(_encrypt(PAYLOAD))
+    blob[len(blob) // 2] ^= 0x01
+    with pytest.raises(ValueError, match="Invalid authentication tag"):
+        _decrypt(bytes(blob))
+
+
+def test_stream_detects_truncation():
+    blob = _encrypt(PAYLOAD)
+    last_frame = 5 + 123 + 16
+    with pytest.raises(ValueError, match="truncated"):
+        _decrypt(blob[:-last_frame])
+
+
+def test_stream_rejects_oversized_chunk_size_before_reading():
+    class Source(io.BytesIO):
+        reads = 0
+
+        def read(self, size=-1):
+            Source.reads += 1
+            return super().read(size)
+
+    blob = bytearray(_encrypt(PAYLOAD))
+    blob[5:9] = struct.pack(">I", MAX_CHUNK_SIZE + 1)
+    with pytest.raises(ValueError, match="chunk size"):
+        next(iter_decrypt(Source(bytes(blob)), VAULT_ENCRYPTION_KEY))
+    assert Source.reads == 1
+
+
+def test_stream_rejects_wrong_key():
+    with pytest.raises(ValueError, match="Invalid authentication tag"):
+        decrypt_stream(io.BytesIO(_encrypt(PAYLOAD)), io.BytesIO(), "9f" * 32)
+
+
+def test_chacha20_stream_roundtrip():
+    sink = io.BytesIO()
+    encrypt_stream(io.BytesIO(PAYLOAD), sink, VAULT_ENCRYPTION_KEY, chunk_size=CHUNK_SIZE, algorithm="chacha20-poly1305")
+    assert _decrypt(sink.getvalue()) == PAYLOAD